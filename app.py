@@ -1,14 +1,10 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, send_file, Response
 import json
-import csv
 import io
+import os
 import numpy as np
-import base64
+import tempfile
 import pandas as pd
-# Matplotlib non-interactive backend
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 
 # Import modul matriks
 from matriks.matrix import Matrix
@@ -17,82 +13,82 @@ from matriks.operations.multiplier import multiply_matrices
 from matriks.operations.transpose import transpose
 from matriks.operations.inverse import inverse
 from matriks.statistic.regression import (
-    regresi_linier, prediksi, evaluasi
+    regresi_linier_detail, prediksi, evaluasi, pisah_xy
 )
+from matriks.statistic.resampling import cross_validate
+from matriks.statistic.streaming_regression import StreamingOLS, DEFAULT_CHUNK_SIZE
+from matriks.statistic.correlation import correlation_matrix
+from matriks.statistic.correlation_visualization import MAX_CELLS, ANNOTATE_LIMIT
 from matriks.utilities.formatter import format_matrix_for_html
+from matriks.importers.binary_importer import decode_matrix, is_binary_matrix
+from matriks.importers.tokenizer import parse_numeric, convert_rows, iter_fields, WHITESPACE
+from matriks.exporters.binary_exporter import encode_matrix, NPY_MIMETYPE, MTRX_MIMETYPE
+from matriks.services.cache import ResultCache, make_key
+from matriks.services.model_registry import ModelRegistry
+from matriks.services.plot_renderer import PlotService
+from matriks.services.matrix_store import MatrixStore, StoreFull
+from matriks.services.pipeline import Pipeline
+from matriks.services.jobs import JobQueue, QueueFull, inline_cost, DONE, FAILED, CANCELLED
 
 app = Flask(__name__)
+result_cache = ResultCache()
+model_registry = ModelRegistry()
+job_queue = JobQueue()
+plot_service = PlotService()
+matrix_store = MatrixStore()
 
 # ================================
 # Helper: membaca konten CSV/Manual/JSON dari request
 # ================================
-def get_matrix_from_request(req_data, key="matrix_a"):
-    source = (req_data.get(f'{key}_source') or '').lower()
-    content = req_data.get(f'{key}_content', '')
+BINARY_MIMETYPES = {NPY_MIMETYPE: "npy", MTRX_MIMETYPE: "mtrx", "application/octet-stream": "npy"}
 
-    # Jika file upload (HTML form multipart)
-    if 'file' in request.files:
-        file = request.files['file']
-        if file and file.filename:
-            content = file.read().decode('utf-8')
-            source = 'csv'
 
-    content = content.strip()
-    if not content:
-        raise ValueError(f"Konten Matriks ({key}) tidak boleh kosong.")
+def request_params():
+    """Parameter request dari form, JSON atau query string (body biner → query saja)."""
+    if request.form:
+        return request.form.to_dict()
+    if request.is_json:
+        return request.get_json(silent=True) or {}
+    return request.args.to_dict()
 
-    # MANUAL
-    if source == 'manual':
-        lines = [line.strip() for line in content.splitlines() if line.strip()]
-        data = []
-        for line in lines:
-            line = line.replace(',', ' ')
-            parts = [p for p in line.split() if p]
-            try:
-                data.append([float(p) for p in parts])
-            except ValueError:
-                raise ValueError(f"Format angka salah di baris: '{line}'")
-        if len({len(r) for r in data}) != 1:
-            raise ValueError("Semua baris harus memiliki jumlah kolom sama.")
-        return Matrix(data)
-
-    # CSV
-    elif source == 'csv':
-        f = io.StringIO(content)
-        reader = csv.reader(f)
-        rows = [row for row in reader if any(cell.strip() for cell in row)]
-        if not rows:
-            raise ValueError("CSV kosong atau tidak valid.")
-
-        first = rows[0]
-        header = None
-        numeric_first_row = True
-        try:
-            [float(x) for x in first]
-        except Exception:
-            numeric_first_row = False
 
-        if numeric_first_row:
-            numeric_rows = rows
-        else:
-            header = [h.strip() for h in first]
-            numeric_rows = rows[1:]
+def get_matrix_from_request(req_data, key="matrix_a"):
+    # Handle dari /api/matrices: operand sudah di-parse dan tersimpan di server
+    handle = req_data.get(f'{key}_handle')
+    if handle is None and (req_data.get(f'{key}_source') or '').lower() == 'handle':
+        handle = (req_data.get(f'{key}_content') or '').strip()
+    if handle:
+        try:
+            return matrix_store.get(handle)
+        except KeyError as e:
+            raise ValueError(e.args[0])
+    # Biner (.npy / MTRX): body mentah untuk operand pertama, atau file
+    # multipart bernama sesuai operand — disalin sekali ke buffer Matrix
+    if key == "matrix_a" and request.mimetype in BINARY_MIMETYPES:
+        return decode_matrix(request.get_data(cache=True))
+    upload = request.files.get(key)
+    if upload is None and 'file' in request.files and request.files['file'].filename:
+        upload = request.files['file']  # form HTML lama: satu file untuk operand
+    if upload is not None:
+        head = upload.stream.read(8)
+        upload.stream.seek(0)
+        if is_binary_matrix(head):
+            return decode_matrix(upload.stream.read())
+        # CSV dibaca langsung dari stream upload per blok
+        return parse_numeric(upload.stream)
 
-        data = []
-        for r in numeric_rows:
-            try:
-                row = [float(x) for x in r if x.strip() != ""]
-                data.append(row)
-            except ValueError:
-                raise ValueError("CSV berisi nilai non-numerik pada baris data.")
+    source = (req_data.get(f'{key}_source') or '').lower()
+    content = (req_data.get(f'{key}_content') or '').strip()
+    if not content:
+        raise ValueError(f"Konten Matriks ({key}) tidak boleh kosong.")
 
-        if len({len(r) for r in data}) != 1:
-            raise ValueError("Semua baris CSV harus punya jumlah kolom sama.")
+    # MANUAL: elemen dipisah spasi dan/atau koma, tanpa header
+    if source == 'manual':
+        return parse_numeric(content.replace(',', ' '), delimiter=WHITESPACE, header=False)
 
-        m = Matrix(data)
-        if header:
-            setattr(m, 'header', header)
-        return m
+    # CSV: delimiter dan header dideteksi otomatis
+    elif source == 'csv':
+        return parse_numeric(content)
 
     # JSON
     elif source == 'json':
@@ -101,13 +97,12 @@ def get_matrix_from_request(req_data, key="matrix_a"):
         except Exception:
             raise ValueError("JSON tidak valid.")
         if isinstance(parsed, dict) and 'data' in parsed:
-            data = parsed['data']
-            m = Matrix([[float(x) for x in row] for row in data])
+            m = convert_rows(parsed['data'])
             if 'header' in parsed:
                 setattr(m, 'header', parsed['header'])
             return m
         elif isinstance(parsed, list):
-            return Matrix([[float(x) for x in row] for row in parsed])
+            return convert_rows(parsed)
         else:
             raise ValueError("Format JSON tidak dikenali.")
     else:
@@ -117,16 +112,165 @@ def get_matrix_from_request(req_data, key="matrix_a"):
 # ================================
 # Convert Matrix ke JSON
 # ================================
-def matrix_to_json_response(matrix):
+def matrix_to_json_response(matrix, html=True):
+    data = matrix.tolist()
     return {
         "header": getattr(matrix, 'header', [f"X{i+1}" for i in range(matrix.cols)]),
-        "data": matrix.data,
+        "data": data,
         "rows": matrix.rows,
         "cols": matrix.cols,
-        "html": format_matrix_for_html(matrix.data)
+        "html": format_matrix_for_html(data) if html else None
     }
 
 
+# ================================
+# Format biner (negosiasi konten)
+# ================================
+def binary_format():
+    """
+    "npy"/"mtrx" bila klien meminta hasil biner (``Accept`` atau ``?format=``);
+    None → JSON (default, juga untuk ``Accept: */*``).
+    """
+    requested = (request.args.get('format') or '').lower()
+    if requested in ('npy', 'mtrx'):
+        return requested
+    best = request.accept_mimetypes.best_match(['application/json', NPY_MIMETYPE, MTRX_MIMETYPE])
+    return BINARY_MIMETYPES.get(best)
+
+
+def binary_matrix(operation, parts, compute, fmt):
+    """
+    Respons biner untuk hasil Matrix. ETag = kunci isi (operasi + operand),
+    sehingga If-None-Match yang cocok dijawab 304 tanpa menghitung ulang.
+    """
+    key = make_key(operation, *parts, fmt)
+    if request.if_none_match.contains(key):
+        response = app.response_class(status=304)
+    else:
+        result = compute()
+        mimetype = NPY_MIMETYPE if fmt == 'npy' else MTRX_MIMETYPE
+        response = Response(encode_matrix(result, fmt), mimetype=mimetype)
+        response.headers['X-Matrix-Shape'] = f"{result.rows},{result.cols}"
+    response.set_etag(key)
+    return response
+
+
+def _flag_param(data, name, default='1'):
+    return str(data.get(name, default)).lower() not in ('0', 'false', 'no', '')
+
+
+def _ttl_param(data):
+    return int(data['ttl']) if data.get('ttl') else None
+
+
+def _store_payload(matrix, ttl=None):
+    """Hasil disimpan sebagai handle baru; isi matriks tidak dikirim balik."""
+    handle = matrix_store.put(matrix, ttl=ttl)
+    return {
+        "success": True,
+        "handle": handle,
+        "rows": matrix.rows,
+        "cols": matrix.cols,
+        "header": getattr(matrix, 'header', None),
+    }
+
+
+# ================================
+# Cache hasil (content-addressed) + ETag
+# ================================
+def _async_mode():
+    """Parameter ``async``: auto (default, menurut perkiraan biaya), 1 (selalu job) atau 0 (selalu inline)."""
+    value = request.values.get('async')
+    if value is None and request.is_json:
+        value = (request.get_json(silent=True) or {}).get('async')
+    return str(value if value is not None else 'auto').lower()
+
+
+def _spooled(stream):
+    """
+    Menyalin file upload ke file sementara (di memori bila kecil) karena
+    stream request ditutup saat request selesai, sebelum job sempat membacanya.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    for block in iter(lambda: stream.read(1 << 20), b""):
+        spool.write(block)
+    spool.seek(0)
+    return spool
+
+
+def _compute_and_store(key, compute):
+    payload = compute()
+    result_cache.set(key, payload)
+    return payload
+
+
+def _job_accepted(job):
+    return jsonify({
+        "success": True,
+        "job_id": job.job_id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.job_id}",
+        "result_url": f"/api/jobs/{job.job_id}/result",
+    }), 202
+
+
+def _references_exist(payload, handles=False):
+    """Apakah model, plot dan handle yang dirujuk payload cache masih tersedia."""
+    if not isinstance(payload, dict):
+        return True
+    if payload.get("model_id") and not model_registry.exists(payload["model_id"]):
+        return False
+    plot_url = payload.get("plot_url")
+    if plot_url and not plot_service.exists(plot_url.rsplit("/", 1)[-1].removesuffix(".png")):
+        return False
+    if handles:
+        return all(h in matrix_store for h in payload.get("handles") or [payload.get("handle")])
+    return True
+
+
+def cached_json(operation, parts, compute, cost=0, handles=False):
+    """
+    Mengembalikan respons JSON dari cache jika (operasi, operand, parameter)
+    pernah dihitung. ETag = kunci cache, sehingga If-None-Match yang cocok
+    langsung dijawab 304 tanpa menghitung maupun mengirim ulang isi.
+
+    Saat miss, pekerjaan yang perkiraan biayanya (``cost``) di atas
+    ``inline_cost()`` dikirim ke antrean job dan dijawab 202 + ``job_id``;
+    yang kecil tetap dihitung langsung.
+
+    Hit cache (termasuk dari tingkat SQLite bersama setelah restart) hanya
+    dipakai selama sumber daya yang dirujuknya masih ada: ``model_id`` di
+    ``model_registry``, PNG ``plot_url`` di ``plot_service`` dan, untuk
+    ``handles=True``, ``handle(s)`` hasil tersimpan di ``matrix_store``.
+    """
+    key = make_key(operation, *parts)
+    payload = result_cache.get(key)
+    if payload is not None and not _references_exist(payload, handles):
+        payload = None  # rujukan sudah hilang → hitung ulang (dan simpan ulang)
+    if payload is not None and request.if_none_match.contains(key) and not handles:
+        response = app.response_class(status=304)
+        response.set_etag(key)
+        return response
+    if payload is not None and handles:
+        for h in payload.get("handles") or [payload.get("handle")]:
+            matrix_store.acquire(h)  # klien ini ikut memegang referensi handle
+    hit = payload is not None
+    if not hit:
+        mode = _async_mode()
+        if mode in ('1', 'true') or (mode == 'auto' and cost > inline_cost()):
+            try:
+                job = job_queue.submit(operation, _compute_and_store, key, compute, cost=cost)
+            except QueueFull as e:
+                return jsonify({"success": False, "error": str(e)}), 503
+            return _job_accepted(job)
+        payload = _compute_and_store(key, compute)
+
+    response = jsonify(payload)
+    response.set_etag(key)
+    response.headers['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
+
+
 # ================================
 # ROUTES
 # ================================
@@ -136,14 +280,25 @@ def index():
 
 
 # --- OPERASI MATRIKS ---
+# Hasil JSON (default) atau biner bila diminta lewat Accept / ?format=npy|mtrx.
+# ``html=0`` melewati render tabel HTML untuk klien non-browser. Operand boleh
+# berupa handle (``matrix_a_handle``); ``store=1`` menyimpan hasil sebagai
+# handle baru dan hanya mengembalikan handle + bentuknya.
+
 @app.route('/api/add', methods=['POST'])
 def api_add():
     try:
-        data = request.form.to_dict() if request.form else request.json
+        data = request_params()
         A = get_matrix_from_request(data, key="matrix_a")
         B = get_matrix_from_request(data, key="matrix_b")
-        result = add_matrices(A, B)
-        return jsonify({"success": True, "result": matrix_to_json_response(result)})
+        compute = lambda: add_matrices(A, B, backend=data.get('backend'))
+        if _flag_param(data, 'store', '0'):
+            return cached_json("add", (A, B, {"store": True}),
+                               lambda: _store_payload(compute(), _ttl_param(data)), handles=True)
+        fmt = binary_format()
+        if fmt:
+            return binary_matrix("add", (A, B), compute, fmt)
+        return jsonify({"success": True, "result": matrix_to_json_response(compute(), _flag_param(data, 'html'))})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -151,11 +306,22 @@ def api_add():
 @app.route('/api/multiply', methods=['POST'])
 def api_multiply():
     try:
-        data = request.form.to_dict() if request.form else request.json
+        data = request_params()
         A = get_matrix_from_request(data, key="matrix_a")
         B = get_matrix_from_request(data, key="matrix_b")
-        result = multiply_matrices(A, B)
-        return jsonify({"success": True, "result": matrix_to_json_response(result)})
+        compute = lambda: multiply_matrices(A, B, backend=data.get('backend'))
+        if _flag_param(data, 'store', '0'):
+            return cached_json("multiply", (A, B, {"store": True}),
+                               lambda: _store_payload(compute(), _ttl_param(data)),
+                               cost=A.rows * A.cols * B.cols, handles=True)
+        fmt = binary_format()
+        if fmt:
+            return binary_matrix("multiply", (A, B), compute, fmt)
+        html = _flag_param(data, 'html')
+        return cached_json("multiply", (A, B, {"html": html}), lambda: {
+            "success": True,
+            "result": matrix_to_json_response(compute(), html)
+        }, cost=A.rows * A.cols * B.cols)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -163,10 +329,16 @@ def api_multiply():
 @app.route('/api/transpose', methods=['POST'])
 def api_transpose():
     try:
-        data = request.form.to_dict() if request.form else request.json
+        data = request_params()
         A = get_matrix_from_request(data, key="matrix_a")
-        result = transpose(A)
-        return jsonify({"success": True, "result": matrix_to_json_response(result)})
+        compute = lambda: transpose(A, backend=data.get('backend'))
+        if _flag_param(data, 'store', '0'):
+            return cached_json("transpose", (A, {"store": True}),
+                               lambda: _store_payload(compute(), _ttl_param(data)), handles=True)
+        fmt = binary_format()
+        if fmt:
+            return binary_matrix("transpose", (A,), compute, fmt)
+        return jsonify({"success": True, "result": matrix_to_json_response(compute(), _flag_param(data, 'html'))})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -174,10 +346,21 @@ def api_transpose():
 @app.route('/api/inverse', methods=['POST'])
 def api_inverse():
     try:
-        data = request.form.to_dict() if request.form else request.json
+        data = request_params()
         A = get_matrix_from_request(data, key="matrix_a")
-        result = inverse(A)
-        return jsonify({"success": True, "result": matrix_to_json_response(result)})
+        compute = lambda: inverse(A, backend=data.get('backend'))
+        if _flag_param(data, 'store', '0'):
+            return cached_json("inverse", (A, {"store": True}),
+                               lambda: _store_payload(compute(), _ttl_param(data)),
+                               cost=A.rows ** 3, handles=True)
+        fmt = binary_format()
+        if fmt:
+            return binary_matrix("inverse", (A,), compute, fmt)
+        html = _flag_param(data, 'html')
+        return cached_json("inverse", (A, {"html": html}), lambda: {
+            "success": True,
+            "result": matrix_to_json_response(compute(), html)
+        }, cost=A.rows ** 3)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -186,59 +369,439 @@ def api_inverse():
 
 @app.route('/api/regression', methods=['POST'])
 def regression_auto():
+    """
+    Regresi dari file CSV atau dari matriks (mis. ``matrix_a_handle``, kolom
+    terakhir = Y). ``store=1`` juga menyimpan β sebagai handle.
+    """
     try:
+        data = request_params()
+        params = {
+            "mode": data.get('mode', 'full'),
+            "method": data.get('method', 'cholesky'),
+            "chunk_size": int(data.get('chunk_size', DEFAULT_CHUNK_SIZE)),
+            "cv": data.get('cv') or None,
+            "store": _flag_param(data, 'store', '0'),
+        }
+        if 'file' in request.files:
+            source = _spooled(request.files['file'].stream)
+            size = source.seek(0, io.SEEK_END)
+            source.seek(0)
+        else:
+            source = get_matrix_from_request(data, key="matrix_a")
+            size = source.rows * source.cols * 8
+        if params["mode"] == 'streaming':
+            compute = lambda: regression_streaming(source, params["chunk_size"], params["store"])
+        else:
+            compute = lambda: regression_full(source, params["method"], params["cv"], params["store"])
+        # Perkiraan kasar: ± 20 flop per byte CSV, x10 bila ada resampling
+        return cached_json("regression", (source, params), compute,
+                           cost=size * 20 * (10 if params["cv"] else 1), handles=params["store"])
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+def regression_streaming(source, chunk_size, store=False):
+    """Mode streaming: CSV dibaca per potongan, memori O(p²) (tanpa residual/plot)."""
+    if isinstance(source, Matrix):
+        X, y, columns, target = pisah_xy(source)
+        model = StreamingOLS().partial_fit(X, y)
+        model.columns, model.target = columns, target
+    else:
+        model = StreamingOLS.fit_csv(source, chunk_size=chunk_size)
+    hasil = model.solve()
+    model_id = model_registry.save(hasil["beta"].buffer, hasil["columns"], hasil["target"], {
+        "n": hasil["n"], "method": "streaming", "std_error": hasil["std_error"], **hasil["evaluation"]
+    })
+    beta_html = "<pre>" + "\n".join(
+        f"β{i} = {val:.4f}" for i, val in enumerate(hasil["beta"].buffer)
+    ) + "</pre>"
+    return {
+        "success": True,
+        "beta_html": beta_html,
+        "evaluation": hasil["evaluation"],
+        "std_error": hasil["std_error"],
+        "n": hasil["n"],
+        "method": "streaming",
+        "model_id": model_id,
+        "plot_url": None,
+        "handle": matrix_store.put(hasil["beta"]) if store else None
+    }
+
+
+def regression_full(source, method, cv=None, store=False):
+    if isinstance(source, Matrix):
+        # --- Matriks tersimpan/inline: sudah numerik, tanpa parse ulang
+        X, y, columns, target = pisah_xy(source)
+    else:
         # --- Baca CSV dan ambil kolom numerik
-        df = pd.read_csv(request.files['file']).select_dtypes(include='number')
+        df = pd.read_csv(source).select_dtypes(include='number')
         X_data = df.iloc[:, :-1].values.tolist()  # semua kolom kecuali terakhir
         y_data = df.iloc[:, -1].values.reshape(-1, 1).tolist()  # kolom terakhir = Y
+        columns, target = list(df.columns[:-1]), df.columns[-1]
 
         # --- Konversi ke Matrix
         X = Matrix(X_data)
         y = Matrix(y_data)
 
-        # --- Jalankan regresi linier
-        beta = regresi_linier(X, y)
-        y_pred = prediksi(X, beta)
-        hasil_eval = evaluasi(y.data, y_pred.data)
-
-        # --- Plot scatter + garis regresi
-        import io, base64, matplotlib.pyplot as plt
-        plt.figure(figsize=(6,4))
-        y_actual = [row[0] for row in y.data]
-        y_predict = [row[0] for row in y_pred.data]
-
-        # Scatter plot Y aktual vs Y prediksi
-        plt.scatter(y_actual, y_predict, color='blue', label='Prediksi')
-
-        # Garis regresi (Y_actual vs Y_actual=Y_pred)
-        min_y, max_y = min(y_actual), max(y_actual)
-        plt.plot([min_y, max_y], [min_y, max_y], color='red', linestyle='--', label='Garis Ideal')
-        
-        plt.xlabel("Y Aktual")
-        plt.ylabel("Y Prediksi")
-        plt.title("Plot Regresi Linier")
-        plt.legend()
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        plt.close()
-        buf.seek(0)
-        plot_base64 = base64.b64encode(buf.read()).decode('utf-8')
-
-        # --- Hasil
-        beta_html = "<pre>" + "\n".join([f"β{i} = {val[0]:.4f}" for i, val in enumerate(beta.data)]) + "</pre>"
+    # --- Jalankan regresi linier (metode: cholesky | qr | svd)
+    hasil = regresi_linier_detail(X, y, method)
+    beta = hasil["beta"]
+    y_pred = prediksi(X, beta)
+    hasil_eval = evaluasi(y.data, y_pred.data)
+    model_id = model_registry.save(beta.buffer, columns, target, {
+        "n": X.rows, "method": hasil["method"], "std_error": hasil["std_error"],
+        "SSE": hasil_eval["SSE"], "MSE": hasil_eval["MSE"], "R2": hasil_eval["R2"]
+    })
+
+    # --- Plot Y aktual vs Y prediksi (dirender di proses renderer, disajikan lewat URL)
+    plot_url = plot_service.url(
+        "prediction",
+        y_actual=[row[0] for row in y.data],
+        y_predict=[row[0] for row in y_pred.data],
+    )
+
+    # --- Hasil
+    beta_html = "<pre>" + "\n".join([f"β{i} = {val[0]:.4f}" for i, val in enumerate(beta.data)]) + "</pre>"
+
+    payload = {
+        "success": True,
+        "beta_html": beta_html,
+        "evaluation": hasil_eval,
+        "std_error": hasil["std_error"],
+        "rank": hasil["rank"],
+        "condition": hasil["condition"],
+        "method": hasil["method"],
+        "model_id": model_id,
+        "plot_url": plot_url,
+        "handle": matrix_store.put(beta) if store else None
+    }
+    # --- Validasi out-of-sample opsional (cv: loo, kfold:k, repeated:kxr, bootstrap:n)
+    if cv:
+        payload["cv"] = cross_validate(X, y, cv, seed=0)
+    return payload
+
+
+# --- KORELASI ---
+
+def _json_floats(matrix):
+    """List baris dengan NaN → None (JSON tidak mengenal NaN)."""
+    return [[None if v != v else v for v in row] for row in matrix.tolist()]
+
+
+def _flag(value):
+    return str(value).lower() not in ('0', 'false', 'no', '')
+
+
+@app.route('/api/correlation', methods=['POST'])
+def api_correlation():
+    """
+    Matriks korelasi kolom numerik dari file CSV (kolom teks seperti nama
+    provinsi dilewati) atau dari matriks manual/csv/json.
+    Parameter: method = pearson | spearman | kendall, pvalues = 1 | 0,
+    plot = 1 | 0, cluster = 1 | 0 (urutan klaster hierarkis), max_size
+    (sisi maksimum heatmap sebelum dirata-ratakan per blok), store = 1 | 0
+    (simpan matriks korelasi sebagai handle).
+    """
+    try:
+        data = request.form.to_dict() if request.form else (request.get_json(silent=True) or {})
+        params = {
+            "method": (data.get('method') or 'pearson').lower(),
+            "pvalues": _flag(data.get('pvalues', '1')),
+            "plot": _flag(data.get('plot', '1')),
+            "cluster": _flag(data.get('cluster', '0')),
+            "max_size": int(data.get('max_size') or MAX_CELLS),
+            "store": _flag(data.get('store', '0')),
+        }
+        if 'file' in request.files:
+            source = _spooled(request.files['file'].stream)
+            size = source.seek(0, io.SEEK_END)
+            source.seek(0)
+            load = lambda: [fields for _, fields in iter_fields(source)]
+        else:
+            source = get_matrix_from_request(data, key="matrix_a")
+            size = source.rows * source.cols * 8
+            load = lambda: source
+
+        def compute():
+            A = load()
+            header = getattr(A, 'header', None)
+            hasil = correlation_matrix(A, header, pvalues=params["pvalues"], method=params["method"])
+            names, R = hasil[0], hasil[1]
+            payload = {
+                "success": True,
+                "method": params["method"],
+                "columns": names,
+                "matrix": _json_floats(R),
+                "html": format_matrix_for_html(R.tolist()),
+            }
+            if params["pvalues"]:
+                payload["p_values"] = _json_floats(hasil[2])
+            if params["store"]:
+                R.header = list(names)
+                payload["handle"] = matrix_store.put(R)
+            payload["plot_url"] = plot_service.url(
+                "heatmap", matrix=_json_floats(R), labels=list(names), cluster=params["cluster"],
+                max_size=params["max_size"], annotate_limit=ANNOTATE_LIMIT,
+            ) if params["plot"] else None
+            return payload
+
+        # Perkiraan kasar per byte data; Kendall (n log n per pasangan) jauh lebih mahal
+        cost = size * (1000 if params["method"] == "kendall" else 50)
+        return cached_json("correlation", (source, params), compute, cost=cost, handles=params["store"])
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
 
+
+@app.route('/api/predict', methods=['POST'])
+def api_predict():
+    """
+    Skor data baru dengan model tersimpan (tanpa refit/plot):
+    - JSON {"model_id", "rows": [[...], ...]} (urutan kolom = kolom model)
+    - JSON {"model_id", "records": [{kolom: nilai}, ...]}
+    - multipart: field model_id + file CSV (seluruh batch)
+    """
+    try:
+        data = request.form.to_dict() if request.form else (request.get_json(silent=True) or {})
+        model = model_registry.load(data.get('model_id'))
+        backend = data.get('backend')
+        if 'file' in request.files:
+            predictions = model.predict_csv(request.files['file'].stream, backend=backend)
+        elif 'records' in data:
+            predictions = model.predict_records(data['records'], backend=backend)
+        elif 'rows' in data:
+            predictions = model.predict(data['rows'], backend=backend)
+        else:
+            raise ValueError("Kirim 'rows', 'records' atau file CSV untuk diskor.")
         return jsonify({
             "success": True,
-            "beta_html": beta_html,
-            "evaluation": hasil_eval,
-            "plot_base64": plot_base64
+            "model_id": model.model_id,
+            "target": model.target,
+            "predictions": predictions
         })
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
 
+@app.route('/api/models/<model_id>', methods=['GET'])
+def api_model(model_id):
+    try:
+        return jsonify({"success": True, "model": model_registry.load(model_id).to_dict()})
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+# --- PIPELINE (BANYAK LANGKAH, SATU REQUEST) ---
+
+def _pipeline_inputs(spec):
+    """
+    Input bernama pipeline → Matrix. Tiap input berupa handle (string),
+    list of lists, {"data": [...], "header": [...]}, atau {"source",
+    "content"} / {"handle"} seperti operand biasa; file multipart bernama
+    sama dengan input (CSV atau .npy/MTRX) juga diterima.
+    """
+    raw = spec.get('inputs') or {}
+    if not isinstance(raw, dict):
+        raise ValueError("'inputs' harus berupa object {nama: operand}.")
+    inputs = {}
+    for name, operand in raw.items():
+        if isinstance(operand, str):
+            operand = {"handle": operand}
+        if isinstance(operand, list):
+            inputs[name] = convert_rows(operand)
+        elif isinstance(operand, dict) and 'data' in operand:
+            inputs[name] = convert_rows(operand['data'])
+            if operand.get('header'):
+                inputs[name].header = list(operand['header'])
+        elif isinstance(operand, dict):
+            inputs[name] = get_matrix_from_request({
+                f'{name}_source': operand.get('source'),
+                f'{name}_content': operand.get('content'),
+                f'{name}_handle': operand.get('handle'),
+            }, key=name)
+        else:
+            raise ValueError(f"Input '{name}' tidak valid.")
+    for name in request.files:
+        if name not in inputs:
+            inputs[name] = get_matrix_from_request({}, key=name)
+    return inputs
+
+
+def _pipeline_output(matrix, details, mode, ttl):
+    """Satu output: isi matriks (JSON) atau handle tersimpan, plus detail statistiknya."""
+    if mode == 'handle':
+        out = _store_payload(matrix, ttl)
+        del out['success']
+    else:
+        out = {
+            "header": getattr(matrix, 'header', None),
+            "data": _json_floats(matrix),
+            "rows": matrix.rows,
+            "cols": matrix.cols,
+        }
+    for name, value in (details or {}).items():
+        out[name] = _json_floats(value) if isinstance(value, Matrix) else value
+    return out
+
+
+@app.route('/api/pipeline', methods=['POST'])
+def api_pipeline():
+    """
+    Menjalankan DAG operasi (add, multiply, transpose, inverse, regression,
+    correlation) atas input bernama dalam satu request; hasil antara tidak
+    pernah diserialisasi dan hanya ``outputs`` yang dikirim balik. Body JSON
+    berisi spesifikasi (lihat ``matriks.services.pipeline``), atau multipart
+    dengan field ``spec`` (JSON) + file per input. ``outputs`` boleh berupa
+    {id: "json" | "handle"} untuk menyimpan output sebagai handle.
+    """
+    try:
+        if request.form:
+            spec = json.loads(request.form.get('spec') or '{}')
+        else:
+            spec = request.get_json(silent=True) or {}
+        inputs = _pipeline_inputs(spec)
+        pipeline = Pipeline.from_spec(spec, list(inputs))
+        _, cost = pipeline.plan({name: m.shape for name, m in inputs.items()})
+
+        outputs = spec.get('outputs')
+        modes = outputs if isinstance(outputs, dict) else {}
+        if any(mode not in ('json', 'handle') for mode in modes.values()):
+            raise ValueError("Mode output harus 'json' atau 'handle'.")
+        ttl, backend = _ttl_param(spec), spec.get('backend')
+
+        def compute():
+            results = pipeline.run(inputs, backend=backend)
+            payload = {"success": True, "outputs": {
+                name: _pipeline_output(matrix, details, modes.get(name, 'json'), ttl)
+                for name, (matrix, details) in results.items()
+            }}
+            payload["handles"] = [out["handle"] for out in payload["outputs"].values() if "handle" in out]
+            return payload
+
+        names = sorted(inputs)
+        canonical = {k: spec.get(k) for k in ('steps', 'outputs', 'backend')}
+        return cached_json("pipeline", (names, *(inputs[n] for n in names), canonical), compute,
+                           cost=cost, handles='handle' in modes.values())
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+# --- PENYIMPANAN MATRIKS (HANDLE) ---
+
+@app.route('/api/matrices', methods=['POST'])
+def api_matrix_upload():
+    """
+    Mem-parse matriks sekali (manual/csv/json/file/biner, seperti operand
+    ``matrix_a``) dan menyimpannya; handle dipakai ulang lewat
+    ``<operand>_handle`` di endpoint /api/* lain. ``ttl`` opsional (detik).
+    """
+    try:
+        data = request_params()
+        handle = matrix_store.put(get_matrix_from_request(data, key="matrix_a"), ttl=_ttl_param(data))
+        return jsonify({"success": True, **matrix_store.info(handle)}), 201
+    except StoreFull as e:
+        return jsonify({"success": False, "error": str(e)}), 507
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@app.route('/api/matrices/<handle>', methods=['GET'])
+def api_matrix_get(handle):
+    """Metadata handle; isi matriks dengan ``?data=1`` (JSON) atau ``?format=npy|mtrx``."""
+    try:
+        info = matrix_store.info(handle)
+        fmt = binary_format()
+        if fmt:
+            return binary_matrix("matrix", (handle,), lambda: matrix_store.get(handle), fmt)
+        if _flag_param(request.args, 'data', '0'):
+            info["result"] = matrix_to_json_response(matrix_store.get(handle), _flag_param(request.args, 'html', '0'))
+        return jsonify({"success": True, **info})
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
+
+
+@app.route('/api/matrices/<handle>', methods=['DELETE'])
+def api_matrix_delete(handle):
+    try:
+        refs = matrix_store.delete(handle)
+        return jsonify({"success": True, "handle": handle, "refs": refs})
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
+
+
+@app.route('/api/matrices', methods=['GET'])
+def api_matrix_stats():
+    return jsonify({"success": True, "stats": matrix_store.stats()})
+
+
+# --- PLOT ---
+
+@app.route('/plots/<plot_hash>.png', methods=['GET'])
+def plot_png(plot_hash):
+    """PNG content-addressed: isi untuk satu hash tidak pernah berubah → cache selamanya."""
+    try:
+        path = plot_service.path(plot_hash)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 404
+    if request.if_none_match.contains(plot_hash):
+        response = app.response_class(status=304)
+    elif os.path.exists(path):
+        response = send_file(path, mimetype='image/png', conditional=False, etag=False)
+    else:
+        return jsonify({"success": False, "error": "Plot tidak ditemukan."}), 404
+    response.set_etag(plot_hash)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
+# --- JOB LATAR BELAKANG ---
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def api_job_status(job_id):
+    try:
+        return jsonify({"success": True, "job": job_queue.get(job_id).to_dict()})
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
+
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def api_job_result(job_id):
+    """Payload hasil (sama seperti respons inline); 202 selama job belum selesai."""
+    try:
+        job = job_queue.get(job_id)
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
+    if job.status == DONE:
+        return jsonify(job.result)
+    if job.status == FAILED:
+        return jsonify({"success": False, "error": job.error}), 400
+    if job.status == CANCELLED:
+        return jsonify({"success": False, "error": "Job dibatalkan."}), 410
+    return jsonify({"success": True, "job": job.to_dict()}), 202
+
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def api_job_cancel(job_id):
+    try:
+        return jsonify({"success": True, "job": job_queue.cancel(job_id).to_dict()})
+    except KeyError as e:
+        return jsonify({"success": False, "error": e.args[0]}), 404
+
+
+@app.route('/api/jobs', methods=['GET'])
+def api_job_stats():
+    return jsonify({"success": True, "stats": job_queue.stats()})
+
+
+@app.route('/api/cache/stats', methods=['GET'])
+def api_cache_stats():
+    return jsonify({"success": True, "stats": result_cache.stats()})
+
+
 # ================================
 # Jalankan server
 # ================================
@@ -0,0 +1,125 @@
+# benchmarks/bench_allocations.py
+"""
+Mengukur alokasi memori (tracemalloc) pada iterasi berulang: varian yang
+membuat Matrix baru tiap langkah vs varian ``out=`` / di tempat.
+
+Sebelum tabel, ``check()`` memastikan (AssertionError bila gagal) bahwa
+``+=``, ``-=``, ``@=``, ``out=`` dan ``axpy`` menulis ke buffer yang sama
+dan — kecuali ``@=`` yang butuh sementara karena operand = tujuan — puncak
+alokasinya di bawah satu buffer hasil, untuk setiap backend.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_allocations            # n=200, 20 iterasi
+    python -m benchmarks.bench_allocations 300 50
+    python -m benchmarks.bench_allocations check      # pemeriksaan saja
+"""
+import os
+import random
+import sys
+import tracemalloc
+
+from matriks.matrix import Matrix
+from matriks.operations.adder import add_matrices
+from matriks.operations.multiplier import multiply_matrices
+from matriks.operations.scaler import scale, axpy
+
+
+def measure(func, iterations):
+    """Puncak memori dan jumlah blok yang masih hidup setelah ``iterations`` langkah."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(iterations):
+        func()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(max(s.count_diff, 0) for s in after.compare_to(before, "filename"))
+    return peak, blocks
+
+
+def check(n=120):
+    """Memeriksa bahwa jalur di tempat tidak mengalokasikan buffer hasil baru."""
+    result_bytes = n * n * 8
+    for backend in ("python", "numpy"):
+        os.environ["MATRIKS_BACKEND"] = backend
+        A = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+        B = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+
+        def iadd():
+            nonlocal A
+            A += B
+
+        def isub():
+            nonlocal A
+            A -= B
+
+        def imatmul():
+            nonlocal A
+            A @= B
+
+        cases = [
+            ("A += B", iadd, True),
+            ("A -= B", isub, True),
+            ("add out=", lambda: add_matrices(A, B, out=A), True),
+            ("scale out=", lambda: scale(A, 0.5, out=A), True),
+            ("axpy", lambda: axpy(0.5, B, A), True),
+            ("A @= B", imatmul, False),
+        ]
+        for label, func, bounded in cases:
+            func()  # pemanasan: impor/cache backend tidak ikut terukur
+            matrix, buffer = A, A.buffer
+            tracemalloc.start()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert A is matrix and A.buffer is buffer, f"{backend}: {label} membuat buffer hasil baru"
+            assert not bounded or peak < result_bytes, (
+                f"{backend}: {label} mengalokasikan {peak} byte (satu buffer hasil = {result_bytes})"
+            )
+        print(f"backend {backend}: jalur di tempat OK (n={n})")
+    del os.environ["MATRIKS_BACKEND"]
+
+
+def workloads(n):
+    A = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+    X = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+    state = {"Y": Matrix.zeros(n, n), "v": Matrix([[1.0] for _ in range(n)])}
+    Y, v, tmp = Matrix.zeros(n, n), Matrix([[1.0] for _ in range(n)]), Matrix.zeros(n, 1)
+
+    def update_allocating():
+        state["Y"] = add_matrices(state["Y"], scale(X, 0.5))
+
+    def update_inplace():
+        axpy(0.5, X, Y)
+
+    def power_allocating():
+        w = multiply_matrices(A, state["v"])
+        state["v"] = scale(w, 1.0 / max(map(abs, w.buffer)))
+
+    def power_inplace():
+        multiply_matrices(A, v, out=tmp)
+        scale(tmp, 1.0 / max(map(abs, tmp.buffer)), out=v)
+
+    return [
+        ("Y += 0.5·X", update_allocating, update_inplace),
+        ("power iteration", power_allocating, power_inplace),
+    ]
+
+
+def main(n, iterations):
+    for backend in ("python", "numpy"):
+        os.environ["MATRIKS_BACKEND"] = backend
+        print(f"--- backend {backend} (n={n}, {iterations} iterasi)")
+        print(f"{'beban kerja':<16} {'varian':<10} {'puncak (KiB)':>13} {'blok hidup':>11}")
+        for label, allocating, inplace in workloads(n):
+            for variant, func in (("alokasi", allocating), ("out=", inplace)):
+                peak, blocks = measure(func, iterations)
+                print(f"{label:<16} {variant:<10} {peak / 1024:>13.1f} {blocks:>11}")
+    del os.environ["MATRIKS_BACKEND"]
+
+
+if __name__ == "__main__":
+    check()
+    if sys.argv[1:] != ["check"]:
+        args = [int(a) for a in sys.argv[1:]]
+        main(*(args + [200, 20][len(args):]))
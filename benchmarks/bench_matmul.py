@@ -0,0 +1,52 @@
+# benchmarks/bench_matmul.py
+"""
+Membandingkan kernel perkalian Python murni dengan implementasi lama
+(triple loop i-j-k di atas list of lists).
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_matmul            # ukuran 64, 256, 512
+    python -m benchmarks.bench_matmul 64 128     # ukuran tertentu
+"""
+import random
+import sys
+import time
+
+from matriks.matrix import Matrix
+from matriks.operations.multiplier import multiply_matrices
+
+
+def legacy_multiply(data1, data2):
+    """Salinan perilaku multiply_matrices sebelum kernel baru (acuan)."""
+    rows, inner, cols = len(data1), len(data2), len(data2[0])
+    result_data = [[0 for _ in range(cols)] for _ in range(rows)]
+    for i in range(rows):
+        for j in range(cols):
+            for k in range(inner):
+                result_data[i][j] += data1[i][k] * data2[k][j]
+    return result_data
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(sizes):
+    print(f"{'n':>5} {'lama (s)':>10} {'baru (s)':>10} {'speedup':>8}")
+    for n in sizes:
+        data1 = [[random.random() for _ in range(n)] for _ in range(n)]
+        data2 = [[random.random() for _ in range(n)] for _ in range(n)]
+        A, B = Matrix(data1), Matrix(data2)
+
+        t_old, expected = timed(legacy_multiply, data1, data2)
+        t_new, result = timed(multiply_matrices, A, B, "python")
+
+        error = max(abs(x - y) for x, y in zip(result.buffer, (v for row in expected for v in row)))
+        if error > 1e-9 * n:
+            raise AssertionError(f"Hasil berbeda untuk n={n} (selisih {error})")
+        print(f"{n:>5} {t_old:>10.3f} {t_new:>10.3f} {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or [64, 256, 512])
@@ -0,0 +1,78 @@
+# benchmarks/bench_parser.py
+"""
+Membandingkan throughput (MB/s) parser CSV/manual lama di ``app.py``
+(csv.reader + list of lists per sel) dengan tokenizer streaming baru.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_parser              # 10k x 20 dan 100k x 20
+    python -m benchmarks.bench_parser 50000 8      # baris kolom tertentu
+"""
+import csv
+import io
+import random
+import sys
+import time
+
+from matriks.matrix import Matrix
+from matriks.importers.tokenizer import parse_numeric, WHITESPACE
+
+
+def legacy_csv(content):
+    """Salinan perilaku cabang CSV get_matrix_from_request sebelum tokenizer (acuan)."""
+    rows = [row for row in csv.reader(io.StringIO(content)) if any(cell.strip() for cell in row)]
+    first = rows[0]
+    try:
+        [float(x) for x in first]
+        numeric_rows = rows
+    except ValueError:
+        numeric_rows = rows[1:]
+    data = [[float(x) for x in r if x.strip() != ""] for r in numeric_rows]
+    if len({len(r) for r in data}) != 1:
+        raise ValueError("Semua baris CSV harus punya jumlah kolom sama.")
+    return Matrix(data)
+
+
+def legacy_manual(content):
+    """Salinan perilaku cabang manual get_matrix_from_request sebelum tokenizer (acuan)."""
+    data = []
+    for line in (line.strip() for line in content.splitlines() if line.strip()):
+        data.append([float(p) for p in line.replace(',', ' ').split() if p])
+    if len({len(r) for r in data}) != 1:
+        raise ValueError("Semua baris harus memiliki jumlah kolom sama.")
+    return Matrix(data)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def make_csv(rows, cols):
+    header = ",".join(f"x{j}" for j in range(cols))
+    body = "\n".join(",".join(f"{random.gauss(0, 100):.6g}" for _ in range(cols)) for _ in range(rows))
+    return f"{header}\n{body}\n"
+
+
+def main(shapes):
+    print(f"{'ukuran':>12} {'MB':>6} {'mode':>7} {'lama MB/s':>10} {'baru MB/s':>10} {'speedup':>8}")
+    for rows, cols in shapes:
+        content = make_csv(rows, cols)
+        manual = content.split("\n", 1)[1].replace(",", " ")
+        cases = [
+            ("csv", legacy_csv, lambda: parse_numeric(io.BytesIO(content.encode())), content),
+            ("manual", legacy_manual, lambda: parse_numeric(manual, delimiter=WHITESPACE, header=False), manual),
+        ]
+        for mode, legacy, new, text in cases:
+            megabytes = len(text) / 1e6
+            t_old, expected = timed(legacy, text)
+            t_new, result = timed(new)
+            if (result.rows, result.cols) != (expected.rows, expected.cols) or result.buffer != expected.buffer:
+                raise AssertionError(f"Hasil berbeda untuk {rows}x{cols} ({mode})")
+            print(f"{f'{rows}x{cols}':>12} {megabytes:>6.1f} {mode:>7} {megabytes / t_old:>10.1f} "
+                  f"{megabytes / t_new:>10.1f} {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:]]
+    main([tuple(args[:2])] if len(args) >= 2 else [(10_000, 20), (100_000, 20)])
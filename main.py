@@ -116,7 +116,7 @@ if __name__ == "__main__":
                 print("     " + "  ".join(f"{h[:6]:>8}" for h in header))
                 for i, row in enumerate(corr_mat.data):
                     print(f"{header[i][:6]:>6} " + "  ".join(f"{val:8.3f}" for val in row))
-                    plot_correlation_matrix(corr_mat, header)
+                plot_correlation_matrix(corr_mat, header)
 
         elif pilihan == "6":
             print("\n=== Regresi Linier (OLS) ===")
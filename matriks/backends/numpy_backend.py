@@ -0,0 +1,140 @@
+# matriks/backends/numpy_backend.py
+from array import array
+import numpy as np
+from ..matrix import Matrix
+
+try:
+    from scipy.linalg.blas import daxpy
+except ImportError:  # SciPy opsional → axpy memakai array sementara
+    daxpy = None
+
+try:
+    from scipy.linalg import solve_triangular, cho_solve
+except ImportError:  # SciPy opsional → invers/solve selalu lewat LU NumPy
+    solve_triangular = cho_solve = None
+
+
+def _as_ndarray(matrix):
+    """Membungkus buffer Matrix sebagai ndarray (tanpa salinan)."""
+    return np.asarray(matrix)
+
+
+def _empty(rows, cols, out=None):
+    """
+    Menyiapkan Matrix hasil beserta view ndarray yang bisa ditulisi langsung.
+    Jika ``out`` diberikan, buffer-nya dipakai ulang (tanpa alokasi baru).
+    """
+    result = out if out is not None else Matrix.from_flat(array('d', [0.0]) * (rows * cols), rows, cols)
+    return result, np.frombuffer(result.buffer, dtype=np.float64).reshape(rows, cols)
+
+
+class NumpyBackend:
+    """
+    Backend tervektorisasi berbasis NumPy (BLAS/LAPACK).
+    Operand dibungkus tanpa salinan dan hasil ditulis langsung ke buffer
+    Matrix baru (atau ke ``out`` bila diberikan) melalui argumen ``out=`` ufunc.
+    """
+    name = "numpy"
+
+    def add(self, matrix1, matrix2, out=None):
+        result, out = _empty(matrix1.rows, matrix1.cols, out)
+        np.add(_as_ndarray(matrix1), _as_ndarray(matrix2), out=out)
+        return result
+
+    def subtract(self, matrix1, matrix2, out=None):
+        result, out = _empty(matrix1.rows, matrix1.cols, out)
+        np.subtract(_as_ndarray(matrix1), _as_ndarray(matrix2), out=out)
+        return result
+
+    def multiply(self, matrix1, matrix2, out=None):
+        result, out = _empty(matrix1.rows, matrix2.cols, out)
+        np.matmul(_as_ndarray(matrix1), _as_ndarray(matrix2), out=out)
+        return result
+
+    def multiply_tn(self, matrix1, matrix2):
+        result, out = _empty(matrix1.cols, matrix2.cols)
+        np.matmul(_as_ndarray(matrix1).T, _as_ndarray(matrix2), out=out)
+        return result
+
+    def multiply_nt(self, matrix1, matrix2):
+        result, out = _empty(matrix1.rows, matrix2.rows)
+        np.matmul(_as_ndarray(matrix1), _as_ndarray(matrix2).T, out=out)
+        return result
+
+    def linear_combination(self, terms, rows, cols):
+        result, out = _empty(rows, cols)
+        for index, (sign, matrix, transposed) in enumerate(terms):
+            operand = _as_ndarray(matrix).T if transposed else _as_ndarray(matrix)
+            if index == 0 and sign > 0:
+                np.copyto(out, operand)
+            elif index == 0:
+                np.negative(operand, out=out)
+            elif sign > 0:
+                np.add(out, operand, out=out)
+            else:
+                np.subtract(out, operand, out=out)
+        return result
+
+    def scale(self, matrix, alpha, out=None):
+        result, out = _empty(matrix.rows, matrix.cols, out)
+        np.multiply(_as_ndarray(matrix), alpha, out=out)
+        return result
+
+    def axpy(self, alpha, x, y):
+        target = _as_ndarray(y).reshape(-1)
+        if daxpy is not None:
+            # BLAS daxpy menulis langsung ke y (tanpa array sementara)
+            daxpy(_as_ndarray(x).reshape(-1), target, a=alpha)
+        else:
+            target += alpha * _as_ndarray(x).reshape(-1)
+        return y
+
+    def transpose(self, matrix):
+        result, out = _empty(matrix.cols, matrix.rows)
+        out[...] = _as_ndarray(matrix).T
+        return result
+
+    def _structured_solve(self, matrix, rhs):
+        """
+        Seperti PythonBackend: segitiga → substitusi (LAPACK trtrs), simetris
+        persis dengan diagonal positif → Cholesky (potrf, gagal → LU),
+        selain itu None (LU NumPy). Butuh SciPy.
+        """
+        if solve_triangular is None:
+            return None
+        props = matrix.properties()
+        a = _as_ndarray(matrix)
+        if props.lower_triangular or props.upper_triangular:
+            return solve_triangular(a, rhs, lower=props.lower_triangular, check_finite=False)
+        if props.exact_symmetric and np.all(np.diagonal(a) > 0):
+            try:
+                L = np.linalg.cholesky(a)
+            except np.linalg.LinAlgError:
+                return None  # tidak definit positif
+            return cho_solve((L, True), rhs, check_finite=False)
+        return None
+
+    def inverse(self, matrix):
+        try:
+            inv = self._structured_solve(matrix, np.eye(matrix.rows))
+            if inv is None:
+                inv = np.linalg.inv(_as_ndarray(matrix))
+        except np.linalg.LinAlgError:
+            raise ValueError("Matriks singular, tidak punya invers.")
+        result, out = _empty(matrix.rows, matrix.cols)
+        out[...] = inv
+        return result
+
+    def solve(self, matrix, b):
+        try:
+            x = self._structured_solve(matrix, _as_ndarray(b))
+            if x is None:
+                x = np.linalg.solve(_as_ndarray(matrix), _as_ndarray(b))
+        except np.linalg.LinAlgError:
+            raise ValueError("Matriks singular, tidak punya invers.")
+        result, out = _empty(b.rows, b.cols)
+        out[...] = x
+        return result
+
+    def determinant(self, matrix):
+        return float(np.linalg.det(_as_ndarray(matrix)))
@@ -0,0 +1,357 @@
+# matriks/backends/parallel_backend.py
+"""
+Backend paralel multi-core untuk perkalian dan invers matriks besar.
+
+- Perkalian: baris A dibagi menjadi blok dan dibagikan ke ``ProcessPoolExecutor``.
+- Invers: LU blok (right-looking) dengan pivot parsial; pembaruan submatriks
+  sisa (bagian O(n³)) dibagi per blok baris, lalu AX = I diselesaikan
+  paralel per blok kolom identitas.
+
+Operand dan hasil ditaruh di ``multiprocessing.shared_memory`` sehingga
+tidak pernah di-pickle; worker hanya menerima nama segmen dan indeks blok.
+Input di bawah ambang ukuran langsung dihitung serial (tanpa biaya spawn).
+
+Konfigurasi (environment variable atau ``configure()``):
+    MATRIKS_WORKERS             jumlah proses worker (default: jumlah CPU)
+    MATRIKS_PARALLEL_THRESHOLD  dimensi minimum untuk mode paralel (default 128)
+"""
+import multiprocessing
+import os
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from operator import sub
+
+from ..matrix import Matrix
+from ..operations.lu import LUDecomposition
+from .python_kernels import matmul
+
+ENV_WORKERS = "MATRIKS_WORKERS"
+ENV_PARALLEL_THRESHOLD = "MATRIKS_PARALLEL_THRESHOLD"
+DEFAULT_PARALLEL_THRESHOLD = 128
+BLOCK_SIZE = 64
+
+_EPS = sys.float_info.epsilon
+_config = {"workers": None, "threshold": None}
+_pool = {"executor": None, "workers": 0}
+_pool_lock = threading.RLock()
+
+
+def configure(workers=None, threshold=None):
+    """Mengatur jumlah worker dan ambang dimensi (menimpa environment variable)."""
+    if workers is not None:
+        _config["workers"] = int(workers)
+    if threshold is not None:
+        _config["threshold"] = int(threshold)
+
+
+def worker_count():
+    if _config["workers"] is not None:
+        return max(1, _config["workers"])
+    try:
+        return max(1, int(os.environ.get(ENV_WORKERS, os.cpu_count() or 1)))
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+def parallel_threshold():
+    if _config["threshold"] is not None:
+        return _config["threshold"]
+    try:
+        return int(os.environ.get(ENV_PARALLEL_THRESHOLD, DEFAULT_PARALLEL_THRESHOLD))
+    except ValueError:
+        return DEFAULT_PARALLEL_THRESHOLD
+
+
+def _executor():
+    """
+    Pool dibuat sekali saat pertama dibutuhkan dan dipakai ulang. Konteks
+    spawn: proses web punya banyak thread (gunicorn --threads, antrean job),
+    dan fork dari proses ber-thread bisa mewarisi lock yang sedang terkunci.
+    """
+    workers = worker_count()
+    with _pool_lock:
+        if _pool["executor"] is None or _pool["workers"] != workers:
+            shutdown()
+            _pool["executor"] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool["workers"] = workers
+        return _pool["executor"]
+
+
+def shutdown():
+    """Menghentikan pool worker (pool baru dibuat lagi bila dibutuhkan)."""
+    with _pool_lock:
+        if _pool["executor"] is not None:
+            _pool["executor"].shutdown()
+            _pool["executor"] = None
+            _pool["workers"] = 0
+
+
+def _ranges(start, stop, parts):
+    """Membagi [start, stop) menjadi paling banyak ``parts`` rentang yang seimbang."""
+    total = stop - start
+    parts = max(1, min(parts, total))
+    step, extra = divmod(total, parts)
+    bounds, lo = [], start
+    for i in range(parts):
+        hi = lo + step + (1 if i < extra else 0)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+# ----------------------------------------------------------------------
+# Shared memory
+# ----------------------------------------------------------------------
+def _create_shared(buf):
+    """Membuat segmen shared memory berisi salinan buffer float64 (tanpa pickle)."""
+    size = max(8, len(buf) * 8)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    shm.buf[:len(buf) * 8] = memoryview(buf).cast('B')
+    return shm
+
+
+def _read(shm, start, stop):
+    """Membaca elemen float64 [start, stop) dari segmen sebagai array('d')."""
+    out = array('d')
+    out.frombytes(shm.buf[start * 8:stop * 8])
+    return out
+
+
+def _write(shm, start, values):
+    shm.buf[start * 8:(start + len(values)) * 8] = memoryview(values).cast('B')
+
+
+def _release(*segments):
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+# ----------------------------------------------------------------------
+# Tugas worker (fungsi level modul agar bisa dipanggil di proses lain)
+# ----------------------------------------------------------------------
+def _multiply_rows(a_name, b_name, c_name, m, p, r0, r1):
+    a_shm = shared_memory.SharedMemory(name=a_name)
+    b_shm = shared_memory.SharedMemory(name=b_name)
+    c_shm = shared_memory.SharedMemory(name=c_name)
+    try:
+        a = _read(a_shm, r0 * m, r1 * m)
+        b = _read(b_shm, 0, m * p)
+        _write(c_shm, r0 * p, matmul(a, b, r1 - r0, m, p))
+    finally:
+        a_shm.close()
+        b_shm.close()
+        c_shm.close()
+
+
+def _update_trailing(name, n, k, nb, r0, r1):
+    """A[r0:r1, k+nb:] -= L[r0:r1, k:k+nb] · U[k:k+nb, k+nb:]."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        start = k + nb
+        u_rows = [_read(shm, (k + t) * n + start, (k + t + 1) * n) for t in range(nb)]
+        for i in range(r0, r1):
+            row = _read(shm, i * n + k, (i + 1) * n)
+            tail = row[nb:]
+            for t, factor in enumerate(row[:nb]):
+                if factor:
+                    tail = array('d', map(sub, tail, map(factor.__mul__, u_rows[t])))
+            _write(shm, i * n + start, tail)
+    finally:
+        shm.close()
+
+
+def _solve_columns(lu_name, x_name, n, perm, c0, c1):
+    """Menyelesaikan AX = I untuk kolom identitas [c0, c1) memakai faktor LU bersama."""
+    lu_shm = shared_memory.SharedMemory(name=lu_name)
+    x_shm = shared_memory.SharedMemory(name=x_name)
+    try:
+        lu = [_read(lu_shm, i * n, (i + 1) * n).tolist() for i in range(n)]
+        width = c1 - c0
+        identity = [[0.0] * width for _ in range(n)]
+        for t in range(width):
+            identity[c0 + t][t] = 1.0
+        solution = LUDecomposition.from_factors(lu, perm)._solve_rows(identity)
+        for i, row in enumerate(solution):
+            _write(x_shm, i * n + c0, array('d', row))
+    finally:
+        lu_shm.close()
+        x_shm.close()
+
+
+# ----------------------------------------------------------------------
+# LU blok paralel
+# ----------------------------------------------------------------------
+def _parallel_lu(shm, n, tol, executor, workers):
+    """
+    Faktorisasi LU blok di tempat pada segmen ``shm`` (n x n).
+    Panel kolom difaktorkan di proses utama; pembaruan submatriks sisa
+    dibagi per blok baris ke worker. Mengembalikan (perm, sign, singular).
+    """
+    view = shm.buf.cast('d')
+    perm = list(range(n))
+    sign, singular = 1.0, False
+    try:
+        for k in range(0, n, BLOCK_SIZE):
+            nb = min(BLOCK_SIZE, n - k)
+
+            # 1. Faktorisasi panel kolom [k, k+nb) dengan pivot parsial.
+            #    Panel dibaca ke list, baris penuh ditukar langsung di segmen.
+            panel = [view[i * n + k:i * n + k + nb].tolist() for i in range(k, n)]
+            for jj in range(nb):
+                p = max(range(jj, len(panel)), key=lambda r: abs(panel[r][jj]))
+                if p != jj:
+                    j, q = k + jj, k + p
+                    row_j = bytes(shm.buf[j * n * 8:(j + 1) * n * 8])
+                    shm.buf[j * n * 8:(j + 1) * n * 8] = shm.buf[q * n * 8:(q + 1) * n * 8]
+                    shm.buf[q * n * 8:(q + 1) * n * 8] = row_j
+                    panel[jj], panel[p] = panel[p], panel[jj]
+                    perm[j], perm[q] = perm[q], perm[j]
+                    sign = -sign
+
+                pivot = panel[jj][jj]
+                if abs(pivot) <= tol:
+                    singular = True
+                    if pivot == 0:
+                        continue
+                tail = panel[jj][jj + 1:]
+                for row in panel[jj + 1:]:
+                    factor = row[jj] / pivot
+                    row[jj] = factor
+                    if factor:
+                        row[jj + 1:] = map(sub, row[jj + 1:], map(factor.__mul__, tail))
+
+            for r, row in enumerate(panel):
+                base = (k + r) * n + k
+                view[base:base + nb] = array('d', row)
+
+            start = k + nb
+            if start >= n:
+                break
+
+            # 2. Baris U12 = L11⁻¹ A12 (substitusi maju, diagonal L = 1)
+            for t in range(1, nb):
+                row = array('d', view[(k + t) * n + start:(k + t + 1) * n])
+                for s in range(t):
+                    factor = view[(k + t) * n + k + s]
+                    if factor:
+                        u = view[(k + s) * n + start:(k + s + 1) * n]
+                        row = array('d', map(sub, row, map(factor.__mul__, u)))
+                view[(k + t) * n + start:(k + t + 1) * n] = row
+
+            # 3. Pembaruan submatriks sisa (paralel per blok baris)
+            futures = [
+                executor.submit(_update_trailing, shm.name, n, k, nb, r0, r1)
+                for r0, r1 in _ranges(start, n, workers)
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        view.release()
+    return perm, sign, singular
+
+
+class ParallelBackend:
+    """
+    Backend paralel: ``multiply``, ``inverse`` dan ``determinant`` memakai
+    pool proses untuk input di atas ambang; operasi lain dan input kecil
+    didelegasikan ke backend serial (pemilihan otomatis).
+    """
+    name = "parallel"
+
+    def _serial(self, *matrices):
+        # Impor lokal: registry mengimpor modul ini saat inisialisasi
+        from .registry import resolve_backend
+        return resolve_backend("auto", *matrices)
+
+    def __getattr__(self, operation):
+        # add, subtract, transpose, scale, axpy, ... → backend serial
+        def delegate(*args, **kwargs):
+            matrices = [a for a in args if isinstance(a, Matrix)]
+            return getattr(self._serial(*matrices), operation)(*args, **kwargs)
+        return delegate
+
+    def multiply(self, matrix1, matrix2, out=None):
+        n, m, p = matrix1.rows, matrix1.cols, matrix2.cols
+        workers = worker_count()
+        threshold = parallel_threshold()
+        if workers < 2 or n * m * p < threshold ** 3 or matrix1.is_sparse or matrix2.is_sparse:
+            return self._serial(matrix1, matrix2).multiply(matrix1, matrix2, out)
+
+        executor = _executor()
+        a_shm = _create_shared(matrix1.buffer)
+        b_shm = _create_shared(matrix2.buffer)
+        c_shm = shared_memory.SharedMemory(create=True, size=max(8, n * p * 8))
+        try:
+            futures = [
+                executor.submit(_multiply_rows, a_shm.name, b_shm.name, c_shm.name, m, p, r0, r1)
+                for r0, r1 in _ranges(0, n, workers)
+            ]
+            for future in futures:
+                future.result()
+            result = _read(c_shm, 0, n * p)
+        finally:
+            _release(a_shm, b_shm, c_shm)
+
+        if out is None:
+            return Matrix.from_flat(result, n, p)
+        out.buffer[:] = result
+        return out
+
+    def _factor(self, matrix):
+        """LU blok paralel; mengembalikan (segmen LU, perm, sign, singular)."""
+        n = matrix.rows
+        tol = n * _EPS * max(map(abs, matrix.buffer), default=0.0)
+        shm = _create_shared(matrix.buffer)
+        try:
+            perm, sign, singular = _parallel_lu(shm, n, tol, _executor(), worker_count())
+        except BaseException:
+            _release(shm)
+            raise
+        return shm, perm, sign, singular
+
+    def _use_parallel(self, matrix):
+        return (worker_count() >= 2 and matrix.rows >= parallel_threshold()
+                and not matrix.is_sparse)
+
+    def inverse(self, matrix):
+        if not self._use_parallel(matrix):
+            return self._serial(matrix).inverse(matrix)
+
+        n = matrix.rows
+        lu_shm, perm, _, singular = self._factor(matrix)
+        x_shm = None
+        try:
+            if singular:
+                raise ValueError("Matriks singular, tidak punya invers.")
+            x_shm = shared_memory.SharedMemory(create=True, size=n * n * 8)
+            executor = _executor()
+            futures = [
+                executor.submit(_solve_columns, lu_shm.name, x_shm.name, n, perm, c0, c1)
+                for c0, c1 in _ranges(0, n, worker_count())
+            ]
+            for future in futures:
+                future.result()
+            return Matrix.from_flat(_read(x_shm, 0, n * n), n, n)
+        finally:
+            _release(lu_shm, *([x_shm] if x_shm is not None else []))
+
+    def determinant(self, matrix):
+        if not self._use_parallel(matrix):
+            return self._serial(matrix).determinant(matrix)
+
+        n = matrix.rows
+        lu_shm, _, sign, _ = self._factor(matrix)
+        try:
+            diagonal = _read(lu_shm, 0, n * n)[::n + 1]
+        finally:
+            _release(lu_shm)
+        result = sign
+        for value in diagonal:
+            result *= value
+        return result
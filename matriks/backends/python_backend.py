@@ -0,0 +1,134 @@
+# matriks/backends/python_backend.py
+from array import array
+from itertools import chain
+from operator import add, sub, neg
+from ..matrix import Matrix
+from ..operations.lu import LUDecomposition
+from ..operations.structured import (
+    triangular_inverse, triangular_solve, cholesky_inverse, cholesky_solve,
+)
+from .python_kernels import matmul, matmul_abt, matmul_atb
+
+
+def _stream(matrix, transposed):
+    """Iterasi elemen row-major dari matrix atau transposenya (tanpa salinan penuh)."""
+    if not transposed:
+        return matrix.buffer
+    buf, cols = matrix.buffer, matrix.cols
+    return chain.from_iterable(buf[j::cols] for j in range(cols))
+
+
+# Elemen per potongan saat menulis ke ``out``: sementara hanya sebesar ini
+_CHUNK = 4096
+
+
+def _elementwise(func, rows, cols, out, *buffers):
+    """
+    ``func`` per elemen atas ``buffers``. Tanpa ``out`` → buffer baru; dengan
+    ``out`` hasil ditulis per potongan ``_CHUNK`` elemen, sehingga tidak ada
+    buffer sementara seukuran hasil (aman walau ``out`` juga operand).
+    """
+    if out is None:
+        return Matrix.from_flat(array('d', map(func, *buffers)), rows, cols)
+    target = out.buffer
+    views = [memoryview(b) for b in buffers]
+    for start in range(0, rows * cols, _CHUNK):
+        end = start + _CHUNK
+        target[start:end] = array('d', map(func, *(v[start:end] for v in views)))
+    return out
+
+
+def _store(result, rows, cols, out):
+    """
+    Membungkus buffer hasil sebagai Matrix baru, atau menyalinnya ke buffer
+    ``out`` yang sudah ada (satu memcpy, tanpa objek Matrix baru).
+    """
+    if out is None:
+        return Matrix.from_flat(result, rows, cols)
+    out.buffer[:] = result
+    return out
+
+
+class PythonBackend:
+    """
+    Backend referensi berbasis Python murni.
+    Tidak punya dependensi eksternal dan selalu tersedia sebagai fallback.
+    Semua method mengasumsikan dimensi sudah divalidasi oleh pemanggil.
+    """
+    name = "python"
+
+    def add(self, matrix1, matrix2, out=None):
+        return _elementwise(add, matrix1.rows, matrix1.cols, out, matrix1.buffer, matrix2.buffer)
+
+    def subtract(self, matrix1, matrix2, out=None):
+        return _elementwise(sub, matrix1.rows, matrix1.cols, out, matrix1.buffer, matrix2.buffer)
+
+    def multiply(self, matrix1, matrix2, out=None):
+        n, m, p = matrix1.rows, matrix1.cols, matrix2.cols
+        result = matmul(matrix1.buffer, matrix2.buffer, n, m, p)
+        return _store(result, n, p, out)
+
+    def scale(self, matrix, alpha, out=None):
+        return _elementwise(float(alpha).__mul__, matrix.rows, matrix.cols, out, matrix.buffer)
+
+    def axpy(self, alpha, x, y):
+        alpha = float(alpha)
+        return _elementwise(lambda xi, yi: alpha * xi + yi, y.rows, y.cols, y, x.buffer, y.buffer)
+
+    def multiply_tn(self, matrix1, matrix2):
+        """matrix1ᵀ @ matrix2 tanpa membentuk transpose."""
+        m, n, p = matrix1.rows, matrix1.cols, matrix2.cols
+        b = matrix1.buffer if matrix2 is matrix1 else matrix2.buffer
+        return Matrix.from_flat(matmul_atb(matrix1.buffer, b, m, n, p), n, p)
+
+    def multiply_nt(self, matrix1, matrix2):
+        """matrix1 @ matrix2ᵀ tanpa membentuk transpose."""
+        n, m, p = matrix1.rows, matrix1.cols, matrix2.rows
+        b = matrix1.buffer if matrix2 is matrix1 else matrix2.buffer
+        return Matrix.from_flat(matmul_abt(matrix1.buffer, b, n, m, p), n, p)
+
+    def linear_combination(self, terms, rows, cols):
+        """
+        Menghitung Σ ±Xᵢ dalam satu lintasan. ``terms`` berisi tuple
+        (tanda, matrix, transposed); rantai map() dievaluasi elemen demi
+        elemen sehingga tidak ada array perantara.
+        """
+        (sign, matrix, transposed), rest = terms[0], terms[1:]
+        stream = _stream(matrix, transposed)
+        if sign < 0:
+            stream = map(neg, stream)
+        for sign, matrix, transposed in rest:
+            stream = map(add if sign > 0 else sub, stream, _stream(matrix, transposed))
+        return Matrix.from_flat(array('d', stream), rows, cols)
+
+    def transpose(self, matrix):
+        if not matrix.is_numeric:
+            return Matrix([list(matrix.col(j)) for j in range(matrix.cols)])
+
+        # Kolom ke-j adalah slice bertingkat buf[j::cols] → jadi baris ke-j hasil
+        buf, cols = matrix.buffer, matrix.cols
+        transposed = array('d')
+        for j in range(cols):
+            transposed.extend(buf[j::cols])
+        return Matrix.from_flat(transposed, matrix.cols, matrix.rows)
+
+    def inverse(self, matrix):
+        # Struktur yang diketahui menentukan algoritma: segitiga → substitusi,
+        # SPD → Cholesky, selain itu LU dengan pivot parsial
+        props = matrix.properties()
+        if props.lower_triangular or props.upper_triangular:
+            return triangular_inverse(matrix, props.lower_triangular)
+        if props.spd:
+            return cholesky_inverse(props.cholesky, matrix)
+        return LUDecomposition(matrix).inverse()
+
+    def solve(self, matrix, b):
+        props = matrix.properties()
+        if props.lower_triangular or props.upper_triangular:
+            return triangular_solve(matrix, b, props.lower_triangular)
+        if props.spd:
+            return cholesky_solve(props.cholesky, matrix, b)
+        return LUDecomposition(matrix).solve(b)
+
+    def determinant(self, matrix):
+        return LUDecomposition(matrix).det()
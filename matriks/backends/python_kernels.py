@@ -0,0 +1,191 @@
+# matriks/backends/python_kernels.py
+"""
+Kernel perkalian matriks Python murni di atas buffer datar row-major.
+
+- ``matmul_ikj``     : urutan i-k-j dengan hoisting baris; melewati a[i][k] == 0
+- ``matmul_blocked`` : B ditranspose sekali, lalu dot product baris A x kolom B
+                       per blok kolom (tile) agar blok Bᵀ tetap "panas" di cache
+- ``matmul_strassen``: rekursi Strassen (7 perkalian per level) di atas ambang
+                       ukuran, daun rekursinya memakai ``matmul_blocked``
+- ``matmul_atb`` / ``matmul_abt``: AᵀB dan ABᵀ tanpa membentuk transpose
+
+``matmul`` memilih kernel yang sesuai secara otomatis.
+"""
+from array import array
+from operator import add, sub, mul
+
+try:  # Python 3.12+
+    from math import sumprod as _dot
+except ImportError:
+    def _dot(x, y):
+        return sum(map(mul, x, y))
+
+TILE_SIZE = 64
+STRASSEN_THRESHOLD = 256
+STRASSEN_LEAF = 64
+SPARSE_RATIO = 0.75
+
+
+def _zeros(size):
+    return array('d', [0.0]) * size
+
+
+def matmul_ikj(a, b, n, m, p):
+    """Perkalian (n x m)(m x p) dengan urutan i-k-j; baris B diakses berurutan."""
+    out = array('d')
+    for i in range(n):
+        acc = [0.0] * p
+        for k, aik in enumerate(a[i * m:(i + 1) * m]):
+            if aik:
+                acc = list(map(add, acc, map(aik.__mul__, b[k * p:(k + 1) * p])))
+        out.extend(acc)
+    return out
+
+
+def _dot_rows(a_rows, b_rows, tile):
+    """out[i][j] = a_rows[i] · b_rows[j], dihitung per blok baris b (tile)."""
+    n, p = len(a_rows), len(b_rows)
+    out = _zeros(n * p)
+    for j0 in range(0, p, tile):
+        block = b_rows[j0:j0 + tile]
+        width = len(block)
+        for i, a_row in enumerate(a_rows):
+            start = i * p + j0
+            out[start:start + width] = array('d', [_dot(a_row, col) for col in block])
+    return out
+
+
+def matmul_blocked(a, b, n, m, p, tile=TILE_SIZE):
+    """Perkalian (n x m)(m x p) dengan Bᵀ yang dihitung sekali dan tiling kolom."""
+    bt = [b[j::p] for j in range(p)]
+    a_rows = [a[i * m:(i + 1) * m] for i in range(n)]
+    return _dot_rows(a_rows, bt, tile)
+
+
+def matmul_abt(a, b, n, m, p, tile=TILE_SIZE):
+    """A @ Bᵀ untuk A (n x m) dan B (p x m): dot product baris A dengan baris B."""
+    a_rows = [a[i * m:(i + 1) * m] for i in range(n)]
+    b_rows = a_rows if b is a else [b[j * m:(j + 1) * m] for j in range(p)]
+    return _dot_rows(a_rows, b_rows, tile)
+
+
+def matmul_atb(a, b, m, n, p):
+    """
+    Aᵀ @ B untuk A (m x n) dan B (m x p) tanpa membentuk Aᵀ: akumulasi
+    outer product baris demi baris. Jika ``b is a`` (matriks Gram AᵀA),
+    hanya segitiga atas yang dihitung lalu dicerminkan.
+    """
+    if b is a:
+        acc = [[0.0] * (n - i) for i in range(n)]
+        for k in range(m):
+            row = a[k * n:(k + 1) * n]
+            for i, aki in enumerate(row):
+                if aki:
+                    acc[i] = list(map(add, acc[i], map(aki.__mul__, row[i:])))
+        out = _zeros(n * n)
+        for i, upper in enumerate(acc):
+            out[i * n + i:(i + 1) * n] = array('d', upper)
+            out[i * n + i::n] = array('d', upper)
+        return out
+
+    acc = [[0.0] * p for _ in range(n)]
+    for k in range(m):
+        b_row = b[k * p:(k + 1) * p]
+        for i, aki in enumerate(a[k * n:(k + 1) * n]):
+            if aki:
+                acc[i] = list(map(add, acc[i], map(aki.__mul__, b_row)))
+    out = array('d')
+    for row in acc:
+        out.extend(row)
+    return out
+
+
+def _split(buf, n):
+    """Memecah matriks n x n (n genap) menjadi empat kuadran h x h."""
+    h = n // 2
+    q11, q12, q21, q22 = array('d'), array('d'), array('d'), array('d')
+    for i in range(h):
+        top, bottom = i * n, (i + h) * n
+        q11.extend(buf[top:top + h])
+        q12.extend(buf[top + h:top + n])
+        q21.extend(buf[bottom:bottom + h])
+        q22.extend(buf[bottom + h:bottom + n])
+    return q11, q12, q21, q22
+
+
+def _join(c11, c12, c21, c22, h):
+    out = array('d')
+    for left, right in ((c11, c12), (c21, c22)):
+        for i in range(0, h * h, h):
+            out.extend(left[i:i + h])
+            out.extend(right[i:i + h])
+    return out
+
+
+def _add(x, y):
+    return array('d', map(add, x, y))
+
+
+def _sub(x, y):
+    return array('d', map(sub, x, y))
+
+
+def _strassen(a, b, n, leaf):
+    if n <= leaf:
+        return matmul_blocked(a, b, n, n, n)
+
+    h = n // 2
+    a11, a12, a21, a22 = _split(a, n)
+    b11, b12, b21, b22 = _split(b, n)
+
+    m1 = _strassen(_add(a11, a22), _add(b11, b22), h, leaf)
+    m2 = _strassen(_add(a21, a22), b11, h, leaf)
+    m3 = _strassen(a11, _sub(b12, b22), h, leaf)
+    m4 = _strassen(a22, _sub(b21, b11), h, leaf)
+    m5 = _strassen(_add(a11, a12), b22, h, leaf)
+    m6 = _strassen(_sub(a21, a11), _add(b11, b12), h, leaf)
+    m7 = _strassen(_sub(a12, a22), _add(b21, b22), h, leaf)
+
+    c11 = _add(_sub(_add(m1, m4), m5), m7)
+    c12 = _add(m3, m5)
+    c21 = _add(m2, m4)
+    c22 = _add(_add(_sub(m1, m2), m3), m6)
+    return _join(c11, c12, c21, c22, h)
+
+
+def _pad(buf, rows, cols, size):
+    """Menyalin matriks rows x cols ke matriks nol size x size (kiri atas)."""
+    if rows == cols == size:
+        return buf
+    out = array('d')
+    filler = _zeros(size - cols)
+    for i in range(rows):
+        out.extend(buf[i * cols:(i + 1) * cols])
+        out.extend(filler)
+    out.extend(_zeros((size - rows) * size))
+    return out
+
+
+def matmul_strassen(a, b, n, m, p, leaf=STRASSEN_LEAF):
+    """Perkalian Strassen; operand di-padding ke ukuran persegi leaf·2^k."""
+    size, levels = max(n, m, p), 0
+    while -(-size // (1 << levels)) > leaf:
+        levels += 1
+    padded = -(-size // (1 << levels)) << levels
+
+    result = _strassen(_pad(a, n, m, padded), _pad(b, m, p, padded), padded, leaf)
+    if padded == n == p:
+        return result
+    out = array('d')
+    for i in range(n):
+        out.extend(result[i * padded:i * padded + p])
+    return out
+
+
+def matmul(a, b, n, m, p):
+    """Memilih kernel perkalian berdasarkan ukuran dan kepadatan operand."""
+    if n * m and a.count(0.0) >= SPARSE_RATIO * n * m:
+        return matmul_ikj(a, b, n, m, p)
+    if min(n, m, p) >= STRASSEN_THRESHOLD:
+        return matmul_strassen(a, b, n, m, p)
+    return matmul_blocked(a, b, n, m, p)
@@ -0,0 +1,100 @@
+# matriks/backends/registry.py
+"""
+Registry backend komputasi untuk ``matriks.operations``.
+
+Pemilihan backend (urutan prioritas):
+    1. Per panggilan: argumen ``backend=`` ("python", "numpy", "parallel",
+       "auto" atau objek backend)
+    2. Operand SparseMatrix → backend "sparse" (CSR)
+    3. Per proses: environment variable ``MATRIKS_BACKEND``
+    4. Otomatis berdasarkan ukuran: NumPy dipakai jika tersedia dan jumlah
+       elemen operand terbesar >= ``MATRIKS_AUTO_THRESHOLD`` (default 4096)
+"""
+import os
+from .python_backend import PythonBackend
+from .sparse_backend import SparseBackend
+from .parallel_backend import ParallelBackend
+
+ENV_BACKEND = "MATRIKS_BACKEND"
+ENV_AUTO_THRESHOLD = "MATRIKS_AUTO_THRESHOLD"
+DEFAULT_AUTO_THRESHOLD = 4096
+
+_backends = {}
+
+
+def register_backend(name, backend):
+    """Mendaftarkan objek backend dengan nama tertentu."""
+    _backends[name] = backend
+
+
+def available_backends():
+    """Daftar nama backend yang terdaftar."""
+    return sorted(_backends)
+
+
+def get_backend(name):
+    """Mengambil backend berdasarkan nama."""
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError(
+            f"Backend '{name}' tidak dikenal. Pilihan: {', '.join(available_backends())}."
+        )
+
+
+def auto_threshold():
+    """Ambang jumlah elemen untuk berpindah ke backend tervektorisasi."""
+    try:
+        return int(os.environ.get(ENV_AUTO_THRESHOLD, DEFAULT_AUTO_THRESHOLD))
+    except ValueError:
+        return DEFAULT_AUTO_THRESHOLD
+
+
+def check_out(out, rows, cols):
+    """Memvalidasi matriks tujuan ``out=`` untuk hasil berukuran rows x cols."""
+    if out is None:
+        return
+    if out.is_sparse or not out.is_numeric:
+        raise TypeError("Matriks out harus berupa Matrix padat numerik.")
+    if out.shape != (rows, cols):
+        raise ValueError(f"Ukuran matriks out harus {rows}x{cols}.")
+    # Isi out akan ditimpa → flag struktural yang di-memo tidak berlaku lagi
+    out.invalidate_properties()
+
+
+def resolve_backend(backend=None, *matrices):
+    """
+    Menentukan backend yang dipakai untuk satu operasi atas ``matrices``.
+    """
+    if backend is not None and not isinstance(backend, str):
+        return backend
+
+    name = (backend or os.environ.get(ENV_BACKEND) or "auto").lower()
+
+    # Operand SparseMatrix ditangani backend sparse kecuali backend dipilih eksplisit
+    if backend is None and any(m.is_sparse for m in matrices):
+        return _backends["sparse"]
+
+    # Data non-numerik hanya bisa ditangani backend Python
+    if any(not m.is_numeric for m in matrices):
+        return _backends["python"]
+
+    if name != "auto":
+        return get_backend(name)
+
+    size = max((m.rows * m.cols for m in matrices), default=0)
+    if "numpy" in _backends and size >= auto_threshold():
+        return _backends["numpy"]
+    return _backends["python"]
+
+
+register_backend("python", PythonBackend())
+register_backend("sparse", SparseBackend())
+register_backend("parallel", ParallelBackend())
+
+try:
+    from .numpy_backend import NumpyBackend
+except ImportError:  # NumPy tidak terpasang → hanya backend Python
+    pass
+else:
+    register_backend("numpy", NumpyBackend())
@@ -0,0 +1,188 @@
+# matriks/backends/sparse_backend.py
+from array import array
+from operator import add, sub, neg
+from ..matrix import Matrix
+from ..sparsematrix import SparseMatrix, auto_convert
+
+
+def _merge_rows(matrix1, matrix2, op):
+    """Penjumlahan/pengurangan dua CSR dengan menggabungkan indeks terurut per baris."""
+    indptr, indices, values = array('q', [0]), array('q'), array('d')
+    for i in range(matrix1.rows):
+        left = dict(matrix1.row_items(i))
+        for j, v in matrix2.row_items(i):
+            left[j] = op(left.get(j, 0.0), v)
+        for j in sorted(left):
+            if left[j] != 0:
+                indices.append(j)
+                values.append(left[j])
+        indptr.append(len(values))
+    return SparseMatrix.from_csr(indptr, indices, values, matrix1.rows, matrix1.cols)
+
+
+def _scatter(result, sparse, op):
+    """Menerapkan op(result[i][j], v) untuk setiap elemen non-nol sparse pada buffer padat."""
+    c = sparse.cols
+    for i in range(sparse.rows):
+        base = i * c
+        for j, v in sparse.row_items(i):
+            result[base + j] = op(result[base + j], v)
+    return Matrix.from_flat(result, sparse.rows, c)
+
+
+def _empty_sparse(rows, cols):
+    return SparseMatrix.from_csr(array('q', [0]) * (rows + 1), array('q'), array('d'), rows, cols)
+
+
+def _dense_backend(matrix):
+    # Impor lokal: registry mengimpor modul ini saat inisialisasi
+    from .registry import resolve_backend
+    return resolve_backend(None, matrix)
+
+
+class SparseBackend:
+    """
+    Backend untuk operand SparseMatrix (CSR).
+    Dipilih otomatis oleh registry bila salah satu operand sparse.
+    Hasil sparse yang menjadi terlalu padat dikonversi ke Matrix biasa
+    (lihat ``matriks.sparsematrix.DENSITY_THRESHOLD``).
+    """
+    name = "sparse"
+
+    def add(self, matrix1, matrix2, out=None):
+        if not (matrix1.is_sparse or matrix2.is_sparse):
+            return _dense_backend(matrix1).add(matrix1, matrix2, out)
+        if out is not None:
+            return out.assign(self.add(matrix1, matrix2))
+        if matrix1.is_sparse and matrix2.is_sparse:
+            return auto_convert(_merge_rows(matrix1, matrix2, add))
+        sparse, dense = (matrix1, matrix2) if matrix1.is_sparse else (matrix2, matrix1)
+        return _scatter(array('d', dense.buffer), sparse, add)
+
+    def subtract(self, matrix1, matrix2, out=None):
+        if not (matrix1.is_sparse or matrix2.is_sparse):
+            return _dense_backend(matrix1).subtract(matrix1, matrix2, out)
+        if out is not None:
+            return out.assign(self.subtract(matrix1, matrix2))
+        if matrix1.is_sparse and matrix2.is_sparse:
+            return auto_convert(_merge_rows(matrix1, matrix2, sub))
+        if matrix2.is_sparse:
+            return _scatter(array('d', matrix1.buffer), matrix2, sub)
+        # sparse - dense = (-dense) + sparse
+        return _scatter(array('d', map(neg, matrix2.buffer)), matrix1, add)
+
+    def multiply(self, matrix1, matrix2, out=None):
+        if not (matrix1.is_sparse or matrix2.is_sparse):
+            return _dense_backend(matrix1).multiply(matrix1, matrix2, out)
+        if out is not None:
+            return out.assign(self.multiply(matrix1, matrix2))
+        if matrix1.is_sparse and matrix2.is_sparse:
+            return auto_convert(self._spgemm(matrix1, matrix2))
+        if matrix1.is_sparse:
+            return self._spmm(matrix1, matrix2)
+        return self._dense_sparse(matrix1, matrix2)
+
+    def _spgemm(self, matrix1, matrix2):
+        """SpGEMM (algoritma Gustavson): akumulasi baris demi baris."""
+        indptr, indices, values = array('q', [0]), array('q'), array('d')
+        for i in range(matrix1.rows):
+            acc = {}
+            for k, a in matrix1.row_items(i):
+                for j, b in matrix2.row_items(k):
+                    acc[j] = acc.get(j, 0.0) + a * b
+            for j in sorted(acc):
+                if acc[j] != 0:
+                    indices.append(j)
+                    values.append(acc[j])
+            indptr.append(len(values))
+        return SparseMatrix.from_csr(indptr, indices, values, matrix1.rows, matrix2.cols)
+
+    def _spmm(self, sparse, dense):
+        """Sparse @ dense: baris hasil = Σ a_ik · baris k dari dense (SpMV bila 1 kolom)."""
+        p = dense.cols
+        buf = dense.buffer
+        if p == 1:
+            return Matrix.from_flat(sparse.dot(buf), sparse.rows, 1)
+        out = array('d')
+        for i in range(sparse.rows):
+            acc = [0.0] * p
+            for k, a in sparse.row_items(i):
+                acc = list(map(add, acc, map(a.__mul__, buf[k * p:(k + 1) * p])))
+            out.extend(acc)
+        return Matrix.from_flat(out, sparse.rows, p)
+
+    def _dense_sparse(self, dense, sparse):
+        """Dense @ sparse: untuk tiap a_ik ≠ 0, tambahkan a_ik · baris k dari sparse."""
+        m, p = dense.cols, sparse.cols
+        buf = dense.buffer
+        out = array('d', [0.0]) * (dense.rows * p)
+        for i in range(dense.rows):
+            base = i * p
+            for k, a in enumerate(buf[i * m:(i + 1) * m]):
+                if a:
+                    for j, v in sparse.row_items(k):
+                        out[base + j] += a * v
+        return Matrix.from_flat(out, dense.rows, p)
+
+    def scale(self, matrix, alpha, out=None):
+        if not matrix.is_sparse:
+            return _dense_backend(matrix).scale(matrix, alpha, out)
+        if out is not None:
+            return out.assign(self.scale(matrix, alpha))
+        values = array('d', map(float(alpha).__mul__, matrix.values))
+        return SparseMatrix.from_csr(matrix.indptr[:], matrix.indices[:], values, matrix.rows, matrix.cols).prune()
+
+    def axpy(self, alpha, x, y):
+        if not (x.is_sparse or y.is_sparse):
+            return _dense_backend(y).axpy(alpha, x, y)
+        if not y.is_sparse:
+            # y padat: tambahkan alpha·x hanya pada posisi non-nol x (di tempat)
+            alpha = float(alpha)
+            buf, c = y.buffer, y.cols
+            for i in range(x.rows):
+                base = i * c
+                for j, v in x.row_items(i):
+                    buf[base + j] += alpha * v
+            return y
+        result = self.add(y, self.scale(x, alpha))
+        if not result.is_sparse:
+            result = SparseMatrix.from_dense(result)
+        y._set_csr(result.indptr, result.indices, result.values, y.rows, y.cols)
+        return y
+
+    def transpose(self, matrix):
+        if not matrix.is_sparse:
+            return _dense_backend(matrix).transpose(matrix)
+        # CSR dari Aᵀ identik dengan CSC dari A
+        indptr, indices, values = matrix.tocsc()
+        return SparseMatrix.from_csr(indptr[:], indices[:], values[:], matrix.cols, matrix.rows)
+
+    def multiply_tn(self, matrix1, matrix2):
+        return self.multiply(self.transpose(matrix1), matrix2)
+
+    def multiply_nt(self, matrix1, matrix2):
+        return self.multiply(matrix1, self.transpose(matrix2))
+
+    def linear_combination(self, terms, rows, cols):
+        result = None
+        for sign, matrix, transposed in terms:
+            operand = self.transpose(matrix) if transposed else matrix
+            if result is None:
+                result = operand if sign > 0 else self.subtract(_empty_sparse(rows, cols), operand)
+            else:
+                result = (self.add if sign > 0 else self.subtract)(result, operand)
+        return result
+
+    def inverse(self, matrix):
+        # Invers matriks sparse umumnya padat → hitung di representasi padat
+        dense = matrix.to_dense() if matrix.is_sparse else matrix
+        return _dense_backend(dense).inverse(dense)
+
+    def solve(self, matrix, b):
+        dense = matrix.to_dense() if matrix.is_sparse else matrix
+        rhs = b.to_dense() if b.is_sparse else b
+        return _dense_backend(dense).solve(dense, rhs)
+
+    def determinant(self, matrix):
+        dense = matrix.to_dense() if matrix.is_sparse else matrix
+        return _dense_backend(dense).determinant(dense)
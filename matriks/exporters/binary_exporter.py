@@ -0,0 +1,53 @@
+# matriks/exporters/binary_exporter.py
+"""
+Enkoder format biner matriks (lihat ``matriks.importers.binary_importer``):
+``.npy`` v1 float64 little-endian C-order, atau ``MTRX`` ringkas. Body
+adalah byte buffer ``array('d')`` apa adanya (tanpa format teks per sel).
+"""
+import struct
+import sys
+from array import array
+from matriks.importers.binary_importer import NPY_MAGIC, MTRX_MAGIC
+
+NPY_MIMETYPE = "application/x-npy"
+MTRX_MIMETYPE = "application/x-matriks"
+
+
+def _little_endian_bytes(matrix):
+    buf = matrix.buffer
+    if not isinstance(buf, array) or buf.typecode != "d":
+        buf = array("d", buf)
+    if sys.byteorder == "big":
+        buf = array("d", buf)
+        buf.byteswap()
+    return buf.tobytes()
+
+
+def npy_header(rows, cols):
+    """Header .npy v1 (magic, versi, panjang, dict) dengan padding ke kelipatan 64."""
+    header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d, %d), }" % (rows, cols)
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = (header + " " * padding + "\n").encode("latin1")
+    return NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header
+
+
+def encode_matrix(matrix, fmt="npy"):
+    """Byte ``.npy`` (default) atau ``MTRX`` untuk Matrix numerik padat."""
+    if matrix.is_sparse:
+        matrix = matrix.to_dense()
+    if not matrix.is_numeric:
+        raise ValueError("Hanya matriks numerik yang bisa dikodekan biner.")
+    if fmt == "npy":
+        head = npy_header(matrix.rows, matrix.cols)
+    elif fmt == "mtrx":
+        head = struct.pack("<4sIII", MTRX_MAGIC, 1, matrix.rows, matrix.cols)
+    else:
+        raise ValueError(f"Format biner '{fmt}' tidak dikenal (npy/mtrx).")
+    return head + _little_endian_bytes(matrix)
+
+
+def export_to_npy(matriks, nama_file):
+    """Mengekspor matriks ke file .npy (bisa dibuka dengan numpy.load)."""
+    with open(nama_file, "wb") as f:
+        f.write(encode_matrix(matriks, "npy"))
+    print(f"Matriks berhasil diekspor ke {nama_file}")
@@ -0,0 +1,230 @@
+# matriks/expression.py
+"""
+Graf ekspresi lazy untuk aritmetika Matrix.
+
+Opt-in lewat ``Matrix.lazy()``; operator ``+``, ``-``, ``@`` dan ``.T`` hanya
+membangun DAG, baru dihitung saat ``evaluate()`` dipanggil. Evaluator:
+
+- menggabungkan rantai elementwise (A + B - C ...) menjadi satu lintasan
+- mengubah ``A.T @ B`` / ``A @ B.T`` menjadi kernel tanpa transpose
+  (dan ``A.T @ A`` menjadi perkalian Gram simetris)
+- menghilangkan subekspresi yang sama (CSE) lewat kunci struktural
+- memilih urutan perkalian rantai matriks dengan biaya minimum (DP)
+
+Contoh:
+    X, y = Xm.lazy(), ym.lazy()
+    XtX = (X.T @ X).evaluate()
+"""
+from .matrix import Matrix
+from .backends.registry import resolve_backend
+
+
+class Expr:
+    """Simpul DAG ekspresi matriks."""
+    __slots__ = ("op", "args", "rows", "cols", "key")
+
+    def __init__(self, op, args, rows, cols):
+        self.op = op
+        self.args = args
+        self.rows = rows
+        self.cols = cols
+        if op == "leaf":
+            self.key = ("leaf", id(args[0]))
+        else:
+            self.key = (op,) + tuple(arg.key for arg in args)
+
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    # ------------------------------------------------------------------
+    # Operator (hanya membangun graf)
+    # ------------------------------------------------------------------
+    def __add__(self, other):
+        other = as_expr(other)
+        if other is NotImplemented:
+            return other
+        _check_same_shape(self, other, "penjumlahan")
+        return Expr("add", (self, other), self.rows, self.cols)
+
+    def __radd__(self, other):
+        other = as_expr(other)
+        return other if other is NotImplemented else other.__add__(self)
+
+    def __sub__(self, other):
+        other = as_expr(other)
+        if other is NotImplemented:
+            return other
+        _check_same_shape(self, other, "pengurangan")
+        return Expr("sub", (self, other), self.rows, self.cols)
+
+    def __rsub__(self, other):
+        other = as_expr(other)
+        return other if other is NotImplemented else other.__sub__(self)
+
+    def __matmul__(self, other):
+        other = as_expr(other)
+        if other is NotImplemented:
+            return other
+        if self.cols != other.rows:
+            raise ValueError("Jumlah kolom matriks pertama harus sama dengan jumlah baris matriks kedua untuk perkalian.")
+        return Expr("matmul", (self, other), self.rows, other.cols)
+
+    def __rmatmul__(self, other):
+        other = as_expr(other)
+        return other if other is NotImplemented else other.__matmul__(self)
+
+    @property
+    def T(self):
+        if self.op == "T":  # (Aᵀ)ᵀ = A
+            return self.args[0]
+        return Expr("T", (self,), self.cols, self.rows)
+
+    def evaluate(self, backend=None):
+        """Menghitung ekspresi dan mengembalikan Matrix hasil."""
+        return _Evaluator(backend, _leaves(self)).run(self)
+
+    def __repr__(self):
+        if self.op == "leaf":
+            return f"Expr({self.args[0]!r})"
+        symbol = {"add": "+", "sub": "-", "matmul": "@"}.get(self.op)
+        if symbol:
+            return f"({self.args[0]!r} {symbol} {self.args[1]!r})"
+        return f"{self.args[0]!r}.T"
+
+
+def as_expr(value):
+    """Membungkus Matrix menjadi simpul daun; Expr dikembalikan apa adanya."""
+    if isinstance(value, Expr):
+        return value
+    if isinstance(value, Matrix):
+        return Expr("leaf", (value,), value.rows, value.cols)
+    return NotImplemented
+
+
+def _check_same_shape(left, right, operation):
+    if left.shape != right.shape:
+        raise ValueError(f"Matriks harus memiliki dimensi yang sama untuk {operation}.")
+
+
+def _leaves(root):
+    seen, stack, leaves = set(), [root], []
+    while stack:
+        node = stack.pop()
+        if node.key in seen:
+            continue
+        seen.add(node.key)
+        if node.op == "leaf":
+            leaves.append(node.args[0])
+        else:
+            stack.extend(node.args)
+    return leaves
+
+
+def _flatten_sum(node, sign, out):
+    """Meratakan pohon add/sub menjadi daftar (tanda, simpul)."""
+    if node.op == "add":
+        _flatten_sum(node.args[0], sign, out)
+        _flatten_sum(node.args[1], sign, out)
+    elif node.op == "sub":
+        _flatten_sum(node.args[0], sign, out)
+        _flatten_sum(node.args[1], -sign, out)
+    else:
+        out.append((sign, node))
+    return out
+
+
+def _flatten_product(node, out):
+    """Meratakan pohon matmul (asosiatif) menjadi daftar faktor."""
+    if node.op == "matmul":
+        _flatten_product(node.args[0], out)
+        _flatten_product(node.args[1], out)
+    else:
+        out.append(node)
+    return out
+
+
+def chain_order(dims):
+    """
+    Urutan perkalian rantai matriks optimal (pemrograman dinamis).
+    ``dims`` panjang k+1 untuk k faktor; mengembalikan tabel split[i][j].
+    """
+    k = len(dims) - 1
+    cost = [[0] * k for _ in range(k)]
+    split = [[0] * k for _ in range(k)]
+    for length in range(1, k):
+        for i in range(k - length):
+            j = i + length
+            cost[i][j] = None
+            for s in range(i, j):
+                c = cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if cost[i][j] is None or c < cost[i][j]:
+                    cost[i][j], split[i][j] = c, s
+    return split
+
+
+class _Evaluator:
+    """
+    Mengevaluasi DAG. Setiap nilai perantara berupa pasangan
+    (Matrix, transposed) sehingga transpose tidak pernah dibentuk
+    kecuali benar-benar dibutuhkan oleh hasil akhir.
+    """
+
+    def __init__(self, backend, leaves):
+        self.backend = resolve_backend(backend, *leaves)
+        self.memo = {}
+
+    def run(self, root):
+        matrix, transposed = self.value(root)
+        if transposed:
+            return self.backend.transpose(matrix)
+        return matrix
+
+    def value(self, node):
+        cached = self.memo.get(node.key)
+        if cached is not None:
+            return cached
+
+        if node.op == "leaf":
+            result = (node.args[0], False)
+        elif node.op == "T":
+            matrix, transposed = self.value(node.args[0])
+            result = (matrix, not transposed)
+        elif node.op in ("add", "sub"):
+            terms = [(sign,) + self.value(term) for sign, term in _flatten_sum(node, 1, [])]
+            result = (self.backend.linear_combination(terms, node.rows, node.cols), False)
+        else:
+            factors = _flatten_product(node, [])
+            dims = [f.rows for f in factors] + [factors[-1].cols]
+            split = chain_order(dims)
+            result = self._chain(factors, split, 0, len(factors) - 1)
+
+        self.memo[node.key] = result
+        return result
+
+    def _chain(self, factors, split, i, j):
+        if i == j:
+            return self.value(factors[i])
+
+        key = ("chain",) + tuple(f.key for f in factors[i:j + 1])
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+
+        s = split[i][j]
+        left = self._chain(factors, split, i, s)
+        right = self._chain(factors, split, s + 1, j)
+        result = self._product(left, right)
+        self.memo[key] = result
+        return result
+
+    def _product(self, left, right):
+        (a, ta), (b, tb) = left, right
+        if not ta and not tb:
+            return (self.backend.multiply(a, b), False)
+        if ta and not tb:
+            return (self.backend.multiply_tn(a, b), False)
+        if not ta and tb:
+            return (self.backend.multiply_nt(a, b), False)
+        # Aᵀ Bᵀ = (B A)ᵀ → simpan sebagai hasil tertranspose
+        return (self.backend.multiply(b, a), True)
@@ -0,0 +1,96 @@
+# matriks/importers/binary_importer.py
+"""
+Dekoder format biner matriks (dipakai upload /api/* dan impor file):
+
+- ``.npy`` (format NumPy v1–v3) berdimensi 1 atau 2, dtype float64/float32/
+  int64/int32 dalam byte order apa pun, C atau Fortran order
+- format ringkas ``MTRX``: magic b"MTRX", uint32 versi (1), uint32 baris,
+  uint32 kolom (semua little-endian), lalu baris x kolom float64 little-endian
+
+Body float64 langsung disalin ke ``array('d')`` dengan satu memcpy
+(``frombytes``) tanpa parsing per sel; NumPy tidak dibutuhkan.
+"""
+import ast
+import struct
+import sys
+from array import array
+from matriks.matrix import Matrix
+
+NPY_MAGIC = b"\x93NUMPY"
+MTRX_MAGIC = b"MTRX"
+_MTRX_HEADER = struct.Struct("<4sIII")
+
+# descr NumPy → typecode array (ukuran item sama di semua platform umum)
+_TYPECODES = {"f8": "d", "f4": "f", "i8": "q", "i4": "i", "u1": "B"}
+
+
+def _to_float64(body, typecode, big_endian, count):
+    if len(body) != count * array(typecode).itemsize:
+        raise ValueError("Panjang data biner tidak sesuai dengan ukuran matriks.")
+    values = array(typecode)
+    values.frombytes(body)
+    if big_endian != (sys.byteorder == "big") and values.itemsize > 1:
+        values.byteswap()
+    return values if typecode == "d" else array("d", values)
+
+
+def _decode_npy(view):
+    major = view[6]
+    if major == 1:
+        (length,), offset = struct.unpack_from("<H", view, 8), 10
+    elif major in (2, 3):
+        (length,), offset = struct.unpack_from("<I", view, 8), 12
+    else:
+        raise ValueError(f"Versi .npy {major} tidak didukung.")
+    try:
+        header = ast.literal_eval(bytes(view[offset:offset + length]).decode("latin1"))
+        descr, fortran, shape = header["descr"], header["fortran_order"], tuple(header["shape"])
+    except (ValueError, SyntaxError, KeyError, TypeError):
+        raise ValueError("Header .npy tidak valid.")
+
+    if not isinstance(descr, str) or descr[1:] not in _TYPECODES:
+        raise ValueError(f"dtype .npy '{descr}' tidak didukung (butuh float/int numerik).")
+    if len(shape) == 1:
+        rows, cols = shape[0], 1
+    elif len(shape) == 2:
+        rows, cols = shape
+    else:
+        raise ValueError("Array .npy harus berdimensi 1 atau 2.")
+
+    buf = _to_float64(view[offset + length:], _TYPECODES[descr[1:]], descr[0] == ">", rows * cols)
+    if fortran and rows > 1 and cols > 1:
+        # Kolom-major → susun ulang menjadi row-major
+        buf = array("d", (buf[i + j * rows] for i in range(rows) for j in range(cols)))
+    return Matrix.from_flat(buf, rows, cols)
+
+
+def _decode_mtrx(view):
+    if len(view) < _MTRX_HEADER.size:
+        raise ValueError("Header MTRX terpotong.")
+    _, version, rows, cols = _MTRX_HEADER.unpack_from(view)
+    if version != 1:
+        raise ValueError(f"Versi MTRX {version} tidak didukung.")
+    buf = _to_float64(view[_MTRX_HEADER.size:], "d", False, rows * cols)
+    return Matrix.from_flat(buf, rows, cols)
+
+
+def decode_matrix(data):
+    """Matrix dari byte ``.npy`` atau ``MTRX`` (format dikenali dari magic)."""
+    view = memoryview(data).cast("B")
+    if bytes(view[:6]) == NPY_MAGIC:
+        return _decode_npy(view)
+    if bytes(view[:4]) == MTRX_MAGIC:
+        return _decode_mtrx(view)
+    raise ValueError("Data biner bukan .npy maupun MTRX.")
+
+
+def is_binary_matrix(data):
+    return bytes(data[:6]) == NPY_MAGIC or bytes(data[:4]) == MTRX_MAGIC
+
+
+def import_from_npy(nama_file):
+    """Mengimpor matriks dari file .npy (atau MTRX)."""
+    with open(nama_file, "rb") as f:
+        matrix = decode_matrix(f.read())
+    print(f"Matriks berhasil diimpor dari {nama_file}")
+    return matrix
@@ -1,14 +1,47 @@
 # matriks/importers/csv_importer.py
 import csv
 from matriks.matrix import Matrix
+from matriks.sparsematrix import SparseMatrix
+from matriks.importers.tokenizer import iter_fields, convert_cell, parse_numeric
 
 def import_from_csv(nama_file):
-    """Mengimpor data matriks dari file CSV."""
-    data = []
-    with open(nama_file, 'r') as csvfile:
-        reader = csv.reader(csvfile)
-        for row in reader:
-            # ubah ke float bila memungkinkan
-            data.append([float(x) if x.replace('.', '', 1).isdigit() else x for x in row])
+    """Mengimpor data matriks dari file CSV (sel campuran angka/teks, header ikut)."""
+    with open(nama_file, 'r', newline='') as csvfile:
+        # ubah ke float bila memungkinkan (termasuk angka negatif/eksponen)
+        data = [[convert_cell(x) for x in row] for _, row in iter_fields(csvfile)]
     print(f"Matriks berhasil diimpor dari {nama_file}")
     return Matrix(data)
+
+def import_numeric_csv(nama_file, delimiter=None, header=None):
+    """
+    Mengimpor CSV numerik langsung ke buffer ``array('d')`` secara streaming.
+    Header (jika ada) disimpan di ``matrix.header``; nilai yang salah
+    dilaporkan dengan posisi baris dan kolom.
+    """
+    with open(nama_file, 'rb') as csvfile:
+        matrix = parse_numeric(csvfile, delimiter=delimiter, header=header)
+    print(f"Matriks berhasil diimpor dari {nama_file}")
+    return matrix
+
+def import_sparse_from_csv(nama_file, rows=None, cols=None):
+    """
+    Mengimpor SparseMatrix dari file CSV berformat triplet: baris,kolom,nilai
+    (indeks mulai dari 0). Baris header non-numerik dilewati. Data padat
+    tidak pernah dibentuk.
+    """
+    triplets = []
+    with open(nama_file, 'r') as csvfile:
+        reader = csv.reader(csvfile)
+        for nomor, row in enumerate(reader, start=1):
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            if len(row) != 3:
+                raise ValueError(f"Baris {nomor} harus berisi 3 kolom (baris,kolom,nilai).")
+            try:
+                triplets.append((int(row[0]), int(row[1]), float(row[2])))
+            except ValueError:
+                if nomor == 1:  # header
+                    continue
+                raise ValueError(f"Nilai tidak valid pada baris {nomor}: {row}")
+    print(f"Matriks sparse berhasil diimpor dari {nama_file}")
+    return SparseMatrix.from_triplets(triplets, rows, cols)
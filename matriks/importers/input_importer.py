@@ -1,5 +1,6 @@
 # matriks/importers/input_importer.py
 from matriks.matrix import Matrix
+from matriks.importers.tokenizer import parse_numeric, WHITESPACE
 
 def import_from_input(raw_input=None):
     """
@@ -12,17 +13,9 @@ def import_from_input(raw_input=None):
     # === MODE WEB ===
     if raw_input is not None:
         try:
-            # Pisahkan baris input berdasarkan newline
-            rows = raw_input.strip().split("\n")
-            data = []
-
-            for row in rows:
-                # Pisahkan elemen dengan koma atau spasi
-                elemen = [float(x) for x in row.replace(",", " ").split()]
-                data.append(elemen)
-
-            return Matrix(data)
-        except Exception as e:
+            # Elemen dipisah koma dan/atau spasi → dikonversi massal
+            return parse_numeric(raw_input.replace(",", " "), delimiter=WHITESPACE, header=False)
+        except ValueError as e:
             raise ValueError(f"Input manual tidak valid: {e}")
    # === MODE TERMINAL ===
     """Membuat matriks berdasarkan input pengguna."""
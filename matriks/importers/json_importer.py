@@ -1,6 +1,7 @@
 # matriks/importers/json_importer.py
 import json
 from matriks.matrix import Matrix
+from matriks.sparsematrix import SparseMatrix
 
 def import_from_json(nama_file):
     """Mengimpor data matriks dari file JSON (berformat list of lists)."""
@@ -13,3 +14,31 @@ def import_from_json(nama_file):
 
     print(f"Matriks berhasil diimpor dari {nama_file}")
     return Matrix(data)
+
+def import_sparse_from_json(nama_file):
+    """
+    Mengimpor SparseMatrix dari file JSON berformat triplet, salah satu dari:
+        {"shape": [r, c], "entries": [[i, j, v], ...]}
+        {"shape": [r, c], "row": [...], "col": [...], "values": [...]}
+    """
+    with open(nama_file, 'r') as f:
+        parsed = json.load(f)
+
+    if not isinstance(parsed, dict):
+        raise ValueError("Format JSON sparse tidak valid, harus berupa object.")
+    rows, cols = parsed.get("shape", (None, None))
+
+    if "entries" in parsed:
+        sparse = SparseMatrix.from_triplets(parsed["entries"], rows, cols)
+    elif all(k in parsed for k in ("row", "col", "values")):
+        sparse = SparseMatrix.from_coo(
+            [int(i) for i in parsed["row"]],
+            [int(j) for j in parsed["col"]],
+            [float(v) for v in parsed["values"]],
+            rows, cols,
+        )
+    else:
+        raise ValueError("Format JSON sparse tidak valid: butuh 'entries' atau 'row'/'col'/'values'.")
+
+    print(f"Matriks sparse berhasil diimpor dari {nama_file}")
+    return sparse
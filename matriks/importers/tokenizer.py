@@ -0,0 +1,259 @@
+# matriks/importers/tokenizer.py
+"""
+Tokenizer numerik streaming bersama untuk importer dan ``/api/*``.
+
+- Sumber: string, file teks, atau stream biner (mis. ``request.stream``)
+  yang dibaca per blok — tidak pernah ``read()`` utuh.
+- Delimiter (, ; tab | atau spasi) dan header dideteksi dari blok pertama.
+- Konversi massal: setelah jumlah sel tiap baris dicek, satu blok berisi
+  banyak baris di-``split`` sekali dan dikonversi dengan ``map(float, ...)``
+  langsung ke ``array('d')``.
+  Hanya blok yang gagal (baris kosong, kutip, nilai salah) yang diulang per
+  baris untuk mencari posisi tepat (baris, kolom) kesalahannya.
+"""
+import csv
+import io
+from array import array
+from itertools import chain, repeat
+from matriks.matrix import Matrix
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+WHITESPACE = " "
+
+_CANDIDATES = (",", ";", "\t", "|")
+_SNIFF_LINES = 20
+
+
+class ParseError(ValueError):
+    """Nilai tidak valid pada posisi ``row``/``col`` (dimulai dari 1, baris = baris file)."""
+
+    def __init__(self, message, row=None, col=None):
+        super().__init__(message)
+        self.row = row
+        self.col = col
+
+
+def _is_number(text):
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def _split(line, delimiter):
+    if delimiter == WHITESPACE:
+        return line.split()
+    if '"' in line:
+        return next(csv.reader([line], delimiter=delimiter), [])
+    fields = line.split(delimiter)
+    while fields and not fields[-1].strip():
+        fields.pop()  # delimiter di akhir baris
+    return fields
+
+
+def sniff(sample):
+    """
+    (delimiter, ada_header) dari potongan awal teks. Delimiter = kandidat
+    yang memberi kolom terbanyak (> 1) pada baris pertama, diutamakan yang
+    jumlahnya konsisten di baris-baris awal; jika tidak ada, spasi.
+    Header = baris pertama memuat sel non-numerik.
+    """
+    lines = [line for line in sample.splitlines() if line.strip()][:_SNIFF_LINES]
+    if len(lines) > 1 and not sample.endswith(("\n", "\r")):
+        lines = lines[:-1]  # baris terakhir mungkin terpotong batas blok
+    delimiter, best = WHITESPACE, (False, 1)
+    for candidate in _CANDIDATES:
+        counts = [len(_split(line, candidate)) for line in lines]
+        score = (len(set(counts)) == 1, counts[0] if counts else 0)
+        if score[1] > 1 and score > best:
+            delimiter, best = candidate, score
+    has_header = bool(lines) and not all(map(_is_number, _split(lines[0], delimiter)))
+    return delimiter, has_header
+
+
+def _text_stream(source):
+    """Sumber apa pun → objek teks yang bisa dibaca per blok."""
+    if isinstance(source, str):
+        return io.StringIO(source), None
+    if isinstance(source, (bytes, bytearray)):
+        return io.StringIO(bytes(source).decode("utf-8-sig")), None
+    if isinstance(source.read(0), bytes):
+        wrapper = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+        return wrapper, wrapper
+    return source, None
+
+
+def _blocks(text, block_size):
+    """(nomor baris pertama, teks berisi baris utuh) per blok."""
+    line_number, pending = 1, ""
+    while True:
+        chunk = text.read(block_size)
+        if not chunk:
+            break
+        chunk = pending + chunk
+        cut = chunk.rfind("\n") + 1
+        if not cut:
+            pending = chunk
+            continue
+        block, pending = chunk[:cut], chunk[cut:]
+        yield line_number, block
+        line_number += block.count("\n")
+    if pending:
+        yield line_number, pending
+
+
+class _Reader:
+    """Status parsing: delimiter, header dan jumlah kolom dari blok pertama."""
+
+    def __init__(self, delimiter, header):
+        self.delimiter = delimiter
+        self.header = header
+        self.cols = None
+        self.buf = array("d")
+        self.rows = 0
+
+    def _row(self, line_number, fields):
+        if self.cols is None:
+            self.cols = len(fields)
+        elif len(fields) != self.cols:
+            raise ParseError(
+                f"Baris {line_number} memiliki {len(fields)} kolom, seharusnya {self.cols}.",
+                line_number, None,
+            )
+        try:
+            self.buf.extend(map(float, fields))
+        except ValueError:
+            for col, value in enumerate(fields, start=1):
+                if not _is_number(value):
+                    raise ParseError(
+                        f"Nilai non-numerik '{value.strip()}' di baris {line_number}, kolom {col}.",
+                        line_number, col,
+                    )
+        self.rows += 1
+
+    def _slow(self, first_line, block):
+        """Per baris: melewati baris kosong dan menemukan posisi kesalahan."""
+        mark = len(self.buf), self.rows
+        try:
+            for offset, line in enumerate(block.splitlines()):
+                if line.strip():
+                    self._row(first_line + offset, _split(line, self.delimiter))
+        except ParseError:
+            del self.buf[mark[0]:]
+            self.rows = mark[1]
+            raise
+
+    def feed(self, first_line, block):
+        # Jalur cepat: jumlah sel dicek per baris (baris tak rata, kosong atau
+        # berkutip → jalur lambat), lalu seluruh blok dikonversi sekaligus
+        lines = block.splitlines()
+        if self.delimiter == WHITESPACE:
+            rows = list(map(str.split, lines))
+            uniform = set(map(len, rows)) == {self.cols}
+            fields = chain.from_iterable(rows)
+        else:
+            uniform = '"' not in block and set(map(str.count, lines, repeat(self.delimiter))) == {self.cols - 1}
+            fields = self.delimiter.join(lines).split(self.delimiter) if uniform else None
+        if uniform:
+            start = len(self.buf)
+            try:
+                self.buf.extend(map(float, fields))
+                self.rows += len(lines)
+                return
+            except ValueError:
+                del self.buf[start:]
+        self._slow(first_line, block)
+
+
+def parse_numeric(source, delimiter=None, header=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Mem-parse teks/stream berisi tabel angka menjadi Matrix ``array('d')``.
+    ``delimiter``/``header`` (True/False) dideteksi otomatis bila None; nama
+    header disimpan di ``matrix.header``. Kesalahan → ``ParseError`` dengan
+    posisi baris dan kolom.
+    """
+    text, wrapper = _text_stream(source)
+    try:
+        blocks = _blocks(text, block_size)
+        first = next(blocks, None)
+        if first is None or not first[1].strip():
+            raise ParseError("Data kosong.")
+        sniffed_delimiter, sniffed_header = sniff(first[1])
+        delimiter = delimiter or sniffed_delimiter
+        has_header = sniffed_header if header is None else header
+
+        reader = _Reader(delimiter, None)
+        line_number, block = first
+        if has_header:
+            lines = block.split("\n", 1)
+            while lines and not lines[0].strip() and len(lines) > 1:
+                line_number += 1
+                lines = lines[1].split("\n", 1)
+            reader.header = [h.strip().strip('"') for h in _split(lines[0].rstrip("\r"), delimiter)]
+            reader.cols = len(reader.header)
+            block = lines[1] if len(lines) > 1 else ""
+            line_number += 1
+        if reader.cols is None:
+            first_row = next((line for line in block.splitlines() if line.strip()), "")
+            reader.cols = len(_split(first_row, delimiter))
+        for start_line, chunk in chain([(line_number, block)], blocks):
+            if chunk:
+                reader.feed(start_line, chunk)
+    finally:
+        if wrapper is not None:
+            wrapper.detach()  # jangan ikut menutup stream milik pemanggil
+
+    if not reader.rows:
+        raise ParseError("Tidak ada baris data numerik.")
+    matrix = Matrix.from_flat(reader.buf, reader.rows, reader.cols)
+    if reader.header is not None:
+        matrix.header = reader.header
+    return matrix
+
+
+def convert_rows(rows):
+    """
+    List of lists (mis. dari JSON) → Matrix dengan konversi massal; posisi
+    (baris, kolom) dilaporkan bila ada nilai yang salah atau baris tak rata.
+    """
+    if not rows:
+        raise ParseError("Data kosong.")
+    reader = _Reader(None, None)
+    for row_number, row in enumerate(rows, start=1):
+        if not isinstance(row, (list, tuple)):
+            raise ParseError(f"Baris {row_number} bukan list.", row_number, None)
+        try:
+            reader._row(row_number, row)
+        except TypeError:
+            for col, value in enumerate(row, start=1):
+                if not isinstance(value, (int, float, str)) or not _is_number(value):
+                    raise ParseError(f"Nilai '{value}' di baris {row_number}, kolom {col} bukan angka.",
+                                     row_number, col)
+    return Matrix.from_flat(reader.buf, reader.rows, reader.cols)
+
+
+def iter_fields(source, delimiter=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    (nomor baris, list sel teks) per baris non-kosong, dengan deteksi
+    delimiter dari blok pertama — untuk importer yang butuh sel campuran.
+    """
+    text, wrapper = _text_stream(source)
+    try:
+        for first_line, block in _blocks(text, block_size):
+            if delimiter is None:
+                delimiter = sniff(block)[0]
+            for offset, line in enumerate(block.splitlines()):
+                if line.strip():
+                    yield first_line + offset, _split(line, delimiter)
+    finally:
+        if wrapper is not None:
+            wrapper.detach()
+
+
+def convert_cell(value):
+    """float bila sel berupa angka (termasuk negatif/eksponen), selain itu teks apa adanya."""
+    try:
+        return float(value)
+    except ValueError:
+        return value
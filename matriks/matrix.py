@@ -1,13 +1,246 @@
 # matriks/matrix.py
+import sys
+from array import array
+from itertools import chain
+
 
 class Matrix:
+    """
+    Matriks padat (dense) dengan penyimpanan datar (flat) row-major.
+
+    Semua elemen numerik disimpan dalam satu ``array('d')`` yang bersebelahan
+    di memori, bukan list of lists berisi objek float. Elemen (i, j) berada
+    pada indeks ``i * cols + j``. Jika data berisi nilai non-numerik
+    (misalnya baris header dari CSV), penyimpanan jatuh ke list datar biasa.
+
+    Atribut ``data``, ``rows`` dan ``cols`` tetap tersedia untuk kode lama;
+    ``data`` sekarang dibangun dari buffer setiap kali diakses (salinan).
+    """
+    __slots__ = ("_buf", "rows", "cols", "header", "_props", "__weakref__")
+    is_sparse = False
+
     def __init__(self, data):
         if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
             raise TypeError("Data harus berupa list of lists.")
 
-        self.data = data
-        self.rows = len(data)
-        self.cols = len(data[0]) if self.rows > 0 else 0
+        rows = len(data)
+        cols = len(data[0]) if rows > 0 else 0
 
-        if not all(len(row) == self.cols for row in data):
+        if not all(len(row) == cols for row in data):
             raise ValueError("Semua baris harus memiliki jumlah kolom yang sama.")
+
+        self.rows = rows
+        self.cols = cols
+        self._props = None
+        try:
+            self._buf = array('d', chain.from_iterable(data))
+        except TypeError:
+            # Ada nilai non-numerik (mis. string header) → simpan apa adanya
+            self._buf = list(chain.from_iterable(data))
+
+    # ------------------------------------------------------------------
+    # Konstruktor alternatif
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_flat(cls, buf, rows, cols):
+        """
+        Membuat Matrix langsung dari buffer datar row-major tanpa menyalin.
+        ``buf`` sebaiknya berupa ``array('d')``; list/iterable lain akan
+        dikonversi terlebih dahulu.
+        """
+        if not isinstance(buf, array) or buf.typecode != 'd':
+            buf = array('d', buf)
+        if len(buf) != rows * cols:
+            raise ValueError("Panjang buffer tidak sesuai dengan ukuran matriks.")
+        obj = cls.__new__(cls)
+        obj._buf = buf
+        obj.rows = rows
+        obj.cols = cols
+        obj._props = None
+        return obj
+
+    @classmethod
+    def zeros(cls, rows, cols):
+        """Membuat matriks nol berukuran rows x cols."""
+        return cls.from_flat(array('d', [0.0]) * (rows * cols), rows, cols)
+
+    @classmethod
+    def identity(cls, n):
+        """Membuat matriks identitas n x n."""
+        m = cls.zeros(n, n)
+        m._buf[::n + 1] = array('d', [1.0]) * n
+        return m
+
+    # ------------------------------------------------------------------
+    # Metadata bentuk
+    # ------------------------------------------------------------------
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    @property
+    def strides(self):
+        """Langkah (dalam byte) untuk berpindah satu baris / satu kolom."""
+        itemsize = self.itemsize
+        return (self.cols * itemsize, itemsize)
+
+    @property
+    def itemsize(self):
+        return self._buf.itemsize if self.is_numeric else 0
+
+    @property
+    def is_numeric(self):
+        """True jika data tersimpan di buffer float64 yang bersebelahan."""
+        return isinstance(self._buf, array)
+
+    @property
+    def buffer(self):
+        """Buffer datar row-major (``array('d')`` atau list untuk data non-numerik)."""
+        return self._buf
+
+    # ------------------------------------------------------------------
+    # Kompatibilitas: .data sebagai list of lists
+    # ------------------------------------------------------------------
+    @property
+    def data(self):
+        return self.tolist()
+
+    def tolist(self):
+        """Mengembalikan salinan isi matriks sebagai list of lists."""
+        buf, c = self._buf, self.cols
+        if isinstance(buf, array):
+            return [buf[i * c:(i + 1) * c].tolist() for i in range(self.rows)]
+        return [buf[i * c:(i + 1) * c] for i in range(self.rows)]
+
+    # ------------------------------------------------------------------
+    # Akses elemen dan view tanpa salinan
+    # ------------------------------------------------------------------
+    def __getitem__(self, index):
+        i, j = index
+        return self._buf[i * self.cols + j]
+
+    def __setitem__(self, index, value):
+        i, j = index
+        self._buf[i * self.cols + j] = value
+        self._props = None
+
+    def assign(self, source):
+        """Menyalin isi ``source`` ke buffer matriks ini (di tempat, tanpa buffer baru)."""
+        if source.shape != self.shape:
+            raise ValueError("Matriks harus memiliki dimensi yang sama untuk penyalinan.")
+        if source is not self:
+            self._buf[:] = source.buffer
+            self._props = None
+        return self
+
+    # ------------------------------------------------------------------
+    # Sifat struktural (di-memo, lihat matriks.properties)
+    # ------------------------------------------------------------------
+    def properties(self, rtol=None, atol=None):
+        """
+        Flag struktural (simetris, identitas, diagonal, segitiga, SPD) yang
+        dihitung sekali lalu di-memo sampai matriks diubah. Penulisan langsung
+        ke ``buffer``/view harus diikuti ``invalidate_properties()``.
+        """
+        from .properties import infer_properties, DEFAULT_RTOL, DEFAULT_ATOL
+        key = (DEFAULT_RTOL if rtol is None else rtol, DEFAULT_ATOL if atol is None else atol)
+        cache = self._props
+        if cache is None:
+            cache = self._props = {}
+        props = cache.get(key)
+        if props is None:
+            props = cache[key] = infer_properties(self, *key)
+        return props
+
+    def invalidate_properties(self):
+        """Membuang flag struktural yang di-memo (dipanggil setelah mutasi)."""
+        self._props = None
+
+    # ------------------------------------------------------------------
+    # Operator di tempat (in-place): A += B, A -= B, A @= B
+    # SparseMatrix tidak bisa menjadi ``out`` (pola nonzero-nya berubah),
+    # sehingga untuk operand kiri sparse nama di-rebind ke hasil baru.
+    # ------------------------------------------------------------------
+    def _inplace_out(self):
+        return None if self.is_sparse else self
+
+    def __iadd__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        from .operations.adder import add_matrices
+        return add_matrices(self, other, out=self._inplace_out())
+
+    def __isub__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        from .operations.subtractor import subtract_matrices
+        return subtract_matrices(self, other, out=self._inplace_out())
+
+    def __imatmul__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        from .operations.multiplier import multiply_matrices
+        return multiply_matrices(self, other, out=self._inplace_out())
+
+    def row(self, i):
+        """View baris ke-i (memoryview, tanpa salinan) pada matriks numerik."""
+        if not 0 <= i < self.rows:
+            raise IndexError("Indeks baris di luar jangkauan.")
+        start = i * self.cols
+        if isinstance(self._buf, array):
+            return memoryview(self._buf)[start:start + self.cols]
+        return self._buf[start:start + self.cols]
+
+    def col(self, j):
+        """View kolom ke-j (memoryview bertingkat/strided, tanpa salinan)."""
+        if not 0 <= j < self.cols:
+            raise IndexError("Indeks kolom di luar jangkauan.")
+        if isinstance(self._buf, array):
+            return memoryview(self._buf)[j::self.cols]
+        return self._buf[j::self.cols]
+
+    def iter_rows(self):
+        """Iterasi view setiap baris."""
+        for i in range(self.rows):
+            yield self.row(i)
+
+    def lazy(self):
+        """
+        Membungkus matriks sebagai simpul ekspresi lazy (lihat matriks.expression):
+        ``(A.lazy().T @ B + C).evaluate()``.
+        """
+        from .expression import as_expr
+        return as_expr(self)
+
+    # ------------------------------------------------------------------
+    # Buffer protocol / interoperabilitas NumPy
+    # ------------------------------------------------------------------
+    def memoryview(self):
+        """memoryview 2D (rows x cols) berformat 'd' di atas buffer yang sama."""
+        if not isinstance(self._buf, array):
+            raise TypeError("Matriks berisi data non-numerik, tidak punya buffer float.")
+        view = memoryview(self._buf)
+        if self.rows == 0 or self.cols == 0:
+            return view
+        return view.cast('B').cast('d', (self.rows, self.cols))
+
+    def __buffer__(self, flags):
+        # PEP 688 (Python 3.12+): memoryview(m) dan np.asarray(m) langsung
+        return self.memoryview()
+
+    @property
+    def __array_interface__(self):
+        # Python < 3.12: NumPy membungkus buffer lewat array interface (tanpa salinan)
+        if not isinstance(self._buf, array):
+            raise AttributeError("__array_interface__")
+        address, _ = self._buf.buffer_info()
+        return {
+            "version": 3,
+            "shape": (self.rows, self.cols),
+            "typestr": "<f8" if sys.byteorder == "little" else ">f8",
+            "data": (address, False),
+            "strides": None,
+        }
+
+    def __repr__(self):
+        return f"Matrix({self.rows}x{self.cols})"
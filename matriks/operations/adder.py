@@ -1,16 +1,14 @@
 # matriks/operations/adder.py
-from ..matrix import Matrix
+from ..backends.registry import resolve_backend, check_out
 
-def add_matrices(matrix1, matrix2):
+def add_matrices(matrix1, matrix2, backend=None, out=None):
     """
     Melakukan operasi penjumlahan pada dua objek matriks.
+    ``backend`` opsional: "python", "numpy" atau "auto" (lihat matriks.backends.registry).
+    ``out`` opsional: Matrix tujuan yang buffernya diisi ulang alih-alih membuat Matrix baru.
     """
     if matrix1.rows != matrix2.rows or matrix1.cols != matrix2.cols:
         raise ValueError("Matriks harus memiliki dimensi yang sama untuk penjumlahan.")
 
-    result_data = [[0 for _ in range(matrix1.cols)] for _ in range(matrix1.rows)]
-    for i in range(matrix1.rows):
-        for j in range(matrix1.cols):
-            result_data[i][j] = matrix1.data[i][j] + matrix2.data[i][j]
-
-    return Matrix(result_data)
+    check_out(out, matrix1.rows, matrix1.cols)
+    return resolve_backend(backend, matrix1, matrix2).add(matrix1, matrix2, out)
@@ -1,15 +1,12 @@
 # matriks/operations/determinant.py
-from ..matrix import Matrix
+from ..backends.registry import resolve_backend
 
-def find_determinant(matrix):
+def find_determinant(matrix, backend=None):
     """
-    Menghitung determinan dari sebuah matriks.
-    Fungsi ini hanya bekerja untuk matriks 2x2.
+    Menghitung determinan dari sebuah matriks persegi n x n
+    (backend python memakai dekomposisi LU dengan pivot parsial).
     """
-    # Periksa apakah matriks adalah matriks 2x2
-    if matrix.rows != 2 or matrix.cols != 2:
-        raise ValueError("Fungsi ini hanya mendukung matriks 2x2.")
+    if matrix.rows != matrix.cols:
+        raise ValueError("Matriks harus persegi untuk dihitung determinannya.")
 
-    # Hitung determinan (ad - bc)
-    determinant = (matrix.data[0][0] * matrix.data[1][1]) - (matrix.data[0][1] * matrix.data[1][0])
-    return determinant
+    return resolve_backend(backend, matrix).determinant(matrix)
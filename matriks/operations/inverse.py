@@ -1,38 +1,19 @@
 from matriks.matrix import Matrix
+from matriks.backends.registry import resolve_backend
+from matriks.operations.structured import diagonal_inverse
 
-def inverse(matrix: Matrix) -> Matrix:
-    """Mengembalikan invers dari objek Matrix (jika persegi dan tidak singular)."""
+def inverse(matrix: Matrix, backend=None) -> Matrix:
+    """
+    Mengembalikan invers dari objek Matrix (jika persegi dan tidak singular).
+    Identitas dan diagonal ditangani langsung (O(n)); struktur lain
+    (segitiga, SPD) dipilih oleh backend dari ``matrix.properties()``.
+    """
     if matrix.rows != matrix.cols:
         raise ValueError("Matriks harus persegi untuk dihitung inversnya.")
 
-    n = matrix.rows
-    A = [row[:] for row in matrix.data]
-    I = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
-
-    for i in range(n):
-        pivot = A[i][i]
-        if pivot == 0:
-            for k in range(i + 1, n):
-                if A[k][i] != 0:
-                    A[i], A[k] = A[k], A[i]
-                    I[i], I[k] = I[k], I[i]
-                    pivot = A[i][i]
-                    break
-            else:
-                raise ValueError("Matriks singular, tidak punya invers.")
-
-        # Normalisasi pivot
-        for j in range(n):
-            A[i][j] /= pivot
-            I[i][j] /= pivot
-
-        # Eliminasi baris lain
-        for k in range(n):
-            if k != i:
-                factor = A[k][i]
-                for j in range(n):
-                    A[k][j] -= factor * A[i][j]
-                    I[k][j] -= factor * I[i][j]
-
-    return Matrix(I)
-
+    props = matrix.properties()
+    if props.identity:
+        return Matrix.identity(matrix.rows)
+    if props.diagonal:
+        return diagonal_inverse(matrix)
+    return resolve_backend(backend, matrix).inverse(matrix)
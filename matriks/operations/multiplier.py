@@ -1,17 +1,38 @@
 # matriks/operations/multiplier.py
-from ..matrix import Matrix
+from ..backends.registry import resolve_backend, check_out
+from ..properties import diagonal
+from .structured import copy_matrix, diagonal_multiply
 
-def multiply_matrices(matrix1, matrix2):
+def multiply_matrices(matrix1, matrix2, backend=None, out=None):
     """
     Melakukan operasi perkalian pada dua objek matriks.
+    ``backend`` opsional: "python", "numpy" atau "auto" (lihat matriks.backends.registry).
+    ``out`` opsional: Matrix tujuan yang buffernya diisi ulang alih-alih membuat Matrix baru.
+    Operand identitas/diagonal (dari ``properties()``) tidak memicu perkalian penuh.
     """
     if matrix1.cols != matrix2.rows:
         raise ValueError("Jumlah kolom matriks pertama harus sama dengan jumlah baris matriks kedua untuk perkalian.")
 
-    result_data = [[0 for _ in range(matrix2.cols)] for _ in range(matrix1.rows)]
-    for i in range(matrix1.rows):
-        for j in range(matrix2.cols):
-            for k in range(matrix1.cols):
-                result_data[i][j] += matrix1.data[i][k] * matrix2.data[k][j]
+    check_out(out, matrix1.rows, matrix2.cols)
+    result = _structured_product(matrix1, matrix2, out)
+    if result is None:
+        result = resolve_backend(backend, matrix1, matrix2).multiply(matrix1, matrix2, out)
+    if out is not None:
+        # properties() di atas bisa membaca out sebelum ditimpa (A @= B)
+        out.invalidate_properties()
+    return result
 
-    return Matrix(result_data)
+def _structured_product(matrix1, matrix2, out):
+    """I @ B, A @ I, D @ B dan A @ D untuk operand padat numerik; None jika tidak berlaku."""
+    if matrix1.is_sparse or matrix2.is_sparse or not (matrix1.is_numeric and matrix2.is_numeric):
+        return None
+    props1, props2 = matrix1.properties(), matrix2.properties()
+    if props1.identity:
+        return copy_matrix(matrix2, out)
+    if props2.identity:
+        return copy_matrix(matrix1, out)
+    if props1.diagonal:
+        return diagonal_multiply(diagonal(matrix1), matrix2, True, out)
+    if props2.diagonal:
+        return diagonal_multiply(diagonal(matrix2), matrix1, False, out)
+    return None
@@ -0,0 +1,21 @@
+# matriks/operations/scaler.py
+from ..backends.registry import resolve_backend, check_out
+
+def scale(matrix, alpha, backend=None, out=None):
+    """
+    Mengalikan setiap elemen matriks dengan skalar alpha.
+    ``out`` opsional: Matrix tujuan (boleh matriks yang sama untuk operasi di tempat).
+    """
+    check_out(out, matrix.rows, matrix.cols)
+    return resolve_backend(backend, matrix).scale(matrix, alpha, out)
+
+def axpy(alpha, x, y, backend=None):
+    """
+    Operasi BLAS axpy: y ← alpha·x + y, ditulis langsung ke buffer y.
+    Mengembalikan y.
+    """
+    if x.rows != y.rows or x.cols != y.cols:
+        raise ValueError("Matriks harus memiliki dimensi yang sama untuk axpy.")
+
+    y.invalidate_properties()
+    return resolve_backend(backend, x, y).axpy(alpha, x, y)
@@ -0,0 +1,32 @@
+# matriks/operations/solve.py
+from ..matrix import Matrix
+from ..backends.registry import resolve_backend
+from .structured import diagonal_solve
+
+def solve(matrix, b, backend=None):
+    """
+    Menyelesaikan sistem linear Ax = b tanpa membentuk A⁻¹.
+    - b berupa list 1D  → mengembalikan list 1D
+    - b berupa Matrix (n x k) → mengembalikan Matrix (n x k)
+    Algoritma mengikuti ``matrix.properties()``: identitas/diagonal O(n·k),
+    segitiga → substitusi, SPD → Cholesky, selain itu LU.
+    """
+    if matrix.rows != matrix.cols:
+        raise ValueError("Matriks harus persegi untuk menyelesaikan sistem linear.")
+
+    vector = not isinstance(b, Matrix)
+    if vector:
+        if len(b) != matrix.rows:
+            raise ValueError("Panjang b harus sama dengan ukuran matriks.")
+        b = Matrix.from_flat(b, len(b), 1)
+    elif b.rows != matrix.rows:
+        raise ValueError("Jumlah baris b harus sama dengan ukuran matriks.")
+
+    props = matrix.properties()
+    if props.identity:
+        x = Matrix.from_flat(b.buffer[:], b.rows, b.cols)
+    elif props.diagonal:
+        x = diagonal_solve(matrix, b)
+    else:
+        x = resolve_backend(backend, matrix, b).solve(matrix, b)
+    return x.buffer.tolist() if vector else x
@@ -0,0 +1,212 @@
+# matriks/operations/structured.py
+"""
+Algoritma khusus untuk matriks berstruktur (flag dari ``Matrix.properties()``):
+
+- diagonal   : invers dan solve O(n), perkalian menjadi penskalaan baris/kolom
+- segitiga   : substitusi maju/mundur tanpa faktorisasi (± n²/2 per ruas kanan)
+- SPD        : Cholesky (± n³/6) alih-alih LU (± n³/3)
+
+Ruas kanan ditangani sebagai list baris seperti ``LUDecomposition._solve_rows``.
+"""
+import sys
+from array import array
+from itertools import chain
+from operator import add, sub, mul
+from ..matrix import Matrix
+from ..properties import diagonal
+
+_EPS = sys.float_info.epsilon
+
+
+def _dot(x, y):
+    return sum(map(mul, x, y))
+
+
+def _check_pivots(pivots, scale, n):
+    """Toleransi singular sama dengan LUDecomposition: n·eps·max|a|."""
+    if min(map(abs, pivots), default=1.0) <= n * _EPS * scale:
+        raise ValueError("Matriks singular, tidak punya invers.")
+
+
+def _transpose_rows(rows):
+    return [list(col) for col in zip(*rows)]
+
+
+# ----------------------------------------------------------------------
+# Diagonal
+# ----------------------------------------------------------------------
+def diagonal_inverse(matrix):
+    """Invers matriks diagonal: kebalikan tiap elemen diagonal, O(n)."""
+    n = matrix.rows
+    diag = diagonal(matrix)
+    _check_pivots(diag, max(map(abs, diag), default=0.0), n)
+    result = Matrix.zeros(n, n)
+    result.buffer[::n + 1] = array('d', (1.0 / d for d in diag))
+    return result
+
+
+def diagonal_solve(matrix, b):
+    """Menyelesaikan Dx = b dengan membagi tiap baris b, O(n·k)."""
+    diag = diagonal(matrix)
+    _check_pivots(diag, max(map(abs, diag), default=0.0), matrix.rows)
+    k, buf = b.cols, b.buffer
+    result = array('d', chain.from_iterable(
+        (v / d for v in buf[i * k:(i + 1) * k]) for i, d in enumerate(diag)
+    ))
+    return Matrix.from_flat(result, b.rows, k)
+
+
+def copy_matrix(matrix, out=None):
+    """Salinan matriks (hasil I @ M / M @ I) atau salin ke ``out``."""
+    if out is not None:
+        return out.assign(matrix)
+    return Matrix.from_flat(matrix.buffer[:], matrix.rows, matrix.cols)
+
+
+def diagonal_multiply(diag, matrix, left, out=None):
+    """
+    D @ M (``left=True``, skala tiap baris) atau M @ D (skala tiap kolom)
+    dalam O(rows·cols) tanpa perkalian matriks penuh.
+    """
+    rows, cols, buf = matrix.rows, matrix.cols, matrix.buffer
+    if left:
+        result = array('d', chain.from_iterable(
+            map(d.__mul__, buf[i * cols:(i + 1) * cols]) for i, d in enumerate(diag)
+        ))
+    else:
+        result = array('d', map(mul, buf, diag * rows))
+    if out is not None:
+        out.buffer[:] = result
+        return out
+    return Matrix.from_flat(result, rows, cols)
+
+
+# ----------------------------------------------------------------------
+# Segitiga
+# ----------------------------------------------------------------------
+def _forward(L, y):
+    """Substitusi maju Ly = b di tempat (y list baris, L list baris segitiga bawah)."""
+    for i in range(len(L)):
+        row, yi = L[i], y[i]
+        for j in range(i):
+            factor = row[j]
+            if factor:
+                yi = list(map(sub, yi, map(factor.__mul__, y[j])))
+        pivot = row[i]
+        y[i] = [v / pivot for v in yi]
+    return y
+
+
+def _backward(U, y):
+    """Substitusi mundur Ux = b di tempat (U list baris segitiga atas)."""
+    n = len(U)
+    for i in range(n - 1, -1, -1):
+        row, yi = U[i], y[i]
+        for j in range(i + 1, n):
+            factor = row[j]
+            if factor:
+                yi = list(map(sub, yi, map(factor.__mul__, y[j])))
+        pivot = row[i]
+        y[i] = [v / pivot for v in yi]
+    return y
+
+
+def _forward_vector(L, b):
+    y = list(b)
+    for i in range(len(L)):
+        row = L[i]
+        y[i] = (y[i] - _dot(row[:i], y[:i])) / row[i]
+    return y
+
+
+def _backward_vector(U, b):
+    y = list(b)
+    for i in range(len(U) - 1, -1, -1):
+        row = U[i]
+        y[i] = (y[i] - _dot(row[i + 1:], y[i + 1:])) / row[i]
+    return y
+
+
+def triangular_solve(matrix, b, lower):
+    """Menyelesaikan Tx = b untuk T segitiga bawah (``lower``) atau atas."""
+    T = matrix.tolist()
+    _check_pivots([T[i][i] for i in range(matrix.rows)],
+                  max(map(abs, matrix.buffer), default=0.0), matrix.rows)
+    if b.cols == 1:
+        solve = _forward_vector if lower else _backward_vector
+        return Matrix.from_flat(solve(T, b.buffer), b.rows, 1)
+    solve = _forward if lower else _backward
+    return Matrix(solve(T, b.tolist()))
+
+
+def _lower_inverse(L):
+    """
+    Invers segitiga bawah. Baris ke-i dari L⁻¹ hanya punya i+1 elemen
+    pertama yang tidak nol, jadi disimpan terpotong (± n³/6 perkalian).
+    """
+    inv = []
+    for i, row in enumerate(L):
+        acc = [0.0] * i + [1.0]
+        for j in range(i):
+            factor = row[j]
+            if factor:
+                acc[:j + 1] = map(sub, acc[:j + 1], map(factor.__mul__, inv[j]))
+        pivot = row[i]
+        inv.append([v / pivot for v in acc])
+    return inv
+
+
+def _pad(rows, n):
+    return [row + [0.0] * (n - len(row)) for row in rows]
+
+
+def triangular_inverse(matrix, lower):
+    """Invers matriks segitiga; segitiga atas lewat (U⁻¹) = ((Uᵀ)⁻¹)ᵀ."""
+    n = matrix.rows
+    T = matrix.tolist()
+    _check_pivots([T[i][i] for i in range(n)], max(map(abs, matrix.buffer), default=0.0), n)
+    if lower:
+        return Matrix(_pad(_lower_inverse(T), n))
+    return Matrix(_transpose_rows(_pad(_lower_inverse(_transpose_rows(T)), n)))
+
+
+# ----------------------------------------------------------------------
+# SPD (Cholesky, A = LLᵀ)
+# ----------------------------------------------------------------------
+def _check_cholesky(L, matrix):
+    # Pivot LU setara dengan L[i][i]²
+    _check_pivots([L[i][i] ** 2 for i in range(len(L))],
+                  max(map(abs, matrix.buffer), default=0.0), len(L))
+
+
+def cholesky_solve(L, matrix, b):
+    """Menyelesaikan Ax = b dari faktor Cholesky: Ly = b lalu Lᵀx = y."""
+    _check_cholesky(L, matrix)
+    Lt = _transpose_rows(L)
+    if b.cols == 1:
+        x = _backward_vector(Lt, _forward_vector(L, b.buffer))
+        return Matrix.from_flat(x, b.rows, 1)
+    return Matrix(_backward(Lt, _forward(L, b.tolist())))
+
+
+def cholesky_inverse(L, matrix):
+    """
+    A⁻¹ = L⁻ᵀL⁻¹. L⁻¹ dihitung terpotong, lalu hasil kali Gram-nya hanya
+    mengisi segitiga atas (simetris) lewat akumulasi outer product per baris.
+    """
+    _check_cholesky(L, matrix)
+    n = len(L)
+    inv = _lower_inverse(L)
+    result = [[0.0] * n for _ in range(n)]
+    for r in inv:
+        k = len(r)
+        for a in range(k):
+            ra = r[a]
+            if ra:
+                target = result[a]
+                target[a:k] = map(add, target[a:k], map(ra.__mul__, r[a:]))
+    for a in range(n):
+        row = result[a]
+        for b in range(a):
+            row[b] = result[b][a]
+    return Matrix(result)
@@ -1,9 +1,6 @@
 from matriks.matrix import Matrix
+from matriks.backends.registry import resolve_backend
 
-def transpose(matrix: Matrix) -> Matrix:
+def transpose(matrix: Matrix, backend=None) -> Matrix:
     """Mengembalikan transpose dari objek Matrix."""
-    transposed_data = [
-        [matrix.data[i][j] for i in range(matrix.rows)]
-        for j in range(matrix.cols)
-    ]
-    return Matrix(transposed_data)
+    return resolve_backend(backend, matrix).transpose(matrix)
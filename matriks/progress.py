@@ -0,0 +1,36 @@
+# matriks/progress.py
+"""
+Titik laporan progres (dan pembatalan) untuk kode komputasi.
+
+Modul inti (korelasi, resampling, regresi streaming) memanggil
+``report_progress(fraksi, pesan)`` di titik aman tanpa tahu siapa yang
+mendengarkan. Pemanggil memasang hook untuk thread-nya sendiri lewat
+``progress_hook`` (mis. ``services.jobs`` untuk job latar belakang); tanpa
+hook fungsi ini tidak melakukan apa-apa. Hook boleh melempar exception
+untuk menghentikan pekerjaan yang dibatalkan.
+"""
+import threading
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+def report_progress(fraction=None, message=None):
+    """
+    Melaporkan progres pekerjaan di thread ini (0..1, atau None bila total
+    tidak diketahui). No-op bila tidak ada hook terpasang.
+    """
+    hook = getattr(_local, "hook", None)
+    if hook is not None:
+        hook(fraction, message)
+
+
+@contextmanager
+def progress_hook(hook):
+    """Memasang ``hook(fraction, message)`` untuk thread ini selama blok ``with``."""
+    previous = getattr(_local, "hook", None)
+    _local.hook = hook
+    try:
+        yield
+    finally:
+        _local.hook = previous
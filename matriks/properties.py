@@ -0,0 +1,172 @@
+# matriks/properties.py
+"""
+Inferensi sifat struktural matriks (simetris, identitas, diagonal,
+segitiga atas/bawah, definit positif simetris/SPD).
+
+Semua flag kecuali SPD dideteksi dalam satu lintasan setengah segitiga:
+untuk tiap baris i, bagian kanan diagonal (a[i][j], j > i) dibandingkan
+dengan bagian bawah diagonal di kolom yang sama (a[j][i]); lintasan
+berhenti lebih awal begitu semua flag gugur.
+
+Flag segitiga/diagonal/identitas memicu jalur cepat yang mengabaikan
+elemen di luar pola, sehingga hanya berlaku untuk nol (dan diagonal 1)
+yang persis. Toleransi ``|x - y| <= atol·max|a| + rtol·max(|x|, |y|)``
+(relatif terhadap skala matriks) hanya dipakai untuk flag ``symmetric``
+(pelaporan). Cholesky hanya membaca segitiga bawah, jadi SPD/Cholesky
+mensyaratkan simetri persis (``exact_symmetric``); matriks yang hanya
+"hampir" simetris diselesaikan dengan LU.
+
+Hasil di-memo di Matrix (``Matrix.properties()``) dan dibuang setiap kali
+matriks diubah lewat ``__setitem__``, ``assign``, ``out=`` atau ``axpy``.
+SPD dicek secara malas (butuh faktorisasi Cholesky) dan faktornya
+disimpan untuk dipakai ulang oleh ``solve``/``inverse``.
+"""
+import weakref
+from array import array
+from math import sqrt
+from operator import mul
+
+DEFAULT_RTOL = 1e-9
+DEFAULT_ATOL = 1e-12
+
+
+def _close(x, y, rtol, atol):
+    return abs(x - y) <= atol + rtol * max(abs(x), abs(y))
+
+
+def _all_zero(values):
+    return not any(values)
+
+
+def diagonal(matrix):
+    """Elemen diagonal utama sebagai array('d')."""
+    if matrix.is_sparse:
+        return array('d', (matrix.get_value(i, i) for i in range(matrix.rows)))
+    return matrix.buffer[::matrix.cols + 1]
+
+
+class MatrixProperties:
+    """Flag struktural sebuah matriks (hasil ``infer_properties``)."""
+
+    def __init__(self, matrix, square, symmetric, upper_triangular, lower_triangular,
+                 unit_diagonal, rtol, atol, exact_symmetric=None):
+        self.square = square
+        self.symmetric = symmetric
+        self.exact_symmetric = symmetric if exact_symmetric is None else exact_symmetric
+        self.upper_triangular = upper_triangular
+        self.lower_triangular = lower_triangular
+        self.diagonal = upper_triangular and lower_triangular
+        self.identity = self.diagonal and unit_diagonal
+        self.rtol = rtol
+        self.atol = atol
+        self._matrix = weakref.ref(matrix)
+        self._cholesky = None
+        self._spd = None
+
+    @property
+    def spd(self):
+        """Simetris definit positif (diuji dengan mencoba faktorisasi Cholesky)."""
+        if self._spd is None:
+            matrix = self._matrix()
+            # Syarat perlu yang murah dulu: simetris persis dan diagonal positif
+            if matrix is not None and self.exact_symmetric and min(diagonal(matrix), default=0.0) > 0:
+                self._cholesky = cholesky_factor(matrix)
+            self._spd = self._cholesky is not None
+        return self._spd
+
+    @property
+    def cholesky(self):
+        """Faktor Cholesky L (list baris, A = LLᵀ) bila SPD, selain itu None."""
+        return self._cholesky if self.spd else None
+
+    def as_dict(self):
+        return {
+            "square": self.square,
+            "symmetric": self.symmetric,
+            "exact_symmetric": self.exact_symmetric,
+            "diagonal": self.diagonal,
+            "identity": self.identity,
+            "upper_triangular": self.upper_triangular,
+            "lower_triangular": self.lower_triangular,
+        }
+
+    def __repr__(self):
+        flags = [name for name, value in self.as_dict().items() if value]
+        return f"MatrixProperties({', '.join(flags) or '-'})"
+
+
+def infer_properties(matrix, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL):
+    """Mendeteksi flag struktural dalam satu lintasan setengah segitiga."""
+    n = matrix.rows
+    if n != matrix.cols or not matrix.is_numeric:
+        return MatrixProperties(matrix, n == matrix.cols, False, False, False, False, rtol, atol)
+
+    if matrix.is_sparse:
+        return _infer_sparse(matrix, rtol, atol)
+
+    buf = matrix.buffer
+    # atol relatif terhadap skala matriks: entri kecil tidak dianggap "sama"
+    atol = atol * max(map(abs, buf), default=0.0)
+    symmetric = exact = upper = lower = True
+    for i in range(n):
+        right = buf[i * n + i + 1:(i + 1) * n]       # a[i][j], j > i
+        below = buf[(i + 1) * n + i::n]              # a[j][i], j > i
+        if symmetric and right != below:
+            exact = False
+            symmetric = all(_close(x, y, rtol, atol) for x, y in zip(right, below))
+        if upper:
+            upper = _all_zero(below)
+        if lower:
+            lower = _all_zero(right)
+        if not (symmetric or upper or lower):
+            break
+
+    unit_diagonal = upper and lower and all(d == 1.0 for d in buf[::n + 1])
+    return MatrixProperties(matrix, True, symmetric, upper, lower, unit_diagonal, rtol, atol,
+                            exact_symmetric=exact and symmetric)
+
+
+def _infer_sparse(matrix, rtol, atol):
+    """Versi CSR: pola indeks kolom per baris + perbandingan CSR dengan CSC (= CSR dari Aᵀ)."""
+    indptr, indices, values = matrix.indptr, matrix.indices, matrix.values
+    upper = lower = True
+    for i in range(matrix.rows):
+        start, end = indptr[i], indptr[i + 1]
+        if start == end:
+            continue
+        # indeks kolom terurut → cukup cek elemen pertama dan terakhir
+        upper = upper and indices[start] >= i
+        lower = lower and indices[end - 1] <= i
+        if not (upper or lower):
+            break
+
+    atol = atol * max(map(abs, values), default=0.0)
+    t_indptr, t_indices, t_values = matrix.tocsc()
+    same_pattern = indptr == t_indptr and indices == t_indices
+    exact = same_pattern and values == t_values
+    symmetric = exact or (same_pattern and all(_close(x, y, rtol, atol) for x, y in zip(values, t_values)))
+    unit_diagonal = upper and lower and all(d == 1.0 for d in diagonal(matrix))
+    return MatrixProperties(matrix, True, symmetric, upper, lower, unit_diagonal, rtol, atol,
+                            exact_symmetric=exact)
+
+
+def cholesky_factor(matrix):
+    """
+    Faktorisasi Cholesky A = LLᵀ (± n³/6 perkalian).
+    Mengembalikan L sebagai list baris, atau None jika A tidak definit positif.
+    """
+    n = matrix.rows
+    a = matrix.tolist()
+    L = [[0.0] * n for _ in range(n)]
+    for j in range(n):
+        row_j = L[j]
+        head = row_j[:j]
+        d = a[j][j] - sum(map(mul, head, head))
+        if d <= 0:
+            return None
+        diag = sqrt(d)
+        row_j[j] = diag
+        for i in range(j + 1, n):
+            row_i = L[i]
+            row_i[j] = (a[i][j] - sum(map(mul, row_i[:j], head))) / diag
+    return L
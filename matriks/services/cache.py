@@ -0,0 +1,241 @@
+# matriks/services/cache.py
+"""
+Cache hasil berbasis isi (content-addressed) untuk endpoint /api.
+
+Kunci = SHA-256 dari (operasi, operand yang dikanonikkan, parameter):
+Matrix numerik di-hash dari bentuk + byte buffer float64-nya, file upload
+di-hash per blok tanpa dibaca utuh ke memori. Kunci yang sama juga dipakai
+sebagai ETag.
+
+Dua tingkat:
+    1. LRU di dalam proses (dibatasi total byte, bukan jumlah entri)
+    2. SQLite lokal bersama (mode WAL) sehingga semua worker gunicorn
+       berbagi hasil; entri yang paling lama tidak diakses dibuang saat
+       total ukuran melewati batas
+
+Konfigurasi lewat environment variable:
+    MATRIKS_CACHE            "0" untuk mematikan cache
+    MATRIKS_CACHE_DB         path file SQLite (default: <tmp>/matriks_cache.sqlite)
+    MATRIKS_CACHE_MEMORY_MB  batas tingkat memori (default 64)
+    MATRIKS_CACHE_DISK_MB    batas tingkat SQLite (default 512)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from ..matrix import Matrix
+
+ENV_ENABLED = "MATRIKS_CACHE"
+ENV_DB = "MATRIKS_CACHE_DB"
+ENV_MEMORY_MB = "MATRIKS_CACHE_MEMORY_MB"
+ENV_DISK_MB = "MATRIKS_CACHE_DISK_MB"
+
+_HASH_BLOCK = 1 << 20
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _update(digest, part):
+    """Memasukkan satu bagian kunci ke hash dalam bentuk kanonik (bertipe)."""
+    if isinstance(part, Matrix):
+        digest.update(b"M%d,%d;" % part.shape)
+        if part.is_numeric:
+            buf = part.buffer
+            digest.update(buf.tobytes() if hasattr(buf, "tobytes") else memoryview(buf))
+        else:
+            digest.update(json.dumps(part.tolist(), default=str).encode())
+        header = getattr(part, "header", None)
+        if header is not None:
+            _update(digest, list(header))
+    elif isinstance(part, (bytes, bytearray, memoryview)):
+        digest.update(b"B%d;" % len(part))
+        digest.update(part)
+    elif hasattr(part, "read") and hasattr(part, "seek"):
+        # File upload: hash per blok lalu kembalikan posisi baca ke awal
+        position = part.tell()
+        digest.update(b"F")
+        for block in iter(lambda: part.read(_HASH_BLOCK), b""):
+            digest.update(block if isinstance(block, bytes) else block.encode())
+        part.seek(position)
+        digest.update(b";")
+    else:
+        digest.update(b"J")
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        digest.update(b";")
+
+
+def make_key(operation, *parts):
+    """Kunci cache: hex SHA-256 dari operasi dan bagian-bagiannya."""
+    digest = hashlib.sha256(operation.encode() + b"\0")
+    for part in parts:
+        _update(digest, part)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Cache dua tingkat untuk payload JSON. Nilai disimpan sebagai byte JSON
+    ringkas sehingga ukurannya (untuk eviksi) diketahui pasti.
+    """
+
+    def __init__(self, db_path=None, memory_bytes=None, disk_bytes=None, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get(ENV_ENABLED, "1") != "0"
+        self.enabled = enabled
+        self.db_path = db_path or os.environ.get(ENV_DB) or os.path.join(
+            tempfile.gettempdir(), "matriks_cache.sqlite"
+        )
+        self.memory_bytes = memory_bytes if memory_bytes is not None else _env_int(ENV_MEMORY_MB, 64) << 20
+        self.disk_bytes = disk_bytes if disk_bytes is not None else _env_int(ENV_DISK_MB, 512) << 20
+
+        self._lru = OrderedDict()
+        self._lru_size = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    # ------------------------------------------------------------------
+    # Tingkat SQLite
+    # ------------------------------------------------------------------
+    def _db(self):
+        """Koneksi SQLite per thread dan per proses (aman setelah fork gunicorn)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+                " size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed)")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _disk_get(self, key):
+        try:
+            db = self._db()
+            row = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+                return row[0]
+        except sqlite3.Error:
+            pass  # cache bersama bersifat opsional; kegagalan = miss
+        return None
+
+    def _disk_set(self, key, blob):
+        try:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.disk_bytes:
+                self._disk_evict(db, total - self.disk_bytes)
+        except sqlite3.Error:
+            pass
+
+    def _disk_evict(self, db, excess):
+        """Membuang entri yang paling lama tidak diakses sampai ``excess`` byte terbebas."""
+        freed, victims = 0, []
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY accessed"):
+            if freed >= excess:
+                break
+            victims.append((key,))
+            freed += size
+        db.executemany("DELETE FROM results WHERE key = ?", victims)
+        self._count("evictions", len(victims))
+
+    def _count(self, name, amount=1):
+        """Penghitung diperbarui di bawah lock (banyak thread per worker)."""
+        with self._lock:
+            self.counters[name] += amount
+
+    # ------------------------------------------------------------------
+    # Tingkat memori (LRU berbatas byte)
+    # ------------------------------------------------------------------
+    def _memory_set(self, key, blob):
+        if len(blob) > self.memory_bytes:
+            return
+        with self._lock:
+            old = self._lru.pop(key, None)
+            if old is not None:
+                self._lru_size -= len(old)
+            self._lru[key] = blob
+            self._lru_size += len(blob)
+            while self._lru_size > self.memory_bytes:
+                _, evicted = self._lru.popitem(last=False)
+                self._lru_size -= len(evicted)
+                self.counters["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # API publik
+    # ------------------------------------------------------------------
+    def get(self, key):
+        """Payload untuk ``key`` (memori lalu SQLite), atau None jika miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            blob = self._lru.get(key)
+            if blob is not None:
+                self._lru.move_to_end(key)
+                self.counters["memory_hits"] += 1
+        if blob is None:
+            blob = self._disk_get(key)
+            if blob is None:
+                self._count("misses")
+                return None
+            self._count("disk_hits")
+            self._memory_set(key, blob)
+        return json.loads(blob)
+
+    def set(self, key, payload):
+        if not self.enabled:
+            return
+        blob = json.dumps(payload, separators=(",", ":")).encode()
+        self._memory_set(key, blob)
+        self._disk_set(key, blob)
+        self._count("stores")
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            self._lru_size = 0
+        try:
+            self._db().execute("DELETE FROM results")
+        except sqlite3.Error:
+            pass
+
+    def stats(self):
+        """Penghitung hit/miss proses ini beserta ukuran kedua tingkat."""
+        disk_entries = disk_size = 0
+        if self.enabled:
+            try:
+                disk_entries, disk_size = self._db().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()
+            except sqlite3.Error:
+                pass
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["memory_hits"] + counters["disk_hits"] + counters["misses"]
+        hits = lookups - counters["misses"]
+        return dict(
+            counters,
+            hit_ratio=hits / lookups if lookups else 0.0,
+            memory_entries=len(self._lru),
+            memory_bytes=self._lru_size,
+            disk_entries=disk_entries,
+            disk_bytes=disk_size,
+        )
@@ -0,0 +1,179 @@
+# matriks/services/jobs.py
+"""
+Antrean job latar belakang untuk request berat (invers besar, regresi,
+korelasi). Request mengirim pekerjaan ke pool worker berbatas dan langsung
+mendapat ``job_id``; klien lalu mem-polling status/progres dan mengambil
+hasilnya, atau membatalkannya.
+
+Pool memakai thread di dalam proses web: kernel NumPy/BLAS melepas GIL dan
+worker HTTP tetap bebas melayani polling. Job hanya dikenal oleh proses yang
+membuatnya, jadi jalankan satu proses gunicorn (perbanyak ``--threads``,
+bukan ``-w``) atau pasang sticky session.
+
+Kode komputasi memanggil ``matriks.progress.report_progress(fraksi)`` di
+titik aman; selama job berjalan antrean ini memasang hook yang mencatat
+progres dan menghentikan pekerjaan yang sudah dibatalkan (``JobCancelled``).
+Di luar job fungsi itu tidak melakukan apa-apa.
+
+Konfigurasi:
+    MATRIKS_JOB_WORKERS      jumlah thread pool (default 2)
+    MATRIKS_JOB_MAX_PENDING  batas job antre + berjalan (default 32)
+    MATRIKS_JOB_TTL          detik hasil disimpan setelah selesai (default 3600)
+    MATRIKS_INLINE_COST      perkiraan biaya (≈ flop) maksimum jalur inline (default 5e7)
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from ..progress import progress_hook
+
+ENV_WORKERS = "MATRIKS_JOB_WORKERS"
+ENV_MAX_PENDING = "MATRIKS_JOB_MAX_PENDING"
+ENV_TTL = "MATRIKS_JOB_TTL"
+ENV_INLINE_COST = "MATRIKS_INLINE_COST"
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return cast(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def inline_cost():
+    """Ambang biaya: di bawahnya request dihitung langsung tanpa job."""
+    return _env_number(ENV_INLINE_COST, 5e7, float)
+
+
+class JobCancelled(Exception):
+    """Dilempar ``report_progress`` saat job yang sedang berjalan dibatalkan."""
+
+
+class QueueFull(RuntimeError):
+    """Jumlah job antre + berjalan sudah mencapai batas."""
+
+
+def _job_progress(job, fraction=None, message=None):
+    """Hook ``report_progress`` untuk job yang sedang berjalan di thread ini."""
+    if job.cancel_requested:
+        raise JobCancelled(job.job_id)
+    if fraction is not None:
+        job.progress = min(max(float(fraction), 0.0), 1.0)
+    if message is not None:
+        job.message = message
+
+
+class Job:
+    """Status satu job; ``result`` berisi payload JSON setelah selesai."""
+
+    def __init__(self, operation, cost=None):
+        self.job_id = uuid.uuid4().hex
+        self.operation = operation
+        self.cost = cost
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = None
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_requested = False
+        self.future = None
+
+    def to_dict(self):
+        return {
+            "job_id": self.job_id,
+            "operation": self.operation,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class JobQueue:
+    """Pool worker berbatas beserta tabel job (dibuang ``ttl`` detik setelah selesai)."""
+
+    def __init__(self, workers=None, max_pending=None, ttl=None):
+        self.workers = workers or max(1, _env_number(ENV_WORKERS, 2))
+        self.max_pending = max_pending or max(1, _env_number(ENV_MAX_PENDING, 32))
+        self.ttl = ttl if ttl is not None else _env_number(ENV_TTL, 3600)
+        self._executor = None
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        # Dipanggil di bawah self._lock: submit pertama yang bersamaan tidak membuat dua pool
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="matriks-job")
+        return self._executor
+
+    def _prune(self):
+        limit = time.time() - self.ttl
+        for job_id in [j.job_id for j in self._jobs.values() if j.finished and j.finished < limit]:
+            del self._jobs[job_id]
+
+    def _run(self, job, fn, args, kwargs):
+        with self._lock:
+            if job.cancel_requested:
+                return
+            job.status, job.started = RUNNING, time.time()
+        try:
+            with progress_hook(partial(_job_progress, job)):
+                job.result = fn(*args, **kwargs)
+            job.status, job.progress = DONE, 1.0
+        except JobCancelled:
+            job.status = CANCELLED
+        except Exception as e:
+            job.status, job.error = FAILED, str(e)
+        finally:
+            job.finished = time.time()
+
+    def submit(self, operation, fn, *args, cost=None, **kwargs):
+        """Menjadwalkan ``fn(*args, **kwargs)``; mengembalikan ``Job`` baru."""
+        with self._lock:
+            self._prune()
+            active = sum(1 for j in self._jobs.values() if j.status in (QUEUED, RUNNING))
+            if active >= self.max_pending:
+                raise QueueFull("Antrean job penuh, coba lagi nanti.")
+            job = Job(operation, cost)
+            self._jobs[job.job_id] = job
+            job.future = self._pool().submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Job '{job_id}' tidak ditemukan.")
+        return job
+
+    def cancel(self, job_id):
+        """
+        Membatalkan job: job antre langsung dibatalkan, job berjalan berhenti
+        pada ``report_progress`` berikutnya. Job yang selesai tidak berubah.
+        """
+        job = self.get(job_id)
+        with self._lock:
+            if job.status in (QUEUED, RUNNING):
+                job.cancel_requested = True
+            if job.status == QUEUED:
+                if job.future is not None:
+                    job.future.cancel()
+                job.status, job.finished = CANCELLED, time.time()
+        return job
+
+    def stats(self):
+        with self._lock:
+            counts = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {"workers": self.workers, "max_pending": self.max_pending, "jobs": counts}
@@ -0,0 +1,350 @@
+# matriks/services/matrix_store.py
+"""
+Penyimpanan matriks di sisi server yang dirujuk lewat *handle*.
+
+Operand di-upload (dan di-parse) sekali lalu dipakai ulang oleh endpoint
+``/api/*`` mana pun lewat handle-nya; hasil operasi juga bisa disimpan
+sebagai handle baru tanpa dikirim balik ke klien. Handle = hash isi
+(32 hex), sehingga upload atau hasil yang sama selalu mendapat handle yang
+sama dan tidak disimpan dua kali.
+
+Dua tingkat:
+    1. Memori: Matrix ``array('d')`` dengan anggaran total byte; entri yang
+       paling lama tidak diakses dikeluarkan (LRU) saat anggaran terlampaui
+    2. Disk (opsional): entri yang dikeluarkan ditulis sekali sebagai file
+       MTRX; akses berikutnya memetakan file (mmap) dan menyalin body
+       float64 langsung ke buffer tanpa parsing, lalu kembali ke memori
+
+Tiap entri punya TTL yang diperpanjang setiap kali diakses. Karena handle
+dipakai bersama oleh semua klien yang mengirim isi yang sama, setiap ``put``
+(dan setiap hit cache yang mengembalikan handle, lewat ``acquire``) menambah
+hitungan referensi; ``delete`` hanya mengurangi satu referensi. ``get``
+mengembalikan salinan sehingga operasi ``out=``/``+=`` milik satu pemanggil
+tidak mengubah matriks tersimpan.
+
+Tabel handle hanya dikenal oleh proses yang membuatnya (seperti antrean
+job): jalankan satu proses gunicorn dengan beberapa thread. File spill
+ditulis ke subdirektori per PID; subdirektori milik proses yang sudah mati
+dibersihkan saat store dibuat.
+
+Konfigurasi:
+    MATRIKS_STORE_MEMORY_MB  anggaran tingkat memori (default 256)
+    MATRIKS_STORE_SPILL      "0" untuk mematikan spill ke disk
+    MATRIKS_STORE_DIR        direktori file spill (default: <tmp>/matriks_store)
+    MATRIKS_STORE_DISK_MB    anggaran tingkat disk (default 2048)
+    MATRIKS_STORE_TTL        detik entri disimpan sejak akses terakhir (default 3600)
+"""
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from .cache import make_key
+from ..matrix import Matrix
+from ..exporters.binary_exporter import encode_matrix
+from ..importers.binary_importer import decode_matrix
+
+ENV_MEMORY_MB = "MATRIKS_STORE_MEMORY_MB"
+ENV_SPILL = "MATRIKS_STORE_SPILL"
+ENV_DIR = "MATRIKS_STORE_DIR"
+ENV_DISK_MB = "MATRIKS_STORE_DISK_MB"
+ENV_TTL = "MATRIKS_STORE_TTL"
+
+_HANDLE_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def is_handle(value):
+    return isinstance(value, str) and bool(_HANDLE_PATTERN.match(value))
+
+
+class StoreFull(RuntimeError):
+    """Matriks lebih besar dari anggaran penyimpanan yang tersedia."""
+
+
+class _Entry:
+    """Satu matriks tersimpan; ``matrix`` None bila hanya ada di disk."""
+
+    __slots__ = ("handle", "matrix", "rows", "cols", "header", "nbytes", "path",
+                 "ttl", "created", "accessed", "refs")
+
+    def __init__(self, handle, matrix, ttl):
+        self.handle = handle
+        self.matrix = matrix
+        self.rows, self.cols = matrix.shape
+        self.header = getattr(matrix, "header", None)
+        self.nbytes = matrix.rows * matrix.cols * 8
+        self.path = None
+        self.ttl = ttl
+        self.refs = 1
+        self.created = self.accessed = time.time()
+
+    @property
+    def expires(self):
+        return self.accessed + self.ttl
+
+    def to_dict(self):
+        return {
+            "handle": self.handle,
+            "rows": self.rows,
+            "cols": self.cols,
+            "header": self.header,
+            "bytes": self.nbytes,
+            "tier": "memory" if self.matrix is not None else "disk",
+            "refs": self.refs,
+            "created": self.created,
+            "expires": self.expires,
+        }
+
+
+class MatrixStore:
+    """Tabel handle → matriks dengan anggaran memori LRU, spill mmap dan TTL."""
+
+    def __init__(self, memory_bytes=None, directory=None, disk_bytes=None, ttl=None, spill=None):
+        self.memory_bytes = memory_bytes if memory_bytes is not None else _env_int(ENV_MEMORY_MB, 256) << 20
+        self.disk_bytes = disk_bytes if disk_bytes is not None else _env_int(ENV_DISK_MB, 2048) << 20
+        self.ttl = ttl if ttl is not None else _env_int(ENV_TTL, 3600)
+        if spill is None:
+            spill = os.environ.get(ENV_SPILL, "1") != "0"
+        self.spill = spill
+        self.base_directory = directory or os.environ.get(ENV_DIR) or os.path.join(
+            tempfile.gettempdir(), "matriks_store"
+        )
+        self.directory = os.path.join(self.base_directory, str(os.getpid()))
+        if self.spill:
+            self._sweep()
+            os.makedirs(self.directory, exist_ok=True)
+
+        self._entries = OrderedDict()  # urutan = LRU (paling lama diakses di depan)
+        self._memory_size = 0
+        self._disk_size = 0
+        self._lock = threading.RLock()
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0,
+                         "spills": 0, "evictions": 0, "expired": 0}
+
+    # ------------------------------------------------------------------
+    # Tingkat disk
+    # ------------------------------------------------------------------
+    def _sweep(self):
+        """Menghapus file spill milik proses yang sudah tidak berjalan (dan PID ini)."""
+        if not os.path.isdir(self.base_directory):
+            return
+        for name in os.listdir(self.base_directory):
+            path = os.path.join(self.base_directory, name)
+            if not name.isdigit() or not os.path.isdir(path):
+                continue
+            pid = int(name)
+            if pid != os.getpid():
+                try:
+                    os.kill(pid, 0)
+                    continue  # proses lain masih hidup
+                except ProcessLookupError:
+                    pass
+                except OSError:
+                    continue  # ada, tetapi milik pengguna lain
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _path(self, handle):
+        return os.path.join(self.directory, f"{handle}.mtrx")
+
+    def _spill(self, entry):
+        """Melepas matriks dari memori; file ditulis hanya bila belum ada."""
+        if entry.path is None:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(encode_matrix(entry.matrix, "mtrx"))
+            entry.path = self._path(entry.handle)
+            os.replace(tmp, entry.path)
+            self._disk_size += entry.nbytes
+            self.counters["spills"] += 1
+        entry.matrix = None
+        self._memory_size -= entry.nbytes
+
+    def _load(self, entry):
+        with open(entry.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            matrix = decode_matrix(mapped)
+        if entry.header is not None:
+            matrix.header = entry.header
+        return matrix
+
+    # ------------------------------------------------------------------
+    # Eviksi
+    # ------------------------------------------------------------------
+    def _drop(self, entry):
+        del self._entries[entry.handle]
+        if entry.matrix is not None:
+            self._memory_size -= entry.nbytes
+        if entry.path is not None:
+            self._disk_size -= entry.nbytes
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _prune(self):
+        now = time.time()
+        for entry in [e for e in self._entries.values() if e.expires < now]:
+            self._drop(entry)
+            self.counters["expired"] += 1
+
+    def _enforce(self, keep=None):
+        """Memindahkan entri LRU ke disk (atau membuangnya) sampai anggaran terpenuhi."""
+        for entry in list(self._entries.values()):
+            if self._memory_size <= self.memory_bytes:
+                break
+            if entry.matrix is None or entry.handle == keep:
+                continue
+            if self.spill and entry.nbytes <= self.disk_bytes:
+                self._spill(entry)
+            else:
+                self._drop(entry)
+                self.counters["evictions"] += 1
+        for entry in list(self._entries.values()):
+            if self._disk_size <= self.disk_bytes:
+                break
+            if entry.matrix is None and entry.handle != keep:
+                self._drop(entry)
+                self.counters["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # API publik
+    # ------------------------------------------------------------------
+    def put(self, matrix, handle=None, ttl=None):
+        """
+        Menyimpan salinan Matrix numerik dan mengembalikan handle-nya (default:
+        hash isi). Matriks yang sudah tersimpan hanya mendapat satu referensi
+        tambahan, waktu aksesnya diperbarui dan TTL-nya dinaikkan ke ``ttl``
+        bila lebih panjang.
+        """
+        if not matrix.is_numeric:
+            raise ValueError("Hanya matriks numerik yang bisa disimpan.")
+        handle = handle or make_key("matrix", matrix)[:32]
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(handle)
+            if entry is not None:
+                entry.refs += 1
+                entry.accessed = time.time()
+                if ttl:
+                    # TTL lebih panjang dari pemilik lain → kedaluwarsa diperpanjang
+                    entry.ttl = max(entry.ttl, ttl)
+                self._entries.move_to_end(handle)
+                return handle
+
+            entry = _Entry(handle, self._copy(matrix), ttl or self.ttl)
+            if entry.nbytes > self.memory_bytes:
+                if not self.spill or entry.nbytes > self.disk_bytes:
+                    raise StoreFull(f"Matriks {entry.rows}x{entry.cols} melebihi anggaran penyimpanan.")
+                # Terlalu besar untuk memori: langsung ke disk
+                self._entries[handle] = entry
+                self._memory_size += entry.nbytes
+                self._spill(entry)
+            else:
+                self._entries[handle] = entry
+                self._memory_size += entry.nbytes
+            self._enforce(keep=handle)
+            self.counters["stores"] += 1
+        return handle
+
+    @staticmethod
+    def _copy(matrix):
+        copy = Matrix.from_flat(matrix.buffer[:], matrix.rows, matrix.cols)
+        header = getattr(matrix, "header", None)
+        if header is not None:
+            copy.header = list(header)
+        return copy
+
+    def get(self, handle):
+        """
+        Salinan Matrix untuk ``handle`` (satu memcpy buffer); ``KeyError``
+        bila tidak ada atau kedaluwarsa.
+        """
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(handle)
+            if entry is None:
+                self.counters["misses"] += 1
+                raise KeyError(f"Handle matriks '{handle}' tidak ditemukan atau kedaluwarsa.")
+            entry.accessed = time.time()
+            self._entries.move_to_end(handle)
+            matrix = entry.matrix
+            if matrix is not None:
+                self.counters["memory_hits"] += 1
+                return self._copy(matrix)
+            matrix = self._load(entry)
+            self.counters["disk_hits"] += 1
+            if entry.nbytes <= self.memory_bytes:
+                # Kembali ke memori; file tetap ada sehingga eviksi berikutnya gratis
+                entry.matrix = matrix
+                self._memory_size += entry.nbytes
+                self._enforce(keep=handle)
+                return self._copy(matrix)
+            return matrix
+
+    def acquire(self, handle):
+        """
+        Menambah satu referensi ke handle yang sudah ada (mis. handle dari
+        hasil cache yang diberikan ke klien lain). False bila sudah hilang.
+        """
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(handle)
+            if entry is None:
+                return False
+            entry.refs += 1
+            entry.accessed = time.time()
+            self._entries.move_to_end(handle)
+            return True
+
+    def info(self, handle):
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(handle)
+            if entry is None:
+                raise KeyError(f"Handle matriks '{handle}' tidak ditemukan atau kedaluwarsa.")
+            return entry.to_dict()
+
+    def __contains__(self, handle):
+        with self._lock:
+            self._prune()
+            return handle in self._entries
+
+    def delete(self, handle):
+        """Melepas satu referensi; entri dibuang saat referensinya habis. Mengembalikan sisa referensi."""
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                raise KeyError(f"Handle matriks '{handle}' tidak ditemukan atau kedaluwarsa.")
+            entry.refs -= 1
+            if entry.refs <= 0:
+                self._drop(entry)
+            return max(entry.refs, 0)
+
+    def clear(self):
+        with self._lock:
+            for entry in list(self._entries.values()):
+                self._drop(entry)
+
+    def stats(self):
+        with self._lock:
+            self._prune()
+            in_memory = sum(1 for e in self._entries.values() if e.matrix is not None)
+            return dict(
+                self.counters,
+                entries=len(self._entries),
+                memory_entries=in_memory,
+                memory_bytes=self._memory_size,
+                memory_budget=self.memory_bytes,
+                disk_entries=sum(1 for e in self._entries.values() if e.path is not None),
+                disk_bytes=self._disk_size,
+                disk_budget=self.disk_bytes if self.spill else 0,
+            )
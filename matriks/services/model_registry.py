@@ -0,0 +1,206 @@
+# matriks/services/model_registry.py
+"""
+Registry model regresi yang disimpan di disk lokal.
+
+Setiap fit menghasilkan ``model_id`` (hash isi dari β, nama kolom dan
+target — fit yang sama selalu mendapat ID yang sama). Satu file kecil per
+model: metadata JSON dengan β disimpan sebagai float64 little-endian dalam
+base64 (tepat, tanpa pembulatan teks). Model yang sudah dimuat di-cache di
+memori sehingga scoring tidak pernah membaca disk, refit atau membuat plot.
+
+Konfigurasi:
+    MATRIKS_MODEL_DIR   direktori penyimpanan (default: <tmp>/matriks_models)
+"""
+import base64
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import chain
+from ..matrix import Matrix
+from ..operations.multiplier import multiply_matrices
+
+ENV_MODEL_DIR = "MATRIKS_MODEL_DIR"
+MEMORY_MODELS = 256
+SCORE_CHUNK_SIZE = 10_000
+
+_ID_PATTERN = re.compile(r"^[0-9a-f]{16}$")
+
+
+def _encode(values):
+    buf = array('d', values)
+    if sys.byteorder != "little":
+        buf.byteswap()
+    return base64.b64encode(buf.tobytes()).decode("ascii")
+
+
+def _decode(text):
+    buf = array('d')
+    buf.frombytes(base64.b64decode(text))
+    if sys.byteorder != "little":
+        buf.byteswap()
+    return buf
+
+
+class RegressionModel:
+    """Model OLS tersimpan: β (p), nama kolom X, nama target dan statistik latih."""
+
+    def __init__(self, model_id, beta, columns, target=None, stats=None):
+        self.model_id = model_id
+        self.beta = beta if isinstance(beta, array) else array('d', beta)
+        self.columns = list(columns)
+        self.target = target
+        self.stats = stats or {}
+        self._beta_matrix = Matrix.from_flat(self.beta, len(self.beta), 1)
+
+    def predict(self, rows, backend=None):
+        """
+        Skor tervektorisasi untuk list baris (atau Matrix) berurutan sesuai
+        ``columns``: satu perkalian matriks (n x p) @ (p x 1).
+        """
+        X = rows if isinstance(rows, Matrix) else Matrix(rows)
+        if X.cols != len(self.beta):
+            raise ValueError(f"Model {self.model_id} butuh {len(self.beta)} kolom, diterima {X.cols}.")
+        if X.rows == 0:
+            return []
+        return multiply_matrices(X, self._beta_matrix, backend=backend).buffer.tolist()
+
+    def predict_records(self, records, backend=None):
+        """Skor untuk list dict {nama kolom: nilai}."""
+        try:
+            rows = [[float(record[c]) for c in self.columns] for record in records]
+        except KeyError as e:
+            raise ValueError(f"Kolom {e} tidak ada pada data yang diskor.")
+        return self.predict(rows, backend)
+
+    def predict_csv(self, source, chunk_size=SCORE_CHUNK_SIZE, backend=None):
+        """
+        Skor seluruh CSV per potongan. Kolom dicocokkan dengan nama header;
+        jika header tidak memuat kolom model, CSV tanpa header dengan tepat
+        p kolom dipakai sesuai urutan.
+        """
+        if isinstance(source.read(0), bytes):
+            source = io.TextIOWrapper(source, encoding="utf-8", newline="")
+        reader = csv.reader(source)
+        first = next(reader, None)
+        if first is None:
+            return []
+
+        names = [h.strip() for h in first]
+        pending = []
+        if all(c in names for c in self.columns):
+            index = [names.index(c) for c in self.columns]
+        elif len(first) == len(self.columns):
+            index = list(range(len(first)))
+            pending.append(first)
+        else:
+            raise ValueError("Header CSV tidak memuat semua kolom model.")
+
+        predictions, chunk = [], []
+        for row_number, row in enumerate(chain(pending, reader), start=1 if pending else 2):
+            if not row:
+                continue
+            try:
+                chunk.append([float(row[j]) for j in index])
+            except (ValueError, IndexError):
+                raise ValueError(f"Baris {row_number} tidak valid untuk model ini.")
+            if len(chunk) >= chunk_size:
+                predictions += self.predict(chunk, backend)
+                chunk = []
+        if chunk:
+            predictions += self.predict(chunk, backend)
+        return predictions
+
+    def to_dict(self):
+        return {
+            "model_id": self.model_id,
+            "columns": self.columns,
+            "target": self.target,
+            "beta": self.beta.tolist(),
+            "stats": self.stats,
+        }
+
+
+class ModelRegistry:
+    """Menyimpan dan memuat ``RegressionModel`` (file per model + cache LRU memori)."""
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.environ.get(ENV_MODEL_DIR) or os.path.join(
+            tempfile.gettempdir(), "matriks_models"
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, model_id):
+        if not _ID_PATTERN.match(model_id or ""):
+            raise ValueError(f"ID model '{model_id}' tidak valid.")
+        return os.path.join(self.directory, f"{model_id}.json")
+
+    def _remember(self, model):
+        with self._lock:
+            self._models[model.model_id] = model
+            self._models.move_to_end(model.model_id)
+            while len(self._models) > MEMORY_MODELS:
+                self._models.popitem(last=False)
+
+    def save(self, beta, columns, target=None, stats=None):
+        """Menyimpan model dan mengembalikan ``model_id``-nya."""
+        beta = array('d', beta)
+        columns = list(columns)
+        if len(columns) != len(beta):
+            raise ValueError("Jumlah nama kolom harus sama dengan jumlah koefisien β.")
+        digest = hashlib.sha256(beta.tobytes())
+        digest.update(json.dumps([columns, target]).encode())
+        model_id = digest.hexdigest()[:16]
+
+        record = {
+            "columns": columns,
+            "target": target,
+            "beta": _encode(beta),
+            "stats": stats or {},
+        }
+        path = self._path(model_id)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f, separators=(",", ":"))
+        os.replace(tmp, path)  # atomik: worker lain tidak pernah membaca file setengah jadi
+
+        self._remember(RegressionModel(model_id, beta, columns, target, record["stats"]))
+        return model_id
+
+    def load(self, model_id):
+        with self._lock:
+            model = self._models.get(model_id)
+            if model is not None:
+                self._models.move_to_end(model_id)
+                return model
+        try:
+            with open(self._path(model_id), encoding="utf-8") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"Model '{model_id}' tidak ditemukan.")
+        model = RegressionModel(model_id, _decode(record["beta"]), record["columns"],
+                                record.get("target"), record.get("stats"))
+        self._remember(model)
+        return model
+
+    def exists(self, model_id):
+        with self._lock:
+            if model_id in self._models:
+                return True
+        try:
+            return os.path.exists(self._path(model_id))
+        except ValueError:
+            return False
+
+    def list_ids(self):
+        return sorted(name[:-5] for name in os.listdir(self.directory)
+                      if name.endswith(".json") and _ID_PATTERN.match(name[:-5]))
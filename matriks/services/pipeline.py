@@ -0,0 +1,277 @@
+# matriks/services/pipeline.py
+"""
+Eksekusi program matriks multi-langkah (DAG kecil) dalam satu request.
+
+Spesifikasi (JSON)::
+
+    {
+      "inputs":  {"A": ..., "B": ...},
+      "steps": [
+        {"id": "Ai", "op": "inverse",  "args": ["A"]},
+        {"id": "P",  "op": "multiply", "args": ["Ai", "B"]},
+        {"id": "T",  "op": "transpose", "args": ["P"]},
+        {"id": "R",  "op": "correlation", "args": ["B"], "params": {"method": "spearman"}}
+      ],
+      "outputs": ["T", "R"]
+    }
+
+Setiap langkah menghasilkan Matrix sehingga bisa menjadi operand langkah
+lain: ``regression`` → β (p x 1, kolom terakhir operand = Y), ``correlation``
+→ matriks korelasi; statistik tambahannya dikembalikan sebagai detail.
+
+- Hanya langkah yang dibutuhkan ``outputs`` yang dijalankan, dalam urutan
+  topologis (urutan di ``steps`` bebas, siklus ditolak).
+- Langkah identik (operasi, operand, parameter sama) dihitung sekali.
+- Hasil antara tetap berupa Matrix di memori (tanpa serialisasi) dan
+  dilepas begitu konsumen terakhirnya selesai.
+- Bentuk semua langkah diperiksa sebelum ada yang dihitung, sekaligus
+  memberi perkiraan biaya (≈ flop) untuk memilih jalur inline atau job.
+"""
+import re
+from math import log2
+from ..operations.adder import add_matrices
+from ..operations.multiplier import multiply_matrices
+from ..operations.transpose import transpose
+from ..operations.inverse import inverse
+from ..statistic.regression import METODE_REGRESI, regresi_linier_detail, prediksi, evaluasi, pisah_xy
+from ..statistic.correlation import METODE_KORELASI, correlation_matrix
+from ..progress import report_progress
+
+MAX_STEPS = 64
+
+_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,63}$")
+
+
+class PipelineError(ValueError):
+    """Spesifikasi pipeline tidak valid; ``step`` = id langkah terkait (jika ada)."""
+
+    def __init__(self, message, step=None):
+        super().__init__(f"Langkah '{step}': {message}" if step else message)
+        self.step = step
+
+
+# ----------------------------------------------------------------------
+# Operasi: (jumlah operand, parameter yang diizinkan, bentuk+biaya, eksekusi)
+# ----------------------------------------------------------------------
+def _shape_add(params, a, b):
+    if a != b:
+        raise ValueError(f"ukuran {a[0]}x{a[1]} dan {b[0]}x{b[1]} harus sama")
+    return a, a[0] * a[1]
+
+
+def _shape_multiply(params, a, b):
+    if a[1] != b[0]:
+        raise ValueError(f"kolom operand pertama ({a[1]}) harus sama dengan baris operand kedua ({b[0]})")
+    return (a[0], b[1]), a[0] * a[1] * b[1]
+
+
+def _shape_transpose(params, a):
+    return (a[1], a[0]), a[0] * a[1]
+
+
+def _shape_inverse(params, a):
+    if a[0] != a[1]:
+        raise ValueError(f"invers butuh matriks persegi, diterima {a[0]}x{a[1]}")
+    return a, a[0] ** 3
+
+
+def _shape_regression(params, a):
+    if a[1] < 2:
+        raise ValueError("regresi butuh minimal dua kolom (X dan Y)")
+    if params.get("method", "cholesky") not in METODE_REGRESI:
+        raise ValueError(f"metode regresi '{params['method']}' tidak dikenal")
+    return (a[1] - 1, 1), a[0] * a[1] * a[1]
+
+
+def _shape_correlation(params, a):
+    if params.get("method", "pearson") not in METODE_KORELASI:
+        raise ValueError(f"metode korelasi '{params['method']}' tidak dikenal")
+    cost = a[0] * a[1] * a[1]
+    if params.get("method") == "kendall":
+        cost *= max(1.0, log2(a[0] or 1)) * 20
+    return (a[1], a[1]), cost
+
+
+def _run_regression(params, backend, A):
+    X, y, columns, target = pisah_xy(A)
+    hasil = regresi_linier_detail(X, y, params.get("method", "cholesky"), backend)
+    beta = hasil["beta"]
+    evaluation = evaluasi(y.buffer, prediksi(X, beta).buffer)
+    evaluation.pop("residuals")
+    return beta, {
+        "columns": columns,
+        "target": target,
+        "n": X.rows,
+        "std_error": hasil["std_error"],
+        "rank": hasil["rank"],
+        "condition": hasil["condition"],
+        "method": hasil["method"],
+        "evaluation": evaluation,
+    }
+
+
+def _run_correlation(params, backend, A):
+    hasil = correlation_matrix(A, getattr(A, "header", None), pvalues=bool(params.get("pvalues")),
+                               method=params.get("method", "pearson"), backend=backend)
+    R = hasil[1]
+    R.header = list(hasil[0])
+    details = {"columns": list(hasil[0]), "method": params.get("method", "pearson")}
+    if params.get("pvalues"):
+        details["p_values"] = hasil[2]
+    return R, details
+
+
+OPERATIONS = {
+    "add": (2, (), _shape_add, lambda params, backend, A, B: (add_matrices(A, B, backend=backend), None)),
+    "multiply": (2, (), _shape_multiply,
+                 lambda params, backend, A, B: (multiply_matrices(A, B, backend=backend), None)),
+    "transpose": (1, (), _shape_transpose, lambda params, backend, A: (transpose(A, backend=backend), None)),
+    "inverse": (1, (), _shape_inverse, lambda params, backend, A: (inverse(A, backend=backend), None)),
+    "regression": (1, ("method",), _shape_regression, _run_regression),
+    "correlation": (1, ("method", "pvalues"), _shape_correlation, _run_correlation),
+}
+
+
+class Step:
+    """Satu simpul DAG: ``id = op(*args, **params)``."""
+
+    __slots__ = ("id", "op", "args", "params")
+
+    def __init__(self, step_id, op, args, params):
+        self.id = step_id
+        self.op = op
+        self.args = args
+        self.params = params
+
+    @property
+    def signature(self):
+        return (self.op, tuple(self.args), tuple(sorted(self.params.items())))
+
+
+class Pipeline:
+    """DAG tervalidasi atas input bernama; dijalankan lewat ``plan`` lalu ``run``."""
+
+    def __init__(self, input_names, steps, outputs):
+        self.input_names = set(input_names)
+        self.steps = steps
+        self.outputs = outputs
+        self.order = self._toposort()
+
+    @classmethod
+    def from_spec(cls, spec, input_names):
+        if not isinstance(spec, dict):
+            raise PipelineError("Spesifikasi pipeline harus berupa object JSON.")
+        raw_steps = spec.get("steps") or []
+        if not isinstance(raw_steps, list) or not raw_steps:
+            raise PipelineError("'steps' harus berupa list yang tidak kosong.")
+        if len(raw_steps) > MAX_STEPS:
+            raise PipelineError(f"Maksimum {MAX_STEPS} langkah per pipeline.")
+        for name in input_names:
+            if not _NAME_PATTERN.match(name):
+                raise PipelineError(f"Nama input '{name}' tidak valid.")
+
+        steps = {}
+        for raw in raw_steps:
+            if not isinstance(raw, dict):
+                raise PipelineError("Setiap langkah harus berupa object.")
+            step_id, op = raw.get("id"), raw.get("op")
+            if not isinstance(step_id, str) or not _NAME_PATTERN.match(step_id):
+                raise PipelineError(f"id langkah '{step_id}' tidak valid.")
+            if step_id in steps or step_id in input_names:
+                raise PipelineError("id dipakai lebih dari sekali.", step_id)
+            if op not in OPERATIONS:
+                raise PipelineError(f"operasi '{op}' tidak dikenal. Pilihan: {', '.join(OPERATIONS)}.", step_id)
+            arity, allowed, _, _ = OPERATIONS[op]
+            args = raw.get("args") or []
+            if not isinstance(args, list) or len(args) != arity or not all(isinstance(a, str) for a in args):
+                raise PipelineError(f"'{op}' butuh {arity} operand (nama input/langkah).", step_id)
+            params = raw.get("params") or {}
+            if not isinstance(params, dict):
+                raise PipelineError("'params' harus berupa object.", step_id)
+            unknown = set(params) - set(allowed)
+            if unknown:
+                raise PipelineError(f"parameter tidak dikenal: {', '.join(sorted(unknown))}.", step_id)
+            if "method" in params:
+                params = dict(params, method=str(params["method"]).lower())
+            steps[step_id] = Step(step_id, op, args, params)
+
+        outputs = spec.get("outputs")
+        if outputs is None:
+            outputs = [raw_steps[-1]["id"]]
+        if isinstance(outputs, dict):
+            outputs = list(outputs)
+        if not isinstance(outputs, list) or not outputs:
+            raise PipelineError("'outputs' harus berupa list id langkah/input.")
+        for name in outputs:
+            if name not in steps and name not in input_names:
+                raise PipelineError(f"Output '{name}' tidak dikenal.")
+        return cls(input_names, steps, outputs)
+
+    def _toposort(self):
+        """Langkah yang dibutuhkan output, dalam urutan topologis; langkah identik digabung."""
+        order, state, alias, seen = [], {}, {}, {}
+
+        def visit(name, path):
+            if name in self.input_names:
+                return name
+            if name not in self.steps:
+                raise PipelineError(f"operand '{name}' bukan input maupun langkah.", path[-1] if path else None)
+            if state.get(name) == "visiting":
+                raise PipelineError(f"siklus terdeteksi: {' → '.join(path + [name])}.", name)
+            if state.get(name) == "done":
+                return alias[name]
+            state[name] = "visiting"
+            step = self.steps[name]
+            step.args = [visit(arg, path + [name]) for arg in step.args]
+            state[name] = "done"
+            twin = seen.get(step.signature)
+            if twin is None:
+                seen[step.signature] = name
+                order.append(step)
+                alias[name] = name
+            else:
+                alias[name] = twin  # langkah identik → pakai hasil yang sudah ada
+            return alias[name]
+
+        self.alias = {name: visit(name, []) for name in self.outputs}
+        return order
+
+    def plan(self, shapes):
+        """
+        Memeriksa bentuk semua langkah dari ``shapes`` input {nama: (baris, kolom)};
+        mengembalikan (bentuk per langkah, total perkiraan biaya).
+        """
+        shapes, total = dict(shapes), 0
+        for step in self.order:
+            _, _, shape_fn, _ = OPERATIONS[step.op]
+            try:
+                shapes[step.id], cost = shape_fn(step.params, *(shapes[a] for a in step.args))
+            except ValueError as e:
+                raise PipelineError(str(e), step.id)
+            total += cost
+        return shapes, total
+
+    def run(self, inputs, backend=None):
+        """
+        Menjalankan DAG atas ``inputs`` {nama: Matrix}; mengembalikan
+        {output: (Matrix, detail atau None)} sesuai urutan ``outputs``.
+        """
+        remaining = {}
+        for step in self.order:
+            for arg in step.args:
+                remaining[arg] = remaining.get(arg, 0) + 1
+        keep = set(self.alias.values())
+
+        values = {name: (matrix, None) for name, matrix in inputs.items()}
+        for done, step in enumerate(self.order):
+            report_progress(done / len(self.order), f"{step.id} ({step.op})")
+            _, _, _, execute = OPERATIONS[step.op]
+            try:
+                values[step.id] = execute(step.params, backend, *(values[a][0] for a in step.args))
+            except (ValueError, ZeroDivisionError) as e:
+                raise PipelineError(str(e), step.id)
+            for arg in step.args:
+                remaining[arg] -= 1
+                if not remaining[arg] and arg not in keep and arg not in self.input_names:
+                    del values[arg]  # hasil antara tidak dipakai lagi
+        return {name: values[self.alias[name]] for name in self.outputs}
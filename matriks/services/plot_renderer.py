@@ -0,0 +1,230 @@
+# matriks/services/plot_renderer.py
+"""
+Renderer plot di luar proses web beserta penyimpanan PNG content-addressed.
+
+Matplotlib hanya diimpor di proses renderer. Tiap proses menyiapkan satu
+figure per jenis plot saat start (pre-warm) dan memakainya ulang
+(``Figure.clear``) untuk setiap render, sehingga request tidak membayar
+impor matplotlib maupun pembuatan figure/canvas.
+
+Hash PNG = hash isi spesifikasi plot (jenis, data, opsi). Plot yang sama
+tidak pernah dirender dua kali; file disajikan dari ``/plots/<hash>.png``
+dan boleh di-cache browser selamanya karena isinya tidak pernah berubah.
+
+Direktori PNG dibersihkan saat service dibuat dan paling sering sekali per
+``SWEEP_INTERVAL`` detik setelah render baru: PNG yang tidak dipakai lebih
+lama dari ``MATRIKS_PLOT_TTL`` dihapus, lalu yang paling lama tidak dipakai
+sampai total ukuran di bawah anggaran. Waktu pakai = mtime, diperbarui
+setiap kali plot yang sama diminta lagi. Hit cache hasil yang merujuk PNG
+yang sudah dihapus dihitung ulang (lihat ``cached_json`` di app.py).
+
+Konfigurasi:
+    MATRIKS_PLOT_DIR      direktori PNG (default: <tmp>/matriks_plots)
+    MATRIKS_PLOT_WORKERS  jumlah proses renderer (default 1)
+    MATRIKS_PLOT_DISK_MB  anggaran ukuran direktori PNG (default 512)
+    MATRIKS_PLOT_TTL      detik PNG disimpan sejak dipakai terakhir (default 7 hari)
+"""
+import io
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from .cache import make_key
+
+ENV_PLOT_DIR = "MATRIKS_PLOT_DIR"
+ENV_PLOT_WORKERS = "MATRIKS_PLOT_WORKERS"
+ENV_PLOT_DISK_MB = "MATRIKS_PLOT_DISK_MB"
+ENV_PLOT_TTL = "MATRIKS_PLOT_TTL"
+
+# Jeda minimum (detik) antar-pembersihan direktori PNG
+SWEEP_INTERVAL = 60
+
+_HASH_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+# Ukuran figure (inci) tiap jenis plot
+_SIZES = {"prediction": (6, 4), "heatmap": None}
+
+# Figure pre-warm milik proses renderer ini (jenis → Figure)
+_figures = {}
+
+
+# ----------------------------------------------------------------------
+# Sisi proses renderer
+# ----------------------------------------------------------------------
+def _warm():
+    """Initializer proses: impor matplotlib (Agg) dan siapkan figure per jenis."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    for kind, size in _SIZES.items():
+        figure = Figure(figsize=size or (8, 6))
+        FigureCanvasAgg(figure)
+        _figures[kind] = figure
+
+
+def _figure(kind, size):
+    if not _figures:
+        _warm()
+    figure = _figures[kind]
+    figure.clear()
+    figure.set_size_inches(*size)
+    return figure
+
+
+def render_png(kind, spec):
+    """Merender satu plot menjadi byte PNG (dijalankan di proses renderer)."""
+    if kind == "prediction":
+        from ..statistic.regression_visualization import draw_prediksi
+        figure = _figure(kind, _SIZES[kind])
+        draw_prediksi(figure.add_subplot(), spec["y_actual"], spec["y_predict"])
+    elif kind == "heatmap":
+        from ..statistic.correlation_visualization import draw_heatmap, prepare_heatmap, heatmap_size
+        data, labels = prepare_heatmap(spec["matrix"], spec["labels"], spec["cluster"], spec["max_size"])
+        figure = _figure(kind, heatmap_size(data.shape[0]))
+        draw_heatmap(figure.add_subplot(), data, labels, spec["annotate_limit"])
+    else:
+        raise ValueError(f"Jenis plot '{kind}' tidak dikenal.")
+    figure.tight_layout()
+    buf = io.BytesIO()
+    figure.savefig(buf, format="png", dpi=100)
+    return buf.getvalue()
+
+
+# ----------------------------------------------------------------------
+# Sisi proses web
+# ----------------------------------------------------------------------
+class PlotService:
+    """Pool renderer + penyimpanan PNG di disk, dengan kunci hash isi."""
+
+    def __init__(self, directory=None, workers=None, disk_bytes=None, ttl=None):
+        self.directory = directory or os.environ.get(ENV_PLOT_DIR) or os.path.join(
+            tempfile.gettempdir(), "matriks_plots"
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            self.workers = workers or max(1, int(os.environ.get(ENV_PLOT_WORKERS, 1)))
+        except ValueError:
+            self.workers = 1
+        try:
+            self.disk_bytes = disk_bytes if disk_bytes is not None else int(os.environ.get(ENV_PLOT_DISK_MB, 512)) << 20
+            self.ttl = ttl if ttl is not None else int(os.environ.get(ENV_PLOT_TTL, 7 * 24 * 3600))
+        except ValueError:
+            self.disk_bytes, self.ttl = 512 << 20, 7 * 24 * 3600
+        self._executor = None
+        self._lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.sweep()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: aman walau proses web sudah punya thread (antrean job)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm,
+                )
+            return self._executor
+
+    def start(self):
+        """Menyalakan dan memanaskan proses renderer lebih awal (opsional)."""
+        self._pool().submit(_figures.__len__).result()
+
+    def path(self, plot_hash):
+        if not _HASH_PATTERN.match(plot_hash or ""):
+            raise ValueError(f"Hash plot '{plot_hash}' tidak valid.")
+        return os.path.join(self.directory, f"{plot_hash}.png")
+
+    def exists(self, plot_hash):
+        try:
+            return os.path.exists(self.path(plot_hash))
+        except ValueError:
+            return False
+
+    def sweep(self):
+        """
+        Menghapus PNG kedaluwarsa lalu yang paling lama tidak dipakai sampai
+        di bawah anggaran; file .tmp yatim (render yang terputus) juga dihapus.
+        Mengembalikan jumlah file yang dihapus.
+        """
+        if not self._sweep_lock.acquire(blocking=False):
+            return 0  # pembersihan lain sedang berjalan
+        try:
+            now = self._last_sweep = time.time()
+            files, removed = [], 0
+            for entry in os.scandir(self.directory):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    expired = stat.st_mtime < now - 3600
+                elif entry.name.endswith(".png"):
+                    expired = stat.st_mtime < now - self.ttl
+                    if not expired:
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+                else:
+                    continue
+                if expired:
+                    removed += self._remove(entry.path)
+
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):  # paling lama dipakai dulu
+                if total <= self.disk_bytes:
+                    break
+                removed += self._remove(path)
+                total -= size
+            return removed
+        finally:
+            self._sweep_lock.release()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+    def _render(self, kind, spec):
+        try:
+            return self._pool().submit(render_png, kind, spec).result()
+        except BrokenProcessPool:
+            # Proses renderer mati (mis. OOM): buat pool baru untuk render berikutnya
+            with self._lock:
+                self._executor = None
+            return self._pool().submit(render_png, kind, spec).result()
+
+    def render(self, kind, **spec):
+        """
+        Mengembalikan hash PNG untuk plot ``kind`` dengan data ``spec``;
+        dirender di pool hanya jika belum ada di penyimpanan.
+        """
+        plot_hash = make_key("plot", kind, spec)[:32]
+        path = self.path(plot_hash)
+        try:
+            os.utime(path)  # sudah ada: tandai baru dipakai (urutan pembersihan)
+        except FileNotFoundError:
+            png = self._render(kind, spec)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(png)
+            os.replace(tmp, path)  # atomik: pembaca tidak pernah melihat PNG setengah jadi
+            if time.time() - self._last_sweep > SWEEP_INTERVAL:
+                self.sweep()
+        return plot_hash
+
+    def url(self, kind, **spec):
+        return f"/plots/{self.render(kind, **spec)}.png"
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
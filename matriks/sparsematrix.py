@@ -1,23 +1,255 @@
 # matriks/sparsematrix.py
+from array import array
+from bisect import bisect_left
+from itertools import chain
 from matriks.matrix import Matrix
 
+# Matriks dengan kepadatan (nnz / rows*cols) di atas ambang ini lebih hemat disimpan padat
+DENSITY_THRESHOLD = 0.25
+
+
 class SparseMatrix(Matrix):
     """
-    Representasi matriks jarang (sparse) yang lebih efisien.
-    Mematuhi LSP karena dapat menggantikan Matrix biasa.
+    Representasi matriks jarang (sparse) dalam format CSR
+    (Compressed Sparse Row) yang tidak pernah menyimpan data padat.
+
+    - ``indptr``  : array('q') panjang rows + 1, awal/akhir tiap baris
+    - ``indices`` : array('q') indeks kolom tiap nilai non-nol (terurut per baris)
+    - ``values``  : array('d') nilai non-nol
+
+    Bentuk CSC (per kolom) dihitung saat dibutuhkan dan di-cache.
+    Mematuhi LSP karena dapat menggantikan Matrix biasa: ``data``,
+    ``buffer`` dan ``tolist()`` mengembalikan salinan padat.
     """
+    __slots__ = ("indptr", "indices", "values", "_csc")
+    is_sparse = True
+
     def __init__(self, data):
-        # Panggil konstruktor kelas induk (Matrix)
-        super().__init__(data)
+        if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
+            raise TypeError("Data harus berupa list of lists.")
 
-        self._sparse_data = {}
-        for r, row in enumerate(data):
+        rows = len(data)
+        cols = len(data[0]) if rows > 0 else 0
+        if not all(len(row) == cols for row in data):
+            raise ValueError("Semua baris harus memiliki jumlah kolom yang sama.")
+
+        # Bangun CSR langsung dari baris, hanya menyimpan elemen non-nol
+        indptr, indices, values = array('q', [0]), array('q'), array('d')
+        for row in data:
             for c, val in enumerate(row):
                 if val != 0:
-                    self._sparse_data[(r, c)] = val
+                    indices.append(c)
+                    values.append(val)
+            indptr.append(len(values))
+        self._set_csr(indptr, indices, values, rows, cols)
+
+    def _set_csr(self, indptr, indices, values, rows, cols):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.rows = rows
+        self.cols = cols
+        self._csc = None
+        self._props = None
+
+    # ------------------------------------------------------------------
+    # Konstruktor alternatif
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_csr(cls, indptr, indices, values, rows, cols):
+        """Membuat SparseMatrix dari array CSR yang sudah jadi (tanpa salinan)."""
+        if len(indptr) != rows + 1 or len(indices) != len(values):
+            raise ValueError("Array CSR tidak konsisten dengan ukuran matriks.")
+        obj = cls.__new__(cls)
+        obj._set_csr(indptr, indices, values, rows, cols)
+        return obj
+
+    @classmethod
+    def from_coo(cls, row_idx, col_idx, values, rows=None, cols=None):
+        """
+        Membuat SparseMatrix dari format COO (triplet baris, kolom, nilai).
+        Triplet duplikat dijumlahkan; nilai nol dibuang.
+        """
+        entries = sorted(zip(row_idx, col_idx, values))
+        if rows is None:
+            rows = max((r for r, _, _ in entries), default=-1) + 1
+        if cols is None:
+            cols = max((c for _, c, _ in entries), default=-1) + 1
+
+        counts = [0] * (rows + 1)
+        indices, vals = array('q'), array('d')
+        last = None
+        for r, c, v in entries:
+            if not (0 <= r < rows and 0 <= c < cols):
+                raise ValueError(f"Indeks ({r}, {c}) di luar ukuran matriks {rows}x{cols}.")
+            if (r, c) == last:
+                vals[-1] += v
+                continue
+            indices.append(c)
+            vals.append(v)
+            counts[r + 1] += 1
+            last = (r, c)
+
+        for i in range(rows):
+            counts[i + 1] += counts[i]
+        sparse = cls.from_csr(array('q', counts), indices, vals, rows, cols)
+        return sparse.prune()
+
+    @classmethod
+    def from_triplets(cls, triplets, rows=None, cols=None):
+        """Membuat SparseMatrix dari iterable (baris, kolom, nilai)."""
+        row_idx, col_idx, values = [], [], []
+        for r, c, v in triplets:
+            row_idx.append(int(r))
+            col_idx.append(int(c))
+            values.append(float(v))
+        return cls.from_coo(row_idx, col_idx, values, rows, cols)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """Mengonversi Matrix padat menjadi SparseMatrix."""
+        buf, c = matrix.buffer, matrix.cols
+        indptr, indices, values = array('q', [0]), array('q'), array('d')
+        for i in range(matrix.rows):
+            for j, val in enumerate(buf[i * c:(i + 1) * c]):
+                if val != 0:
+                    indices.append(j)
+                    values.append(val)
+            indptr.append(len(values))
+        return cls.from_csr(indptr, indices, values, matrix.rows, c)
+
+    def prune(self):
+        """Membuang nilai nol eksplisit (hasil penjumlahan/pengurangan) di tempat."""
+        if self.values.count(0.0) == 0:
+            return self
+        indptr, indices, values = array('q', [0]), array('q'), array('d')
+        for i in range(self.rows):
+            for j, v in self.row_items(i):
+                if v != 0:
+                    indices.append(j)
+                    values.append(v)
+            indptr.append(len(values))
+        self._set_csr(indptr, indices, values, self.rows, self.cols)
+        return self
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    @property
+    def density(self):
+        size = self.rows * self.cols
+        return self.nnz / size if size else 0.0
+
+    @property
+    def is_numeric(self):
+        return True
+
+    def row_items(self, i):
+        """Pasangan (kolom, nilai) non-nol pada baris ke-i."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[start:end], self.values[start:end])
+
+    def tocsc(self):
+        """Array CSC (indptr, indices baris, values) — di-cache sampai matriks diubah."""
+        if self._csc is None:
+            counts = [0] * (self.cols + 1)
+            for c in self.indices:
+                counts[c + 1] += 1
+            for j in range(self.cols):
+                counts[j + 1] += counts[j]
+            nxt = counts[:-1]
+            row_idx = array('q', [0]) * self.nnz
+            vals = array('d', [0.0]) * self.nnz
+            for i in range(self.rows):
+                for c, v in self.row_items(i):
+                    pos = nxt[c]
+                    row_idx[pos] = i
+                    vals[pos] = v
+                    nxt[c] = pos + 1
+            self._csc = (array('q', counts), row_idx, vals)
+        return self._csc
+
+    # ------------------------------------------------------------------
+    # Akses elemen
+    # ------------------------------------------------------------------
+    def _find(self, row, col):
+        start, end = self.indptr[row], self.indptr[row + 1]
+        pos = bisect_left(self.indices, col, start, end)
+        return pos, pos < end and self.indices[pos] == col
 
     def get_value(self, row, col):
-        return self._sparse_data.get((row, col), 0)
+        pos, found = self._find(row, col)
+        return self.values[pos] if found else 0
+
+    def __getitem__(self, index):
+        i, j = index
+        return self.get_value(i, j)
+
+    def __setitem__(self, index, value):
+        i, j = index
+        pos, found = self._find(i, j)
+        if found:
+            self.values[pos] = value
+        elif value != 0:
+            self.indices.insert(pos, j)
+            self.values.insert(pos, value)
+            for r in range(i + 1, self.rows + 1):
+                self.indptr[r] += 1
+        self._csc = None
+        self._props = None
+
+    def row(self, i):
+        if not 0 <= i < self.rows:
+            raise IndexError("Indeks baris di luar jangkauan.")
+        out = array('d', [0.0]) * self.cols
+        for j, v in self.row_items(i):
+            out[j] = v
+        return out
+
+    def col(self, j):
+        if not 0 <= j < self.cols:
+            raise IndexError("Indeks kolom di luar jangkauan.")
+        indptr, row_idx, vals = self.tocsc()
+        out = array('d', [0.0]) * self.rows
+        for k in range(indptr[j], indptr[j + 1]):
+            out[row_idx[k]] = vals[k]
+        return out
+
+    def dot(self, vector):
+        """SpMV: mengalikan matriks dengan vektor (list/array panjang cols)."""
+        if len(vector) != self.cols:
+            raise ValueError("Panjang vektor harus sama dengan jumlah kolom matriks.")
+        return array('d', [
+            sum(v * vector[j] for j, v in self.row_items(i)) for i in range(self.rows)
+        ])
+
+    # ------------------------------------------------------------------
+    # Konversi padat (salinan) untuk kompatibilitas dengan Matrix
+    # ------------------------------------------------------------------
+    @property
+    def buffer(self):
+        return array('d', chain.from_iterable(self.row(i) for i in range(self.rows)))
+
+    def tolist(self):
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def to_dense(self):
+        return Matrix.from_flat(self.buffer, self.rows, self.cols)
+
+    def memoryview(self):
+        return self.to_dense().memoryview()
+
+    @property
+    def __array_interface__(self):
+        raise AttributeError("__array_interface__")
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+        return np.asarray(self.to_dense(), dtype=dtype)
 
     def __str__(self):
         output = ""
@@ -27,3 +259,22 @@ class SparseMatrix(Matrix):
                 row_str.append(str(self.get_value(r, c)))
             output += " ".join(row_str) + "\n"
         return output.strip()
+
+    def __repr__(self):
+        return f"SparseMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+
+def auto_convert(matrix, threshold=DENSITY_THRESHOLD):
+    """
+    Memilih representasi berdasarkan kepadatan:
+    SparseMatrix yang terlalu padat → Matrix, Matrix yang jarang → SparseMatrix.
+    """
+    if isinstance(matrix, SparseMatrix):
+        return matrix.to_dense() if matrix.density > threshold else matrix
+    if not matrix.is_numeric:
+        return matrix
+    size = matrix.rows * matrix.cols
+    nonzero = size - matrix.buffer.count(0.0)
+    if size and nonzero / size <= threshold:
+        return SparseMatrix.from_dense(matrix)
+    return matrix
@@ -1,4 +1,28 @@
+import csv
+import glob
+import io
+import multiprocessing
+import os
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, groupby, repeat
+from math import sqrt, isnan, lgamma, exp, log, erfc
+from operator import add, mul, sub
 from matriks.matrix import Matrix
+from matriks.backends.parallel_backend import worker_count
+from matriks.progress import report_progress
+
+try:
+    import numpy as np
+    from scipy.special import betainc
+except ImportError:  # SciPy opsional → p-value dihitung per pasangan di Python
+    betainc = None
+
+_NAN = float("nan")
+_MISSING = {"", "na", "nan", "null", "none"}
+
 
 def mean(values):
     """Menghitung rata-rata dari list 1D."""
@@ -26,42 +50,590 @@ def correlation(x, y):
     return numerator / denominator
 
 
-def correlation_matrix(matrix, header=None):
+# ----------------------------------------------------------------------
+# Matriks korelasi
+# ----------------------------------------------------------------------
+def _to_float(value):
+    """float(value); sel kosong/NA menjadi NaN, teks lain → None (kolom bukan numerik)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if text.lower() in _MISSING:
+        return _NAN
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _numeric_columns(data, header):
+    """
+    Memilih kolom numerik (termasuk nilai negatif dan notasi eksponen).
+    Kolom yang memuat teks selain penanda kosong/NA dilewati.
+    """
+    names, columns = [], []
+    for j, col in enumerate(zip(*data)):
+        values = [_to_float(v) for v in col]
+        if None in values or all(map(isnan, values)):
+            continue
+        names.append(header[j] if j < len(header) else f"X{j}")
+        columns.append(values)
+    return names, columns
+
+
+def _standardize(values):
+    """
+    (z, ada_nan): kolom dipusatkan dan diskalakan sekali sehingga Σz² = 1
+    (atas nilai yang ada). NaN diganti 0 agar tidak ikut dalam perkalian.
+    """
+    present = [v for v in values if not isnan(v)]
+    if len(present) == len(values):
+        m = sum(values) / len(values)
+        centered = [v - m for v in values]
+        norm = sqrt(sum(map(mul, centered, centered)))
+        return [v / norm for v in centered] if norm else [0.0] * len(values), False
+    m = sum(present) / len(present)
+    norm = sqrt(sum((v - m) ** 2 for v in present))
+    scale = 1.0 / norm if norm else 0.0
+    return [0.0 if isnan(v) else (v - m) * scale for v in values], True
+
+
+def _gram(A, B, backend):
+    """AᵀB lewat ekspresi lazy (A is B → jalur Gram simetris, segitiga atas saja)."""
+    lazy_a = A.lazy()
+    lazy_b = lazy_a if B is A else B.lazy()
+    return (lazy_a.T @ lazy_b).evaluate(backend).buffer
+
+
+def _betacf(a, b, x):
+    """Pecahan berlanjut untuk fungsi beta tak lengkap (Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        for num in (m * (b - m) * x / ((a + m2 - 1) * (a + m2)),
+                    -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1))):
+            d = 1.0 + num * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + num / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-15:
+            break
+    return h
+
+
+def _betainc(a, b, x):
+    """Fungsi beta tak lengkap teregulasi I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = exp(lgamma(a + b) - lgamma(a) - lgamma(b) + a * log(x) + b * log(1.0 - x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def _pvalues(r_values, df_values):
+    """
+    p-value dua sisi uji t untuk r: t² = r²·df/(1 − r²) sehingga
+    p = I_{df/(df+t²)}(df/2, 1/2) = I_{1−r²}(df/2, 1/2).
+    """
+    if betainc is not None and r_values:
+        r = np.asarray(r_values)
+        df = np.asarray(df_values, dtype=float)
+        with np.errstate(invalid="ignore"):
+            p = betainc(df / 2, 0.5, np.clip(1.0 - r * r, 0.0, 1.0))
+        p[(df < 1) | np.isnan(r)] = np.nan
+        return p.tolist()
+    return [
+        _NAN if df < 1 or isnan(r) else _betainc(df / 2, 0.5, min(max(1.0 - r * r, 0.0), 1.0))
+        for r, df in zip(r_values, df_values)
+    ]
+
+
+def _pearson(columns, n, pvalues, backend):
+    """
+    Pearson atas kolom ``columns``: tiap kolom distandarkan sekali lalu
+    R = ZᵀZ dihitung sebagai satu perkalian Gram (hanya segitiga atas).
+    Jika ada NaN, korelasi dihitung pairwise (hanya baris yang lengkap untuk
+    pasangan itu) dari momen bertopeng M: N = MᵀM, S = ZᵀM, Q = (Z∘Z)ᵀM, P = ZᵀZ.
+    """
+    k = len(columns)
+    standardized = [_standardize(col) for col in columns]
+    has_nan = any(flag for _, flag in standardized)
+    Z = Matrix.from_flat(array('d', chain.from_iterable(zip(*(z for z, _ in standardized)))), n, k)
+    P = _gram(Z, Z, backend)
+
+    if has_nan:
+        M = Matrix.from_flat(array('d', chain.from_iterable(
+            zip(*([0.0 if isnan(v) else 1.0 for v in col] for col in columns))
+        )), n, k)
+        Z2 = Matrix.from_flat(array('d', map(mul, Z.buffer, Z.buffer)), n, k)
+        N, S, Q = _gram(M, M, backend), _gram(Z, M, backend), _gram(Z2, M, backend)
+
+    result = array('d', [0.0]) * (k * k)
+    pairs, r_values, df_values = [], [], []
+    for i in range(k):
+        base = i * k
+        result[base + i] = 1.0 if P[base + i] > 0.0 else 0.0
+        for j in range(i + 1, k):
+            ij, ji = base + j, j * k + i
+            if not has_nan:
+                r, count = P[ij], n
+            else:
+                count = N[ij]
+                s_i, s_j = S[ij], S[ji]
+                if count < 2:
+                    r = _NAN
+                else:
+                    var_i = Q[ij] - s_i * s_i / count
+                    var_j = Q[ji] - s_j * s_j / count
+                    denominator = sqrt(var_i * var_j) if var_i > 0 and var_j > 0 else 0.0
+                    r = (P[ij] - s_i * s_j / count) / denominator if denominator else 0.0
+            r = min(max(r, -1.0), 1.0)
+            result[ij] = result[ji] = r
+            if pvalues:
+                pairs.append((ij, ji))
+                r_values.append(r)
+                df_values.append(count - 2)
+
+    if not pvalues:
+        return result, None
+    p_buf = array('d', [0.0]) * (k * k)
+    for (ij, ji), p in zip(pairs, _pvalues(r_values, df_values)):
+        p_buf[ij] = p_buf[ji] = p
+    return result, p_buf
+
+
+# ----------------------------------------------------------------------
+# Korelasi peringkat
+# ----------------------------------------------------------------------
+def _ranks(values):
+    """
+    (peringkat rata-rata, kode padat) satu kolom. Nilai seri mendapat
+    rata-rata peringkatnya; NaN tetap NaN (kode −1).
+    """
+    order = sorted((i for i, v in enumerate(values) if not isnan(v)), key=values.__getitem__)
+    ranks = [_NAN] * len(values)
+    codes = [-1] * len(values)
+    start = 0
+    for group, (_, members) in enumerate(groupby(order, key=values.__getitem__)):
+        members = list(members)
+        average = start + (len(members) + 1) / 2.0
+        for i in members:
+            ranks[i], codes[i] = average, group
+        start += len(members)
+    return ranks, codes
+
+
+_MERGE_BLOCK = 64
+
+
+def _inversions(seq):
+    """
+    Jumlah inversi (y_a > y_b untuk a < b; nilai seri tidak dihitung) dengan
+    merge sort Knight. Blok kecil dihitung dengan penyisipan terurut, lalu
+    tiap penggabungan menghitung inversi silang lewat bisect.
+    """
+    runs, count = [], 0
+    for start in range(0, len(seq), _MERGE_BLOCK):
+        run = []
+        for v in seq[start:start + _MERGE_BLOCK]:
+            position = bisect_right(run, v)
+            count += len(run) - position
+            run.insert(position, v)
+        runs.append(run)
+    while len(runs) > 1:
+        merged = []
+        for left, right in zip(runs[::2], runs[1::2]):
+            not_greater = sum(map(bisect_right, repeat(left, len(right)), right))
+            count += len(left) * len(right) - not_greater
+            left += right
+            left.sort()  # dua run terurut → Timsort menggabungkan dalam O(n)
+            merged.append(left)
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return count
+
+
+def _tie_groups(codes):
+    """Ukuran tiap kelompok nilai seri (> 1)."""
+    return [t for t in Counter(codes).values() if t > 1]
+
+
+def _tie_sums(ties):
+    return (sum(t * (t - 1) * (2 * t + 5) for t in ties),
+            sum(t * (t - 1) for t in ties),
+            sum(t * (t - 1) * (t - 2) for t in ties))
+
+
+def _kendall_pair(x_codes, y_codes, x_ties=None, y_ties=None):
+    """
+    Kendall tau-b satu pasangan dengan algoritma Knight O(n log n):
+    urutkan menurut (x, y) lalu hitung inversi y lewat merge sort.
+    ``x_ties``/``y_ties`` (kelompok seri per kolom) boleh diberikan bila
+    kolom tanpa NaN; jika tidak, dihitung dari baris yang lengkap.
+    Mengembalikan (tau, p-value pendekatan normal dengan koreksi seri).
+    """
+    if x_ties is None or y_ties is None:
+        rows = [r for r in range(len(x_codes)) if x_codes[r] >= 0 and y_codes[r] >= 0]
+        x_codes = [x_codes[r] for r in rows]
+        y_codes = [y_codes[r] for r in rows]
+        x_ties, y_ties = _tie_groups(x_codes), _tie_groups(y_codes)
+    n = len(x_codes)
+    if n < 2:
+        return _NAN, _NAN
+
+    width = max(y_codes) + 1
+    keys = sorted(map(add, map(width.__mul__, x_codes), y_codes))
+    joint = sum(t * (t - 1) // 2 for t in _tie_groups(keys)) if x_ties and y_ties else 0
+    swaps = _inversions([key % width for key in keys])
+
+    n0 = n * (n - 1) // 2
+    n1 = sum(t * (t - 1) // 2 for t in x_ties)
+    n2 = sum(t * (t - 1) // 2 for t in y_ties)
+    denominator = sqrt((n0 - n1) * (n0 - n2))
+    if not denominator:
+        return 0.0, _NAN
+    # S = konkordan − diskordan
+    S = n0 - n1 - n2 + joint - 2 * swaps
+    tau = min(max(S / denominator, -1.0), 1.0)
+
+    # Varians S di bawah H0 dengan koreksi seri (Kendall 1970)
+    vx, x1, x2 = _tie_sums(x_ties)
+    vy, y1, y2 = _tie_sums(y_ties)
+    var = (n * (n - 1) * (2 * n + 5) - vx - vy) / 18.0
+    var += x1 * y1 / (2.0 * n * (n - 1))
+    if n > 2:
+        var += x2 * y2 / (9.0 * n * (n - 1) * (n - 2))
+    p = erfc(abs(S) / sqrt(2.0 * var)) if var > 0 else _NAN
+    return tau, p
+
+
+def _kendall(columns, pvalues):
+    """
+    Matriks Kendall tau-b. Kode peringkat padat dan kelompok seri tiap kolom
+    dihitung sekali; per pasangan hanya tersisa satu sort dan satu merge sort.
+    """
+    k = len(columns)
+    codes = [_ranks(col)[1] for col in columns]
+    ties = [None if -1 in c else _tie_groups(c) for c in codes]
+    result = array('d', [0.0]) * (k * k)
+    p_buf = array('d', [0.0]) * (k * k) if pvalues else None
+    for i in range(k):
+        result[i * k + i] = 1.0 if max(codes[i], default=-1) > 0 else 0.0
+        for j in range(i + 1, k):
+            tau, p = _kendall_pair(codes[i], codes[j], ties[i], ties[j])
+            result[i * k + j] = result[j * k + i] = tau
+            if pvalues:
+                p_buf[i * k + j] = p_buf[j * k + i] = p
+        # Pasangan yang selesai setelah baris i: Σ (k − 1 − r) untuk r ≤ i
+        report_progress((i + 1) * (2 * k - i - 2) / max(k * (k - 1), 1))
+    return result, p_buf
+
+
+METODE_KORELASI = ("pearson", "spearman", "kendall")
+
+
+def correlation_matrix(matrix, header=None, pvalues=False, method="pearson", backend=None):
     """
     Menghitung korelasi antar semua kolom numerik pada matriks.
-    - matrix: Matrix atau list of lists
-    - header: list nama kolom (opsional)
+    - matrix : Matrix atau list of lists (baris pertama boleh berupa header)
+    - header : list nama kolom (opsional)
+    - pvalues: jika True juga mengembalikan matriks p-value (uji dua sisi)
+    - method : "pearson", "spearman" (Pearson atas peringkat yang dihitung
+               sekali per kolom) atau "kendall" (tau-b, algoritma Knight)
+
+    Mengembalikan (nama_kolom, R) atau (nama_kolom, R, P_value).
     """
-    if isinstance(matrix, Matrix):
-        data = matrix.data
+    method = (method or "pearson").lower()
+    if method not in METODE_KORELASI:
+        raise ValueError(f"Metode korelasi '{method}' tidak dikenal. Pilihan: {', '.join(METODE_KORELASI)}.")
+
+    if isinstance(matrix, Matrix) and matrix.is_numeric and not matrix.is_sparse:
+        n, k = matrix.rows, matrix.cols
+        buf = matrix.buffer
+        names = list(header) if header else [f"X{j}" for j in range(k)]
+        columns = [buf[j::k].tolist() for j in range(k)]
     else:
-        data = matrix
+        data = matrix.data if isinstance(matrix, Matrix) else matrix
+        # Baris pertama yang seluruhnya teks non-numerik adalah header
+        if data and all(isinstance(v, str) for v in data[0]) and None in map(_to_float, data[0]):
+            header, data = list(data[0]), data[1:]
+        elif not header:
+            header = [f"X{j}" for j in range(len(data[0]) if data else 0)]
+        n = len(data)
+        names, columns = _numeric_columns(data, header)
+        k = len(columns)
 
-    # Kalau ada header di baris pertama → lewati
-    if all(isinstance(val, str) for val in data[0]):
-        header_row = data[0]
-        data = data[1:]
+    if method == "kendall":
+        result, p_buf = _kendall(columns, pvalues)
     else:
-        header_row = header or [f"X{i}" for i in range(len(data[0]))]
-
-    # Ambil hanya kolom numerik
-    numeric_cols = []
-    numeric_names = []
-    for j in range(len(data[0])):
-        try:
-            col = [float(row[j]) for row in data if str(row[j]).replace('.', '', 1).isdigit()]
-            if len(col) == len(data):  # semua baris valid numerik
-                numeric_cols.append(col)
-                numeric_names.append(header_row[j])
-        except Exception:
-            continue
+        if method == "spearman":
+            columns = [_ranks(col)[0] for col in columns]
+        result, p_buf = _pearson(columns, n, pvalues, backend)
+
+    R = Matrix.from_flat(result, k, k)
+    if not pvalues:
+        return names, R
+    return names, R, Matrix.from_flat(p_buf, k, k)
+
+
+# ----------------------------------------------------------------------
+# Akumulator co-moment (streaming dan bisa digabung)
+# ----------------------------------------------------------------------
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class CorrelationAccumulator:
+    """
+    Statistik cukup untuk kovarians/korelasi tanpa menyimpan baris mentah:
+    n, rata-rata tiap kolom dan segitiga atas co-moment
+    C_ij = Σ (x_i − x̄_i)(x_j − x̄_j).
+
+    - ``update(row)``      : satu baris (Welford)
+    - ``partial_fit(rows)``: satu potongan — Gram terpusat potongan lalu
+                             digabung dengan rumus Chan
+    - ``merge(other)``     : menggabungkan akumulator lain (mis. dari proses lain):
+                             C = C_a + C_b + δ_iδ_j·n_a·n_b/n, δ = x̄_b − x̄_a
+
+    Baris yang memuat NaN dilewati (complete-case) dan dihitung di ``skipped``.
+    """
+
+    def __init__(self, columns=None, backend=None):
+        self.columns = list(columns) if columns is not None else None
+        self.backend = backend
+        self.k = len(self.columns) if self.columns is not None else None
+        self.n = 0
+        self.skipped = 0
+        self.mean = None
+        self.upper = None  # upper[i] = C[i, i:] (array panjang k − i)
+
+    def _init(self, k):
+        if self.k is None:
+            self.k = k
+        elif k != self.k:
+            raise ValueError(f"Jumlah kolom harus {self.k}, diterima {k}.")
+        if self.columns is None:
+            self.columns = [f"X{j}" for j in range(k)]
+        if self.mean is None:
+            self.mean = [0.0] * k
+            self.upper = [array('d', [0.0]) * (k - i) for i in range(k)]
+
+    def update(self, row):
+        """Menambahkan satu baris (update Welford satu langkah)."""
+        row = [float(v) for v in row]
+        self._init(len(row))
+        if any(map(isnan, row)):
+            self.skipped += 1
+            return self
+        self.n += 1
+        delta = list(map(sub, row, self.mean))
+        self.mean = [m + d / self.n for m, d in zip(self.mean, delta)]
+        after = list(map(sub, row, self.mean))
+        for i, d in enumerate(delta):
+            if d:
+                self.upper[i] = array('d', map(add, self.upper[i], map(d.__mul__, after[i:])))
+        return self
+
+    def partial_fit(self, rows):
+        """Menambahkan satu potongan (Matrix atau list baris)."""
+        if isinstance(rows, Matrix):
+            rows = rows.tolist()
+        complete = [[float(v) for v in row] for row in rows]
+        if not complete:
+            return self
+        self._init(len(complete[0]))
+        before = len(complete)
+        complete = [row for row in complete if not any(map(isnan, row))]
+        self.skipped += before - len(complete)
+        if not complete:
+            return self
+
+        chunk = CorrelationAccumulator(self.columns, self.backend)
+        chunk._init(self.k)
+        chunk.n = len(complete)
+        chunk.mean = [sum(col) / chunk.n for col in zip(*complete)]
+        centered = array('d', chain.from_iterable(map(sub, row, chunk.mean) for row in complete))
+        Z = Matrix.from_flat(centered, chunk.n, self.k)
+        gram, k = _gram(Z, Z, self.backend), self.k
+        chunk.upper = [gram[i * k + i:(i + 1) * k] for i in range(k)]
+        return self.merge(chunk)
 
-    n = len(numeric_cols)
-    result = [[0.0 for _ in range(n)] for _ in range(n)]
+    def merge(self, other):
+        """Menggabungkan ``other`` ke akumulator ini (rumus paralel Chan)."""
+        if other.n == 0:
+            self.skipped += other.skipped
+            return self
+        if self.columns is not None and other.columns is not None and self.columns != other.columns:
+            raise ValueError("Kolom kedua akumulator berbeda; tidak bisa digabung.")
+        self._init(other.k)
+        self.skipped += other.skipped
+        if self.n == 0:
+            self.n = other.n
+            self.mean = list(other.mean)
+            self.upper = [array('d', row) for row in other.upper]
+            return self
 
-    # Hitung korelasi antar semua kolom
-    for i in range(n):
-        for j in range(n):
-            result[i][j] = correlation(numeric_cols[i], numeric_cols[j])
+        n = self.n + other.n
+        delta = list(map(sub, other.mean, self.mean))
+        factor = self.n * other.n / n
+        for i, d in enumerate(delta):
+            scaled = d * factor
+            self.upper[i] = array('d', map(add, map(add, self.upper[i], other.upper[i]),
+                                           map(scaled.__mul__, delta[i:])))
+        self.mean = [m + d * other.n / n for m, d in zip(self.mean, delta)]
+        self.n = n
+        return self
+
+    def comoment(self):
+        """Matriks co-moment penuh (k x k), dicerminkan dari segitiga atas."""
+        k = self.k or 0
+        buf = array('d', [0.0]) * (k * k)
+        for i, row in enumerate(self.upper or []):
+            buf[i * k + i:(i + 1) * k] = row
+            buf[i * k + i::k] = row
+        return Matrix.from_flat(buf, k, k)
+
+    def covariance(self, ddof=1):
+        """Matriks kovarians C / (n − ddof)."""
+        if self.n <= ddof:
+            raise ValueError("Data terlalu sedikit untuk menghitung kovarians.")
+        C = self.comoment()
+        scale = 1.0 / (self.n - ddof)
+        return Matrix.from_flat(array('d', map(scale.__mul__, C.buffer)), C.rows, C.cols)
+
+    def correlation(self):
+        """Matriks korelasi Pearson; kolom konstan berkorelasi 0."""
+        if self.n < 2:
+            raise ValueError("Data terlalu sedikit untuk menghitung korelasi.")
+        k = self.k
+        C = self.comoment().buffer
+        scale = [1.0 / sqrt(v) if v > 0 else 0.0 for v in C[::k + 1]]
+        buf = array('d', (min(max(C[i * k + j] * scale[i] * scale[j], -1.0), 1.0)
+                          for i in range(k) for j in range(k)))
+        return Matrix.from_flat(buf, k, k)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _csv_reader(source):
+        if isinstance(source.read(0), bytes):
+            source = io.TextIOWrapper(source, encoding="utf-8", newline="")
+        reader = csv.reader(source)
+        return reader, [h.strip() for h in next(reader, [])]
+
+    @classmethod
+    def from_csv(cls, source, columns=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None):
+        """
+        Membaca satu CSV (path, file teks atau biner) per ``chunk_size`` baris.
+        ``columns`` memilih kolom berdasarkan nama header; default semua
+        kolom numerik pada baris data pertama. Sel kosong/NA → baris dilewati.
+        """
+        if isinstance(source, str):
+            with open(source, newline="", encoding="utf-8") as f:
+                return cls.from_csv(f, columns, chunk_size, backend)
+        reader, header = cls._csv_reader(source)
+        index = None
+        if columns is not None:
+            index = _column_index(header, columns)
+
+        model, chunk = None, []
+        for row_number, row in enumerate(reader, start=2):
+            if not row:
+                continue
+            if index is None:
+                index = _numeric_index(row)
+            if model is None:
+                model = cls(_column_names(header, index), backend)
+            values = [_to_float(row[j]) if j < len(row) else _NAN for j in index]
+            if None in values:
+                column = model.columns[values.index(None)]
+                raise ValueError(f"Nilai non-numerik di baris {row_number}, kolom '{column}'.")
+            chunk.append(values)
+            if len(chunk) >= chunk_size:
+                model.partial_fit(chunk)
+                chunk = []
+        if model is None:
+            return cls(columns, backend)
+        if chunk:
+            model.partial_fit(chunk)
+        return model
+
+
+def _numeric_index(row):
+    """Indeks kolom numerik pada satu baris data."""
+    return [j for j, v in enumerate(row) if _to_float(v) is not None]
+
+
+def _column_names(header, index):
+    """Nama kolom dari header; kolom di luar header (header pendek) → X<j>."""
+    return [header[j] if j < len(header) else f"X{j}" for j in index]
+
+
+def _column_index(header, columns):
+    """Indeks untuk nama kolom (termasuk nama X<j> untuk kolom tanpa header)."""
+    index, missing = [], []
+    for c in columns:
+        if c in header:
+            index.append(header.index(c))
+        elif c[:1] == "X" and c[1:].isdigit() and int(c[1:]) >= len(header):
+            index.append(int(c[1:]))
+        else:
+            missing.append(c)
+    if missing:
+        raise ValueError(f"Kolom {missing} tidak ada pada header CSV.")
+    return index
+
+
+def csv_numeric_columns(source):
+    """
+    Nama kolom numerik sebuah CSV dari header dan baris data pertama saja
+    (aturan yang sama dengan ``CorrelationAccumulator.from_csv``).
+    """
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as f:
+            return csv_numeric_columns(f)
+    reader, header = CorrelationAccumulator._csv_reader(source)
+    row = next((row for row in reader if row), None)
+    return _column_names(header, _numeric_index(row)) if row is not None else []
+
+
+def _accumulate_csv(job):
+    """Tugas worker (level modul agar bisa di-pickle): satu file → akumulator."""
+    path, columns, chunk_size = job
+    return CorrelationAccumulator.from_csv(path, columns, chunk_size)
+
+
+def correlation_from_csv_dir(directory, pattern="*.csv", columns=None,
+                             chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """
+    Mereduksi semua CSV di ``directory`` menjadi satu ``CorrelationAccumulator``.
+    Tiap file diproses di proses terpisah (jumlah worker mengikuti
+    ``MATRIKS_WORKERS``) lalu hasilnya digabung dengan ``merge``. Kolom
+    ditentukan dari file pertama bila ``columns`` tidak diberikan.
+    """
+    paths = sorted(glob.glob(os.path.join(directory, pattern)))
+    if not paths:
+        raise ValueError(f"Tidak ada file '{pattern}' di {directory}.")
+    if columns is None:
+        columns = csv_numeric_columns(paths[0])
+
+    jobs = [(path, columns, chunk_size) for path in paths]
+    workers = worker_count() if workers is None else max(1, int(workers))
+    if workers < 2 or len(jobs) < 2:
+        parts = map(_accumulate_csv, jobs)
+    else:
+        # spawn: dipanggil juga dari thread antrean job di proses web
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            parts = list(executor.map(_accumulate_csv, jobs))
 
-    return numeric_names, Matrix(result)
+    total = CorrelationAccumulator(columns)
+    for part in parts:
+        total.merge(part)
+    return total
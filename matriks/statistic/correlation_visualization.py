@@ -1,30 +1,111 @@
+import warnings
 import numpy as np
 from matriks.matrix import Matrix
-import matplotlib.pyplot as plt
 
-def plot_correlation_matrix(matrix, labels):
+try:
+    from scipy.cluster.hierarchy import linkage, leaves_list
+    from scipy.spatial.distance import squareform
+except ImportError:  # SciPy opsional → pengurutan klaster tidak tersedia
+    linkage = None
+
+# Matplotlib diimpor di dalam fungsi gambar saja: modul ini (konstanta,
+# prepare_heatmap) juga diimpor proses web yang tidak pernah menggambar.
+
+# Angka di dalam sel hanya ditulis bila heatmap cukup kecil untuk dibaca
+ANNOTATE_LIMIT = 20
+# Sisi maksimum heatmap; matriks yang lebih besar dirata-ratakan per blok
+MAX_CELLS = 200
+# Label sumbu dijarangkan bila lebih banyak dari ini
+MAX_TICK_LABELS = 60
+
+
+def _as_array(matrix):
+    if isinstance(matrix, Matrix):
+        # Bungkus buffer Matrix langsung tanpa salinan
+        return np.asarray(matrix)
+    return np.array(matrix, dtype=float)
+
+
+def cluster_order(data):
     """
-    Menampilkan heatmap dari matriks korelasi.
+    Urutan kolom dari klaster hierarkis (average linkage, jarak 1 − |r|)
+    sehingga variabel yang berkorelasi kuat bersebelahan.
     """
-    if isinstance(matrix, Matrix):
-        data = matrix.data
-    else:
-        data = matrix
+    k = data.shape[0]
+    if linkage is None or k < 3:
+        return list(range(k))
+    distance = 1.0 - np.abs(np.nan_to_num(data, nan=0.0))
+    distance = (distance + distance.T) / 2
+    np.fill_diagonal(distance, 0.0)
+    distance = np.clip(distance, 0.0, None)
+    return leaves_list(linkage(squareform(distance, checks=False), method="average")).tolist()
+
+
+def downsample(data, labels, max_size=MAX_CELLS):
+    """
+    Merata-ratakan blok b x b (b = ⌈k / max_size⌉) sehingga sisi heatmap
+    tidak lebih dari ``max_size``. Label blok memakai label pertama blok itu.
+    """
+    k = data.shape[0]
+    if k <= max_size:
+        return data, list(labels)
+    block = -(-k // max_size)
+    size = -(-k // block)
+    padded = np.full((size * block, size * block), np.nan)
+    padded[:k, :k] = data
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # blok yang seluruhnya NaN
+        reduced = np.nanmean(padded.reshape(size, block, size, block), axis=(1, 3))
+    return reduced, [f"{labels[i]}…" for i in range(0, k, block)]
+
 
-    data = np.array(data, dtype=float)
+def draw_heatmap(ax, data, labels, annotate_limit=ANNOTATE_LIMIT,
+                 title="Heatmap Korelasi Antar Variabel"):
+    """Menggambar heatmap ke ``ax`` sekali jalan; anotasi hanya untuk matriks kecil."""
+    k = data.shape[0]
+    image = ax.imshow(data, cmap="coolwarm", vmin=-1, vmax=1, interpolation="nearest")
+    ax.figure.colorbar(image, ax=ax, label="Korelasi")
 
-    plt.figure(figsize=(16, 12))
-    plt.imshow(data, cmap="coolwarm", interpolation="nearest")
-    plt.colorbar(label="Korelasi")
-    plt.xticks(range(len(labels)), labels, rotation=45, ha="right")
-    plt.yticks(range(len(labels)), labels)
-    plt.title("Heatmap Korelasi Antar Variabel", fontsize=14, fontweight="bold")
+    step = max(1, -(-k // MAX_TICK_LABELS))
+    ticks = range(0, k, step)
+    ax.set_xticks(ticks)
+    ax.set_yticks(ticks)
+    ax.set_xticklabels([labels[i] for i in ticks], rotation=45, ha="right")
+    ax.set_yticklabels([labels[i] for i in ticks])
+    ax.set_title(title, fontsize=14, fontweight="bold")
 
     # Tampilkan nilai di dalam sel
-    for i in range(len(labels)):
-        for j in range(len(labels)):
-            plt.text(j, i, f"{data[i][j]:.2f}", ha="center", va="center", color="black")
+    if k <= annotate_limit:
+        for i in range(k):
+            for j in range(k):
+                if data[i, j] == data[i, j]:
+                    ax.text(j, i, f"{data[i, j]:.2f}", ha="center", va="center", color="black")
+
+
+def prepare_heatmap(matrix, labels, cluster=False, max_size=MAX_CELLS):
+    """Data + label siap gambar: opsional diurutkan per klaster lalu di-downsample."""
+    data = _as_array(matrix)
+    labels = list(labels)
+    if cluster:
+        order = cluster_order(data)
+        data = data[np.ix_(order, order)]
+        labels = [labels[i] for i in order]
+    return downsample(data, labels, max_size)
+
 
-    plt.tight_layout()
+def heatmap_size(k):
+    """Ukuran figure (inci) yang tumbuh dengan jumlah variabel sampai batas."""
+    side = min(16.0, 4.0 + 0.4 * k)
+    return side * 4 / 3, side
+
+
+def plot_correlation_matrix(matrix, labels, cluster=False):
+    """
+    Menampilkan heatmap dari matriks korelasi.
+    """
+    import matplotlib.pyplot as plt
+    data, labels = prepare_heatmap(matrix, labels, cluster)
+    fig, ax = plt.subplots(figsize=(16, 12))
+    draw_heatmap(ax, data, labels)
+    fig.tight_layout()
     plt.show()
-    
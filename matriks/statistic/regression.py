@@ -1,34 +1,464 @@
 # matriks/operations/regresi_linier.py
-from matriks.operations.transpose import transpose
-from matriks.operations.inverse import inverse
+import sys
+from array import array
+from itertools import chain
+from math import sqrt, log
+from operator import mul, sub
 from matriks.operations.multiplier import multiply_matrices
+from matriks.operations.structured import cholesky_inverse, cholesky_solve, triangular_inverse
 from matriks.matrix import Matrix
 
-def regresi_linier(X, y):
-    """
-    Menghitung regresi linier sederhana atau berganda menggunakan metode OLS.
-    Rumus: β = (XᵀX)⁻¹ Xᵀy
-    """
+_EPS = sys.float_info.epsilon
+
+METODE_REGRESI = ("cholesky", "qr", "svd")
+
+
+def _dot(x, y):
+    return sum(map(mul, x, y))
 
-    # Pastikan y berbentuk kolom
+
+def _kolom_y(y):
+    """Menormalkan y (Matrix kolom, list 1D atau list of lists) menjadi list float."""
     if isinstance(y, Matrix):
-        y_data = y.data
-    elif isinstance(y, list):
+        return list(y.buffer)
+    if isinstance(y, list):
         # Kalau list 1D, ubah jadi kolom
         if not isinstance(y[0], list):
-            y_data = [[val] for val in y]
-        else:
-            y_data = y
+            return [float(val) for val in y]
+        return [float(row[0]) for row in y]
+    raise TypeError("y harus berupa Matrix atau list.")
+
+
+def _norm1(rows):
+    """Norma-1 (jumlah mutlak kolom terbesar) dari list baris."""
+    return max((sum(map(abs, col)) for col in zip(*rows)), default=0.0)
+
+
+def _ols_cholesky(X, y, backend):
+    """
+    XᵀX dibentuk sekali sebagai Gram simetris (hanya segitiga atas yang
+    dihitung), lalu difaktorkan Cholesky. (XᵀX)⁻¹ berukuran p x p hanya
+    dipakai untuk galat baku dan kondisi.
+    """
+    X_lazy = X.lazy()
+    XtX = (X_lazy.T @ X_lazy).evaluate(backend)
+    XtY = (X_lazy.T @ Matrix.from_flat(y, len(y), 1).lazy()).evaluate(backend)
+    L = XtX.properties().cholesky
+    try:
+        if L is None:
+            raise ValueError
+        beta = cholesky_solve(L, XtX, XtY)
+    except ValueError:
+        raise ValueError("XᵀX tidak definit positif (kolom X kolinear); gunakan metode 'qr' atau 'svd'.")
+    XtX_inv = cholesky_inverse(L, XtX).tolist()
+    p = X.cols
+    # κ(X) ≈ √κ₁(XᵀX)
+    condition = sqrt(_norm1(XtX.tolist()) * _norm1(XtX_inv))
+    return list(beta.buffer), [XtX_inv[j][j] for j in range(p)], p, condition
+
+
+def _householder(columns, y, n, p):
+    """
+    QR Householder di tempat atas kolom-kolom X (list per kolom); y ikut
+    ditransformasi menjadi Qᵀy. Mengembalikan R (list baris p x p).
+    """
+    for k in range(min(n, p)):
+        x = columns[k]
+        norm = sqrt(_dot(x[k:], x[k:]))
+        if norm == 0:
+            continue
+        alpha = -norm if x[k] >= 0 else norm
+        v = x[k:]
+        v[0] -= alpha
+        vnorm2 = _dot(v, v)
+        x[k:] = [alpha] + [0.0] * (n - k - 1)
+        for target in columns[k + 1:] + [y]:
+            factor = 2.0 * _dot(v, target[k:]) / vnorm2
+            if factor:
+                target[k:] = map(sub, target[k:], map(factor.__mul__, v))
+    return [[columns[j][i] if j >= i else 0.0 for j in range(p)] for i in range(p)]
+
+
+def _ols_qr(X, y):
+    """
+    QR Householder langsung pada X (tanpa membentuk XᵀX, sehingga kondisi
+    tidak dikuadratkan): Rβ = (Qᵀy)[:p], (XᵀX)⁻¹ = R⁻¹R⁻ᵀ.
+    """
+    n, p = X.rows, X.cols
+    if n < p:
+        raise ValueError("Metode 'qr' butuh jumlah baris ≥ jumlah kolom X; gunakan metode 'svd'.")
+    columns = [list(X.col(j)) for j in range(p)]
+    qty = list(y)
+    R = _householder(columns, qty, n, p)
+
+    r_max = max((abs(R[i][i]) for i in range(p)), default=0.0)
+    rank = sum(1 for i in range(p) if abs(R[i][i]) > max(n, p) * _EPS * r_max)
+    if rank < p:
+        raise ValueError(f"X tidak berpangkat penuh (rank {rank} < {p}); gunakan metode 'svd'.")
+
+    R_inv = triangular_inverse(Matrix(R), lower=False).tolist()
+    beta = [_dot(row, qty[:p]) for row in R_inv]
+    variances = [_dot(row, row) for row in R_inv]
+    condition = _norm1(R) * _norm1(R_inv)
+    return beta, variances, rank, condition
+
+
+def _jacobi_svd(A, p):
+    """
+    SVD satu sisi (Jacobi) dari matriks kecil p x p (list baris).
+    Mengembalikan (sigma, U kolom, V kolom) dengan A = U·diag(sigma)·Vᵀ.
+    """
+    a = [list(col) for col in zip(*A)]  # kolom A
+    v = [[1.0 if i == j else 0.0 for i in range(p)] for j in range(p)]
+    for _ in range(60):
+        rotated = False
+        for i in range(p - 1):
+            for j in range(i + 1, p):
+                alpha, beta, gamma = _dot(a[i], a[i]), _dot(a[j], a[j]), _dot(a[i], a[j])
+                if abs(gamma) <= _EPS * sqrt(alpha * beta) or gamma == 0:
+                    continue
+                rotated = True
+                zeta = (beta - alpha) / (2.0 * gamma)
+                t = (1.0 if zeta >= 0 else -1.0) / (abs(zeta) + sqrt(1.0 + zeta * zeta))
+                c = 1.0 / sqrt(1.0 + t * t)
+                s = c * t
+                for cols in (a, v):
+                    ci, cj = cols[i], cols[j]
+                    cols[i] = [c * x - s * y for x, y in zip(ci, cj)]
+                    cols[j] = [s * x + c * y for x, y in zip(ci, cj)]
+        if not rotated:
+            break
+    sigma = [sqrt(_dot(col, col)) for col in a]
+    u = [[x / s for x in col] if s else col for col, s in zip(a, sigma)]
+    return sigma, u, v
+
+
+def _ols_svd(X, y):
+    """
+    Pseudo-invers lewat SVD dari R (X = QR, sehingga nilai singular X = nilai
+    singular R): β = V Σ⁺ Uᵀ (Qᵀy)[:p]. Nilai singular di bawah toleransi
+    dianggap nol → solusi norma minimum untuk data yang tidak berpangkat penuh.
+    """
+    n, p = X.rows, X.cols
+    columns = [list(X.col(j)) for j in range(p)]
+    qty = list(y)
+    if n < p:
+        # Baris nol tidak mengubah solusi kuadrat terkecil
+        columns = [col + [0.0] * (p - n) for col in columns]
+        qty += [0.0] * (p - n)
+        n = p
+    R = _householder(columns, qty, n, p)
+
+    sigma, u, v = _jacobi_svd(R, p)
+    s_max = max(sigma, default=0.0)
+    tol = max(X.rows, p) * _EPS * s_max
+    keep = [k for k in range(p) if sigma[k] > tol]
+
+    z = qty[:p]
+    beta = [0.0] * p
+    variances = [0.0] * p
+    for k in keep:
+        coef = _dot(u[k], z) / sigma[k]
+        vk, inv_s2 = v[k], 1.0 / (sigma[k] * sigma[k])
+        beta = [b + coef * x for b, x in zip(beta, vk)]
+        variances = [w + inv_s2 * x * x for w, x in zip(variances, vk)]
+    s_min = min(sigma, default=0.0)
+    condition = s_max / s_min if s_min > 0 else float("inf")
+    return beta, variances, len(keep), condition
+
+
+def regresi_linier_detail(X, y, metode="cholesky", backend=None):
+    """
+    Regresi linier OLS dengan pilihan solver; satu faktorisasi menggantikan
+    transpose + dua perkalian + invers penuh.
+
+    - "cholesky": XᵀX (Gram simetris, satu lintasan) = LLᵀ. Tercepat.
+    - "qr"      : Householder QR pada X, untuk desain yang ill-conditioned.
+    - "svd"     : pseudo-invers, untuk data yang tidak berpangkat penuh.
+
+    Mengembalikan dict: beta (Matrix p x 1), std_error, rank, condition
+    (estimasi bilangan kondisi X), sigma2 (varians residual), df dan method.
+    """
+    metode = (metode or "cholesky").lower()
+    if metode not in METODE_REGRESI:
+        raise ValueError(f"Metode regresi '{metode}' tidak dikenal. Pilihan: {', '.join(METODE_REGRESI)}.")
+    y_data = _kolom_y(y)
+    if len(y_data) != X.rows:
+        raise ValueError("Jumlah baris X dan y harus sama.")
+
+    if metode == "cholesky":
+        beta, variances, rank, condition = _ols_cholesky(X, y_data, backend)
+    elif metode == "qr":
+        beta, variances, rank, condition = _ols_qr(X, y_data)
     else:
-        raise TypeError("y harus berupa Matrix atau list.")
+        beta, variances, rank, condition = _ols_svd(X, y_data)
 
-    Xt = transpose(X)
-    XtX = multiply_matrices(Xt, X)
-    XtX_inv = inverse(XtX)
-    XtY = multiply_matrices(Xt, Matrix(y_data))
-    beta = multiply_matrices(XtX_inv, XtY)
+    beta = Matrix.from_flat(beta, X.cols, 1)
+    residuals = map(sub, y_data, prediksi(X, beta).buffer)
+    sse = sum(r * r for r in residuals)
+    df = X.rows - rank
+    sigma2 = sse / df if df > 0 else float("nan")
+    return {
+        "beta": beta,
+        "std_error": [sqrt(sigma2 * w) for w in variances],
+        "rank": rank,
+        "condition": condition,
+        "sigma2": sigma2,
+        "df": df,
+        "method": metode,
+    }
+
+
+def regresi_linier(X, y, metode="cholesky", backend=None):
+    """
+    Menghitung regresi linier sederhana atau berganda menggunakan metode OLS.
+    Rumus: β = (XᵀX)⁻¹ Xᵀy, diselesaikan tanpa invers eksplisit
+    (lihat ``regresi_linier_detail`` untuk pilihan metode dan diagnostik).
+    """
+    return regresi_linier_detail(X, y, metode, backend)["beta"]
+
+
+def _sweep(A, k):
+    """
+    Operator sweep (Goodnight) pada pivot k, di tempat atas list baris.
+    Bersifat involutif: menyapu k dua kali mengembalikan matriks semula.
+    """
+    row_k = A[k]
+    inv = 1.0 / row_k[k]
+    row_k[:] = [v * inv for v in row_k]
+    for i, row in enumerate(A):
+        if i != k:
+            b = row[k]
+            if b:
+                row[:] = map(sub, row, map(b.__mul__, row_k))
+                row[k] = -b * inv
+    row_k[k] = inv
+
+
+class RegresiBatch:
+    """
+    Banyak model OLS dari satu matriks cross-product teraugmentasi.
+
+    C = ZᵀZ dengan Z = [1 | data] dihitung sekali (satu lintasan data);
+    setiap model (target, himpunan prediktor) lalu diturunkan dengan operasi
+    sweep pada C berukuran (k+1) x (k+1), tanpa menyentuh data lagi:
+    setelah prediktor S disapu, C[y][y] = SSE dan C[S][y] = β.
+
+    - ``fit``                 : satu model
+    - ``all_subsets``         : semua 2ᵖ−1 subset prediktor, urutan kode Gray
+                                (satu sweep per model)
+    - ``best_subset``         : branch-and-bound berdasarkan R² (per ukuran) atau AIC
+    - ``each_against_others`` : setiap kolom sebagai target terhadap kolom lainnya
+    """
+
+    # Pivot dianggap nol (prediktor kolinear) bila sisa variansnya di bawah ini
+    PIVOT_TOL = 1e-10
+
+    def __init__(self, data, columns=None, intercept=True, backend=None):
+        if not isinstance(data, Matrix):
+            data = Matrix(data)
+        n, k = data.rows, data.cols
+        lazy = data.lazy()
+        gram = (lazy.T @ lazy).evaluate(backend).tolist()
+        sums = [sum(data.col(j)) for j in range(k)]
+
+        self.n = n
+        self.k = k
+        self.intercept = intercept
+        self.columns = list(columns or getattr(data, "header", None) or [f"X{j + 1}" for j in range(k)])
+        # Indeks 0 = konstanta, indeks j + 1 = kolom data ke-j
+        self.cross = [[float(n)] + sums] + [[sums[i]] + gram[i] for i in range(k)]
+        self._base = None
+        self._cache = {}
+
+    # ------------------------------------------------------------------
+    def _index(self, column):
+        if isinstance(column, str):
+            if column not in self.columns:
+                raise ValueError(f"Kolom '{column}' tidak ditemukan dalam header.")
+            return self.columns.index(column)
+        if not -self.k <= column < self.k:
+            raise ValueError(f"Indeks kolom {column} di luar jangkauan.")
+        return column % self.k
+
+    def _base_matrix(self):
+        """C dengan konstanta sudah disapu (jika ada intercept)."""
+        if self._base is None:
+            self._base = [row[:] for row in self.cross]
+            if self.intercept and self.n:
+                _sweep(self._base, 0)
+        return self._base
 
-    return beta
+    def _sst(self, t):
+        c = self.cross
+        return c[t + 1][t + 1] - c[0][t + 1] ** 2 / self.n
+
+    def _model(self, A, t, subset):
+        """Menyusun hasil model dari matriks yang sudah disapu untuk ``subset``."""
+        sse = max(A[t + 1][t + 1], 0.0)
+        sst = self._sst(t)
+        params = len(subset) + (1 if self.intercept else 0)
+        idx = ([0] if self.intercept else []) + [j + 1 for j in subset]
+        return {
+            "target": self.columns[t],
+            "predictors": [self.columns[j] for j in subset],
+            "beta": [A[i][t + 1] for i in idx],
+            "SSE": sse,
+            "R2": 1 - sse / sst if sst else float("nan"),
+            "AIC": self._aic(sse, params),
+        }
+
+    def _aic(self, sse, params):
+        if sse <= 0:
+            return float("-inf")
+        return self.n * log(sse / self.n) + 2 * params
+
+    def _sse(self, t, subset):
+        """SSE untuk (target, subset) lewat sweep pada submatriks kecil (di-memo)."""
+        key = (t, subset)
+        sse = self._cache.get(key)
+        if sse is None:
+            idx = ([0] if self.intercept else []) + [j + 1 for j in subset] + [t + 1]
+            A = [[self.cross[i][j] for j in idx] for i in idx]
+            for pivot in range(len(idx) - 1):
+                if A[pivot][pivot] <= self.PIVOT_TOL * max(self.cross[idx[pivot]][idx[pivot]], 1.0):
+                    raise ValueError(f"Prediktor kolinear dalam model {[self.columns[j] for j in subset]}.")
+                _sweep(A, pivot)
+            sse = self._cache[key] = max(A[-1][-1], 0.0)
+        return sse
+
+    def _predictors(self, t, predictors):
+        if predictors is None:
+            return tuple(j for j in range(self.k) if j != t)
+        result = tuple(sorted({self._index(c) for c in predictors}))
+        if t in result:
+            raise ValueError("Target tidak boleh menjadi prediktor.")
+        return result
+
+    # ------------------------------------------------------------------
+    def fit(self, target, predictors=None):
+        """Satu model: ``target`` terhadap ``predictors`` (default semua kolom lain)."""
+        t = self._index(target)
+        subset = self._predictors(t, predictors)
+        A = [row[:] for row in self._base_matrix()]
+        for j in subset:
+            if A[j + 1][j + 1] <= self.PIVOT_TOL * max(self.cross[j + 1][j + 1], 1.0):
+                raise ValueError(f"Prediktor kolinear dalam model {[self.columns[j] for j in subset]}.")
+            _sweep(A, j + 1)
+        return self._model(A, t, subset)
+
+    def each_against_others(self):
+        """Setiap kolom diregresikan terhadap semua kolom lainnya."""
+        return [self.fit(t) for t in range(self.k)]
+
+    def all_subsets(self, target, predictors=None, max_size=None):
+        """
+        Semua subset tak kosong dari ``predictors``. Subset dikunjungi dalam
+        urutan kode Gray sehingga tiap model hanya butuh satu sweep (masuk
+        atau keluar satu prediktor). Subset kolinear dilewati.
+        """
+        t = self._index(target)
+        pool = self._predictors(t, predictors)
+        A = [row[:] for row in self._base_matrix()]
+        chosen, swept = set(), set()
+        results = []
+        for step in range(1, 2 ** len(pool)):
+            j = pool[(step & -step).bit_length() - 1]
+            if j in chosen:
+                chosen.discard(j)
+                if j in swept:
+                    _sweep(A, j + 1)
+                    swept.discard(j)
+            else:
+                chosen.add(j)
+            # Prediktor yang tadi kolinear bisa disapu lagi setelah pasangannya keluar
+            for j in sorted(chosen - swept):
+                if A[j + 1][j + 1] > self.PIVOT_TOL * max(self.cross[j + 1][j + 1], 1.0):
+                    _sweep(A, j + 1)
+                    swept.add(j)
+            if swept == chosen and (max_size is None or len(chosen) <= max_size):
+                results.append(self._model(A, t, tuple(sorted(chosen))))
+        return results
+
+    def best_subset(self, target, criterion="r2", predictors=None, max_size=None):
+        """
+        Subset terbaik dengan branch-and-bound. Batas bawah SSE suatu cabang
+        adalah SSE model dengan semua kandidat yang tersisa (menambah
+        prediktor tidak pernah menaikkan SSE), sehingga cabang yang tidak
+        mungkin mengalahkan model terbaik dipangkas tanpa dievaluasi.
+
+        - ``criterion="r2"`` : model dengan R² terbesar untuk setiap ukuran
+          subset (dict ukuran → model)
+        - ``criterion="aic"``: satu model dengan AIC terkecil
+        """
+        criterion = criterion.lower()
+        if criterion not in ("r2", "aic"):
+            raise ValueError("Kriteria harus 'r2' atau 'aic'.")
+        t = self._index(target)
+        pool = self._predictors(t, predictors)
+        limit = len(pool) if max_size is None else min(max_size, len(pool))
+        extra = 1 if self.intercept else 0
+        best = {}  # ukuran → (sse, subset) untuk r2; 0 → (aic, subset) untuk aic
+
+        def sse_or_none(subset):
+            try:
+                return self._sse(t, subset)
+            except ValueError:
+                return None
+
+        def visit(included, candidates):
+            size = len(included)
+            if size:
+                sse = sse_or_none(included)
+                if sse is None:
+                    return
+                if criterion == "r2":
+                    if size not in best or sse < best[size][0]:
+                        best[size] = (sse, included)
+                else:
+                    aic = self._aic(sse, size + extra)
+                    if not best or aic < best[0][0]:
+                        best[0] = (aic, included)
+            room = limit - size
+            if not candidates or room <= 0:
+                return
+
+            # Batas: SSE terkecil yang mungkin dicapai di cabang ini
+            bound = sse_or_none(included + candidates)
+            if bound is not None:
+                if criterion == "r2":
+                    sizes = range(size + 1, size + min(room, len(candidates)) + 1)
+                    if all(m in best and best[m][0] <= bound for m in sizes):
+                        return
+                elif best and self._aic(bound, size + 1 + extra) >= best[0][0]:
+                    return
+            for i, c in enumerate(candidates):
+                visit(included + (c,), candidates[i + 1:])
+
+        visit((), pool)
+
+        def build(subset):
+            A = [row[:] for row in self._base_matrix()]
+            for j in subset:
+                _sweep(A, j + 1)
+            return self._model(A, t, subset)
+
+        if criterion == "r2":
+            return {size: build(subset) for size, (_, subset) in sorted(best.items())}
+        return build(best[0][1]) if best else None
+
+
+def pisah_xy(A):
+    """
+    Memisahkan Matrix data menjadi (X, y, nama kolom X, target) dengan kolom
+    terakhir sebagai Y; nama diambil dari ``A.header`` bila ada.
+    """
+    if A.cols < 2:
+        raise ValueError("Matriks regresi harus memiliki minimal dua kolom (X dan Y).")
+    names = list(getattr(A, 'header', None) or [f"X{j + 1}" for j in range(A.cols)])
+    X = Matrix.from_flat(array('d', chain.from_iterable(A.row(i)[:-1] for i in range(A.rows))), A.rows, A.cols - 1)
+    y = Matrix.from_flat(A.buffer[A.cols - 1::A.cols], A.rows, 1)
+    return X, y, names[:-1], names[-1]
 
 
 def prediksi(X, beta):
@@ -26,12 +26,28 @@ def plot_regresi(X, y, beta, judul="Visualisasi Regresi Linier"):
     y_pred = [intercept + slope * xi for xi in X_data]
 
     # Plot
-    plt.figure(figsize=(8, 6))
-    plt.scatter(X_data, y_data, color="#FF6B6B", label="Data Aktual")
-    plt.plot(X_data, y_pred, color="#1A535C", linewidth=2, label="Garis Regresi")
-    plt.title(judul, fontsize=14, fontweight="bold")
-    plt.xlabel("X")
-    plt.ylabel("Y")
-    plt.legend()
-    plt.grid(True, linestyle="--", alpha=0.5)
+    fig, ax = plt.subplots(figsize=(8, 6))
+    draw_regresi(ax, X_data, y_data, y_pred, judul)
     plt.show()
+
+
+def draw_regresi(ax, X_data, y_data, y_pred, judul="Visualisasi Regresi Linier"):
+    """Scatter data dan garis regresi ke ``ax`` (dipakai juga oleh renderer web)."""
+    ax.scatter(X_data, y_data, color="#FF6B6B", label="Data Aktual")
+    ax.plot(X_data, y_pred, color="#1A535C", linewidth=2, label="Garis Regresi")
+    ax.set_title(judul, fontsize=14, fontweight="bold")
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+    ax.legend()
+    ax.grid(True, linestyle="--", alpha=0.5)
+
+
+def draw_prediksi(ax, y_actual, y_predict, judul="Plot Regresi Linier"):
+    """Scatter Y aktual vs Y prediksi beserta garis ideal y = ŷ."""
+    ax.scatter(y_actual, y_predict, color='blue', label='Prediksi')
+    min_y, max_y = min(y_actual), max(y_actual)
+    ax.plot([min_y, max_y], [min_y, max_y], color='red', linestyle='--', label='Garis Ideal')
+    ax.set_xlabel("Y Aktual")
+    ax.set_ylabel("Y Prediksi")
+    ax.set_title(judul)
+    ax.legend()
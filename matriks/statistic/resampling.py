@@ -0,0 +1,309 @@
+# matriks/statistic/resampling.py
+"""
+Resampling untuk regresi OLS: k-fold, repeated k-fold, leave-one-out dan
+interval kepercayaan bootstrap untuk β.
+
+XᵀX dan Xᵀy data penuh dihitung sekali. Solusi tiap fold diperoleh dengan
+*downdating*: XᵀX₋f = XᵀX − X_fᵀX_f dan Xᵀy₋f = Xᵀy − X_fᵀy_f, sehingga
+tiap fold hanya menyentuh baris yang ditahan (O(|f|·p²) + Cholesky p x p).
+LOO bahkan tidak butuh refit: residual PRESS = eᵢ / (1 − hᵢᵢ).
+
+Fold dan replikasi bootstrap dibagikan ke ``ProcessPoolExecutor`` bila
+datanya cukup besar (lihat ``MIN_PARALLEL_WORK``); jumlah worker mengikuti
+``MATRIKS_WORKERS`` seperti backend paralel. Pool memakai konteks spawn
+(resampling berjalan di thread antrean job) dan data bersama (mis. baris
+bootstrap) dikirim sekali per worker lewat initializer, bukan per tugas.
+"""
+import multiprocessing
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import sqrt
+from operator import mul, sub
+
+from ..matrix import Matrix
+from ..backends.parallel_backend import worker_count
+from ..operations.structured import cholesky_solve, cholesky_inverse
+from ..properties import cholesky_factor
+from ..progress import report_progress
+
+# Perkiraan jumlah perkalian (tugas x n x p²) minimum agar pool proses sepadan
+MIN_PARALLEL_WORK = 5_000_000
+
+DEFAULT_FOLDS = 5
+DEFAULT_BOOTSTRAP = 1000
+
+
+def _dot(x, y):
+    return sum(map(mul, x, y))
+
+
+def _gram(rows, y, p):
+    """(XᵀX, Xᵀy) untuk list baris ``rows`` (atau Matrix) — Gram simetris lewat ekspresi lazy."""
+    if isinstance(rows, Matrix):
+        X = rows
+    else:
+        X = Matrix(rows) if rows else Matrix.zeros(0, p)
+    lazy = X.lazy()
+    XtX = (lazy.T @ lazy).evaluate()
+    Xty = (lazy.T @ Matrix.from_flat(y, len(y), 1).lazy()).evaluate()
+    return XtX, Xty
+
+
+def _solve(XtX, Xty):
+    """β dari persamaan normal dengan Cholesky; None jika XᵀX tidak definit positif."""
+    L = cholesky_factor(XtX)
+    if L is None:
+        return None
+    try:
+        return list(cholesky_solve(L, XtX, Xty).buffer)
+    except ValueError:
+        return None
+
+
+def _prepare(X, y):
+    if not isinstance(X, Matrix):
+        X = Matrix(X)
+    if isinstance(y, Matrix):
+        y = list(y.buffer)
+    else:
+        y = [float(v[0]) if isinstance(v, list) else float(v) for v in y]
+    if len(y) != X.rows:
+        raise ValueError("Jumlah baris X dan y harus sama.")
+    return X, y
+
+
+# Data bersama milik proses worker ini (diisi initializer pool)
+_worker_data = None
+
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _call(task, job):
+    return task(job, _worker_data)
+
+
+def _run(task, jobs, workers, work, data=None):
+    """
+    Menjalankan ``task(job, data)`` untuk setiap argumen di ``jobs``, paralel
+    bila sepadan. ``data`` dikirim sekali ke tiap worker, bukan per job.
+    """
+    workers = worker_count() if workers is None else max(1, int(workers))
+    if workers < 2 or len(jobs) < 2 or work < MIN_PARALLEL_WORK:
+        results = []
+        for index, job in enumerate(jobs):
+            results.append(task(job, data))
+            report_progress((index + 1) / len(jobs))
+        return results
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(data,)) as executor:
+        results = []
+        for result in executor.map(partial(_call, task), jobs):
+            results.append(result)
+            report_progress(len(results) / len(jobs))
+        return results
+
+
+# ----------------------------------------------------------------------
+# Tugas worker (level modul agar bisa di-pickle)
+# ----------------------------------------------------------------------
+def _fold_task(job, data=None):
+    """Satu fold: downdate Gram penuh dengan baris yang ditahan lalu uji pada baris itu."""
+    XtX_buf, Xty_buf, p, held_rows, held_y = job
+    H_XtX, H_Xty = _gram(held_rows, held_y, p)
+    XtX = Matrix.from_flat(array('d', map(sub, XtX_buf, H_XtX.buffer)), p, p)
+    Xty = Matrix.from_flat(array('d', map(sub, Xty_buf, H_Xty.buffer)), p, 1)
+    beta = _solve(XtX, Xty)
+    if beta is None:
+        raise ValueError("XᵀX fold tidak definit positif (baris latih terlalu sedikit atau kolinear).")
+    return sum((yi - _dot(row, beta)) ** 2 for row, yi in zip(held_rows, held_y))
+
+
+def _bootstrap_task(seeds, data):
+    """
+    Beberapa replikasi bootstrap; tiap seed menentukan sampel ulang n baris
+    dengan pengembalian. ``data`` = (buffer X datar, y, p), sama untuk semua job.
+    """
+    buf, y, p = data
+    n = len(y)
+    betas = []
+    for seed in seeds:
+        report_progress()  # titik batal job (no-op di proses worker)
+        rng = random.Random(seed)
+        counts = [0] * n
+        for _ in range(n):
+            counts[rng.randrange(n)] += 1
+        sample, sample_y = array('d'), array('d')
+        for i, c in enumerate(counts):
+            if c:
+                sample.extend(buf[i * p:(i + 1) * p] * c)
+                sample_y.extend(y[i:i + 1] * c)
+        beta = _solve(*_gram(Matrix.from_flat(sample, n, p), sample_y, p))
+        if beta is not None:
+            betas.append(beta)
+    return betas
+
+
+# ----------------------------------------------------------------------
+# API publik
+# ----------------------------------------------------------------------
+def k_fold(X, y, k=DEFAULT_FOLDS, repeats=1, seed=None, workers=None):
+    """
+    (Repeated) k-fold cross-validation. Mengembalikan MSE/RMSE out-of-sample
+    rata-rata, R² prediktif (1 − PRESS/SST) dan MSE tiap fold.
+    """
+    X, y = _prepare(X, y)
+    n, p = X.rows, X.cols
+    if not 2 <= k <= n:
+        raise ValueError(f"Jumlah fold harus antara 2 dan {n}.")
+
+    rows = X.tolist()
+    XtX, Xty = _gram(rows, y, p)
+    rng = random.Random(seed)
+    jobs, meta = [], []
+    for r in range(repeats):
+        order = list(range(n))
+        rng.shuffle(order)
+        for f in range(k):
+            held = order[f::k]
+            jobs.append((XtX.buffer, Xty.buffer, p, [rows[i] for i in held], [y[i] for i in held]))
+            meta.append((r, f, len(held)))
+
+    sse = _run(_fold_task, jobs, workers, n * p * p * repeats)
+    mean_y = sum(y) / n
+    sst = sum((v - mean_y) ** 2 for v in y)
+    press = [0.0] * repeats
+    folds = []
+    for (r, f, size), e in zip(meta, sse):
+        press[r] += e
+        folds.append({"repeat": r, "fold": f, "n_test": size, "MSE": e / size})
+    mse = sum(press) / (repeats * n)
+    return {
+        "method": "kfold" if repeats == 1 else "repeated_kfold",
+        "k": k,
+        "repeats": repeats,
+        "MSE": mse,
+        "RMSE": sqrt(mse),
+        "R2": 1 - (sum(press) / repeats) / sst if sst else float("nan"),
+        "folds": folds,
+    }
+
+
+def leave_one_out(X, y):
+    """
+    Leave-one-out tanpa refit: dengan hᵢᵢ = xᵢᵀ(XᵀX)⁻¹xᵢ, residual saat baris i
+    ditahan adalah eᵢ / (1 − hᵢᵢ) (identitas Sherman–Morrison).
+    """
+    X, y = _prepare(X, y)
+    n, p = X.rows, X.cols
+    rows = X.tolist()
+    XtX, Xty = _gram(rows, y, p)
+    L = cholesky_factor(XtX)
+    if L is None:
+        raise ValueError("XᵀX tidak definit positif (kolom X kolinear).")
+    beta = list(cholesky_solve(L, XtX, Xty).buffer)
+    inv = cholesky_inverse(L, XtX).tolist()
+
+    loo = []
+    for row, yi in zip(rows, y):
+        h = _dot(row, [_dot(inv_row, row) for inv_row in inv])
+        if h >= 1.0 - 1e-12:
+            raise ValueError("Baris dengan leverage 1; LOO tidak terdefinisi.")
+        loo.append((yi - _dot(row, beta)) / (1.0 - h))
+
+    press = sum(e * e for e in loo)
+    mean_y = sum(y) / n
+    sst = sum((v - mean_y) ** 2 for v in y)
+    return {
+        "method": "loo",
+        "PRESS": press,
+        "MSE": press / n,
+        "RMSE": sqrt(press / n),
+        "R2": 1 - press / sst if sst else float("nan"),
+        "residuals": loo,
+    }
+
+
+def _percentile(sorted_values, q):
+    """Persentil dengan interpolasi linear (seperti numpy default)."""
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def bootstrap(X, y, n_boot=DEFAULT_BOOTSTRAP, alpha=0.05, seed=None, workers=None):
+    """
+    Interval kepercayaan persentil bootstrap (1 − alpha) untuk β.
+    Replikasi yang XᵀX-nya singular (mis. sampel ulang kolinear) dilewati.
+    """
+    X, y = _prepare(X, y)
+    n, p = X.rows, X.cols
+    rows = X.tolist()
+    beta = _solve(*_gram(rows, y, p))
+    if beta is None:
+        raise ValueError("XᵀX tidak definit positif (kolom X kolinear).")
+
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(64) for _ in range(n_boot)]
+    parts = max(1, min(worker_count() if workers is None else int(workers), n_boot))
+    jobs = [seeds[i::parts] for i in range(parts)]
+    data = (X.buffer, array('d', y), p)
+    samples = [b for chunk in _run(_bootstrap_task, jobs, workers, n * p * p * n_boot, data) for b in chunk]
+    if len(samples) < 2:
+        raise ValueError("Replikasi bootstrap yang valid terlalu sedikit.")
+
+    lower, upper, std_error = [], [], []
+    for j in range(p):
+        values = sorted(b[j] for b in samples)
+        mean = sum(values) / len(values)
+        lower.append(_percentile(values, alpha / 2))
+        upper.append(_percentile(values, 1 - alpha / 2))
+        std_error.append(sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1)))
+    return {
+        "method": "bootstrap",
+        "beta": beta,
+        "ci_lower": lower,
+        "ci_upper": upper,
+        "std_error": std_error,
+        "alpha": alpha,
+        "n_boot": len(samples),
+    }
+
+
+def cross_validate(X, y, cv, seed=None, workers=None):
+    """
+    Menjalankan resampling dari spesifikasi teks (dipakai ``/api/regression``):
+    "loo", "kfold" / "kfold:10", "repeated:10x5" (k x ulangan),
+    "bootstrap" / "bootstrap:2000", atau bilangan bulat k.
+    """
+    spec = str(cv).strip().lower()
+    name, _, arg = spec.partition(":")
+    error = ValueError(f"Spesifikasi cv '{cv}' tidak dikenal (loo, kfold:k, repeated:kxr, bootstrap:n).")
+    try:
+        if name.isdigit():
+            name, k = "kfold", int(name)
+        elif name == "kfold":
+            k = int(arg or DEFAULT_FOLDS)
+        elif name == "repeated":
+            k, _, repeats = (arg or f"{DEFAULT_FOLDS}x10").partition("x")
+            k, repeats = int(k), int(repeats or 10)
+        elif name == "bootstrap":
+            n_boot = int(arg or DEFAULT_BOOTSTRAP)
+        elif name != "loo":
+            raise error
+    except ValueError:
+        raise error
+
+    if name == "loo":
+        return leave_one_out(X, y)
+    if name == "kfold":
+        return k_fold(X, y, k=k, seed=seed, workers=workers)
+    if name == "repeated":
+        return k_fold(X, y, k=k, repeats=repeats, seed=seed, workers=workers)
+    return bootstrap(X, y, n_boot=n_boot, seed=seed, workers=workers)
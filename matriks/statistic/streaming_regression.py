@@ -0,0 +1,186 @@
+# matriks/statistic/streaming_regression.py
+"""
+Regresi linier OLS streaming (out-of-core).
+
+Data dibaca per potongan (chunk) dan hanya statistik cukup yang disimpan:
+XᵀX (p x p), Xᵀy (p x 1), n, Σy dan Σy². Memori O(p²) berapa pun jumlah
+barisnya, sehingga CSV berukuran GB bisa diregresikan di container kecil.
+
+Contoh:
+    model = StreamingOLS()
+    for X_chunk, y_chunk in sumber_data:
+        model.partial_fit(X_chunk, y_chunk)
+    hasil = model.solve()
+
+    hasil = StreamingOLS.fit_csv("data.csv", chunk_size=50_000).solve()
+"""
+import csv
+import io
+from itertools import chain
+from math import sqrt
+from operator import mul
+from matriks.matrix import Matrix
+from matriks.operations.adder import add_matrices
+from matriks.operations.structured import cholesky_inverse, cholesky_solve
+from matriks.progress import report_progress
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _to_float(value, row_number, column):
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Nilai non-numerik '{value}' di baris {row_number}, kolom '{column}'.")
+
+
+def _is_number(value):
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+class StreamingOLS:
+    """
+    Akumulator OLS inkremental. ``partial_fit`` boleh dipanggil berkali-kali;
+    ``solve`` bisa dipanggil kapan saja tanpa mengubah akumulator.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.n = 0
+        self.p = None
+        self.XtX = None
+        self.Xty = None
+        self.sum_y = 0.0
+        self.sum_y2 = 0.0
+        self.columns = None
+        self.target = None
+
+    def partial_fit(self, X, y):
+        """
+        Menambahkan satu potongan data. ``X`` berupa Matrix atau list baris,
+        ``y`` berupa Matrix kolom atau list 1D.
+        """
+        if not isinstance(X, Matrix):
+            X = Matrix(X)
+        y = list(y.buffer) if isinstance(y, Matrix) else [float(v) for v in y]
+        if len(y) != X.rows:
+            raise ValueError("Jumlah baris X dan y harus sama.")
+        if X.rows == 0:
+            return self
+        if self.p is None:
+            self.p = X.cols
+            self.XtX = Matrix.zeros(X.cols, X.cols)
+            self.Xty = Matrix.zeros(X.cols, 1)
+        elif X.cols != self.p:
+            raise ValueError(f"Jumlah kolom X harus {self.p} di setiap potongan.")
+
+        # Gram simetris potongan ini, dijumlahkan langsung ke akumulator (out=)
+        X_lazy = X.lazy()
+        y_matrix = Matrix.from_flat(y, len(y), 1)
+        add_matrices(self.XtX, (X_lazy.T @ X_lazy).evaluate(self.backend), out=self.XtX)
+        add_matrices(self.Xty, (X_lazy.T @ y_matrix.lazy()).evaluate(self.backend), out=self.Xty)
+        self.n += X.rows
+        self.sum_y += sum(y)
+        self.sum_y2 += sum(map(mul, y, y))
+        return self
+
+    def solve(self):
+        """
+        Menyelesaikan XᵀXβ = Xᵀy dengan Cholesky dan menghitung evaluasi
+        dari akumulator saja: SSE = Σy² − βᵀXᵀy, SST = Σy² − (Σy)²/n.
+        """
+        if not self.n:
+            raise ValueError("Belum ada data yang di-fit.")
+        p = self.p
+        L = self.XtX.properties().cholesky
+        try:
+            if L is None:
+                raise ValueError
+            beta = cholesky_solve(L, self.XtX, self.Xty)
+        except ValueError:
+            raise ValueError("XᵀX tidak definit positif (kolom X kolinear atau data terlalu sedikit).")
+
+        XtX_inv = cholesky_inverse(L, self.XtX)
+        sse = max(self.sum_y2 - sum(map(mul, beta.buffer, self.Xty.buffer)), 0.0)
+        sst = self.sum_y2 - self.sum_y * self.sum_y / self.n
+        df = self.n - p
+        sigma2 = sse / df if df > 0 else float("nan")
+        return {
+            "beta": beta,
+            "std_error": [sqrt(sigma2 * XtX_inv[j, j]) for j in range(p)],
+            "n": self.n,
+            "df": df,
+            "sigma2": sigma2,
+            "evaluation": {
+                "SSE": sse,
+                "MSE": sse / self.n,
+                "R2": 1 - sse / sst if sst else float("nan"),
+            },
+            "columns": self.columns,
+            "target": self.target,
+        }
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def fit_csv(cls, source, y_column=-1, chunk_size=DEFAULT_CHUNK_SIZE, backend=None):
+        """
+        Membaca CSV (path, file teks atau file biner) per ``chunk_size`` baris.
+        Baris pertama dianggap header hanya bila ada sel non-numerik.
+        Kolom numerik ditentukan dari baris data pertama (kolom teks seperti
+        nama provinsi dilewati); ``y_column`` adalah indeks di antara kolom
+        numerik tersebut (default kolom numerik terakhir), sisanya menjadi X.
+        Sel non-numerik atau baris pendek di baris berikutnya menghasilkan
+        ``ValueError`` dengan nomor barisnya.
+        """
+        if isinstance(source, str):
+            with open(source, newline="", encoding="utf-8") as f:
+                return cls.fit_csv(f, y_column, chunk_size, backend)
+        if isinstance(source.read(0), bytes):
+            source = io.TextIOWrapper(source, encoding="utf-8", newline="")
+
+        model = cls(backend)
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("File CSV kosong.")
+        first_row = 2
+        if header and all(map(_is_number, header)):
+            # Baris pertama numerik → bukan header (aturan sama dengan tokenizer.sniff)
+            reader, header, first_row = chain([header], reader), [], 1
+
+        numeric, x_idx, y_idx = None, None, None
+        X_chunk, y_chunk = [], []
+        for row_number, row in enumerate(reader, start=first_row):
+            if not row:
+                continue
+            if numeric is None:
+                numeric = [j for j, v in enumerate(row) if _is_number(v)]
+                if len(numeric) < 2:
+                    raise ValueError("CSV harus memiliki minimal dua kolom numerik.")
+                try:
+                    y_idx = numeric[y_column]
+                except IndexError:
+                    raise ValueError(f"y_column {y_column} di luar jangkauan {len(numeric)} kolom numerik.")
+                x_idx = [j for j in numeric if j != y_idx]
+                # Header pendek: kolom tanpa nama → X<j> (seperti CorrelationAccumulator.from_csv)
+                names = {j: header[j] if j < len(header) else f"X{j}" for j in numeric}
+                model.columns = [names[j] for j in x_idx]
+                model.target = names[y_idx]
+                width = numeric[-1] + 1
+
+            if len(row) < width:
+                raise ValueError(f"Baris {row_number} hanya memiliki {len(row)} kolom, dibutuhkan {width}.")
+            X_chunk.append([_to_float(row[j], row_number, names[j]) for j in x_idx])
+            y_chunk.append(_to_float(row[y_idx], row_number, names[y_idx]))
+            if len(X_chunk) >= chunk_size:
+                model.partial_fit(X_chunk, y_chunk)
+                X_chunk, y_chunk = [], []
+                report_progress(message=f"{model.n} baris")
+
+        if X_chunk:
+            model.partial_fit(X_chunk, y_chunk)
+        return model
@@ -17,7 +17,7 @@ def find_determinant(matrix):
         raise ValueError("Fungsi ini hanya mendukung matriks 2x2.")
 
     # Hitung determinan (ad - bc)
-    determinant = (matrix.data[0][0] * matrix.data[1][1]) - (matrix.data[0][1] * matrix.data[1][0])
+    determinant = (matrix[0, 0] * matrix[1, 1]) - (matrix[0, 1] * matrix[1, 0])
     return determinant
 
 def is_square(matrix):
@@ -26,19 +26,14 @@ def is_square(matrix):
     """
     return matrix.rows == matrix.cols
 
-def is_symmetric(matrix):
+def is_symmetric(matrix, rtol=0.0, atol=0.0):
     """
     Memeriksa apakah sebuah matriks adalah matriks simetris.
     Matriks simetris adalah matriks persegi yang sama dengan transposenya.
+    Default-nya perbandingan persis; ``rtol``/``atol`` > 0 mengizinkan
+    selisih pembulatan. Memakai flag yang di-memo oleh ``Matrix.properties()``.
     """
-    # Periksa apakah matriks adalah matriks persegi
-    if not is_square(matrix):
-        return False
-
-    # Periksa apakah elemen (i, j) sama dengan elemen (j, i)
-    for i in range(matrix.rows):
-        for j in range(matrix.cols):
-            if matrix.data[i][j] != matrix.data[j][i]:
-                return False
-
-    return True
+    if not matrix.is_numeric:
+        n = matrix.rows
+        return n == matrix.cols and all(matrix[i, j] == matrix[j, i] for i in range(n) for j in range(i))
+    return matrix.properties(rtol, atol).symmetric
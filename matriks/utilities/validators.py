@@ -1,25 +1,18 @@
 # matriks/utilities/validators.py
-from ..matrix import Matrix
-
 def is_square(matrix):
     """
     Memeriksa apakah sebuah matriks adalah matriks persegi.
     """
     return matrix.rows == matrix.cols
 
-def is_symmetric(matrix):
+def is_symmetric(matrix, rtol=0.0, atol=0.0):
     """
     Memeriksa apakah sebuah matriks adalah matriks simetris.
     Matriks simetris adalah matriks persegi yang sama dengan transposenya.
+    Default-nya perbandingan persis; ``rtol``/``atol`` > 0 mengizinkan
+    selisih pembulatan. Memakai flag yang di-memo oleh ``Matrix.properties()``.
     """
-    # Periksa apakah matriks adalah matriks persegi
-    if not is_square(matrix):
-        return False
-
-    # Periksa apakah elemen (i, j) sama dengan elemen (j, i)
-    for i in range(matrix.rows):
-        for j in range(matrix.cols):
-            if matrix.data[i][j] != matrix.data[j][i]:
-                return False
-
-    return True
+    if not matrix.is_numeric:
+        n = matrix.rows
+        return n == matrix.cols and all(matrix[i, j] == matrix[j, i] for i in range(n) for j in range(i))
+    return matrix.properties(rtol, atol).symmetric